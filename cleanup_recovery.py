@@ -2,14 +2,99 @@
 
 import os
 import json
+import re
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import time
+from typing import List
 
+from src.youtubesorter import serialization
 from src.youtubesorter.config import RECOVERY_DIR, STATE_DIR, CACHE_DIR
 from src.youtubesorter.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Upper bound on concurrent unlink calls
+MAX_DELETE_WORKERS = 16
+
+# RecoveryManager writes playlist_id as the first key, so it sits near the start of the file
+_PLAYLIST_ID_PATTERN = re.compile(r'"playlist_id"\s*:\s*"([^"\\]+)"')
+_HEAD_BYTES = 512
+
+
+def _read_playlist_id(path: str) -> str:
+    """Read the source playlist ID from a recovery file.
+
+    Only the head of the file is scanned; the full document is parsed as a
+    fallback when the ID is not found there.
+
+    Args:
+        path: Path to recovery file
+
+    Returns:
+        Source playlist ID
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+        KeyError: If the file has no playlist ID
+        IOError: If the file cannot be read
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        head = f.read(_HEAD_BYTES)
+        match = _PLAYLIST_ID_PATTERN.search(head)
+        if match:
+            return match.group(1)
+        data = serialization.loads(head + f.read())
+        return data["playlist_id"]
+
+
+def _sort_by_timestamp(filenames: List[str]) -> List[str]:
+    """Sort filenames by the timestamp suffix after their last underscore.
+
+    Args:
+        filenames: Filenames ending in ``_<timestamp>.json``
+
+    Returns:
+        Filenames ordered oldest to newest
+    """
+    decorated = [(name.rsplit("_", 1)[-1].partition(".")[0], name) for name in filenames]
+    decorated.sort()
+    return [name for _, name in decorated]
+
+
+def _safe_remove(path: str, kind: str) -> bool:
+    """Remove a file, logging the outcome instead of raising.
+
+    Args:
+        path: Path of file to remove
+        kind: Kind of file for log messages (recovery, state, cache)
+
+    Returns:
+        True if the file was removed, False otherwise
+    """
+    filename = os.path.basename(path)
+    try:
+        os.remove(path)
+        logger.info("Deleted old %s file: %s", kind, filename)
+        return True
+    except OSError as e:
+        logger.error("Error deleting file %s: %s", filename, str(e))
+        return False
+
+
+def _remove_files(paths: List[str], kind: str) -> None:
+    """Remove files concurrently.
+
+    Args:
+        paths: Paths of files to remove
+        kind: Kind of file for log messages (recovery, state, cache)
+    """
+    if not paths:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(MAX_DELETE_WORKERS, len(paths))) as executor:
+        list(executor.map(lambda path: _safe_remove(path, kind), paths))
+
 
 def cleanup_recovery_files(directory: str = RECOVERY_DIR) -> None:
     """Clean up recovery files, keeping latest for each source playlist.
@@ -25,14 +110,17 @@ def cleanup_recovery_files(directory: str = RECOVERY_DIR) -> None:
     playlist_files = defaultdict(list)
 
     # Find all recovery files
-    for filename in os.listdir(directory):
-        if filename.startswith("recovery_") and filename.endswith(".json"):
+    with os.scandir(directory) as it:
+        for entry in it:
+            filename = entry.name
+            if not (filename.startswith("recovery_") and filename.endswith(".json")):
+                continue
+            if not entry.is_file():
+                continue
             try:
                 # Read the file to get source playlist ID
-                with open(os.path.join(directory, filename), "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    source_id = data["playlist_id"]
-                    playlist_files[source_id].append(filename)
+                source_id = _read_playlist_id(entry.path)
+                playlist_files[source_id].append(filename)
             except (json.JSONDecodeError, KeyError, IOError) as e:
                 logger.warning("Skipping invalid file %s: %s", filename, str(e))
                 continue
@@ -41,17 +129,12 @@ def cleanup_recovery_files(directory: str = RECOVERY_DIR) -> None:
     files_to_delete = []
     for source_id, filenames in playlist_files.items():
         # Sort files by timestamp (which is part of the filename)
-        sorted_files = sorted(filenames, key=lambda x: x.split("_")[-1].split(".")[0])
+        sorted_files = _sort_by_timestamp(filenames)
         # Keep the latest, mark others for deletion
         files_to_delete.extend(sorted_files[:-1])
 
     # Delete old files
-    for filename in files_to_delete:
-        try:
-            os.remove(os.path.join(directory, filename))
-            logger.info("Deleted old recovery file: %s", filename)
-        except OSError as e:
-            logger.error("Error deleting file %s: %s", filename, str(e))
+    _remove_files([os.path.join(directory, filename) for filename in files_to_delete], "recovery")
 
 
 def cleanup_state_files(directory: str = STATE_DIR) -> None:
@@ -68,8 +151,13 @@ def cleanup_state_files(directory: str = STATE_DIR) -> None:
     operation_files = defaultdict(list)
 
     # Find all state files
-    for filename in os.listdir(directory):
-        if filename.startswith("youtubesorter_") and filename.endswith(".json"):
+    with os.scandir(directory) as it:
+        for entry in it:
+            filename = entry.name
+            if not (filename.startswith("youtubesorter_") and filename.endswith(".json")):
+                continue
+            if not entry.is_file():
+                continue
             try:
                 operation_type = filename.split("_")[1]  # Get operation type from filename
                 operation_files[operation_type].append(filename)
@@ -81,17 +169,12 @@ def cleanup_state_files(directory: str = STATE_DIR) -> None:
     files_to_delete = []
     for operation_type, filenames in operation_files.items():
         # Sort files by timestamp
-        sorted_files = sorted(filenames, key=lambda x: x.split("_")[-1].split(".")[0])
+        sorted_files = _sort_by_timestamp(filenames)
         # Keep the latest, mark others for deletion
         files_to_delete.extend(sorted_files[:-1])
 
     # Delete old files
-    for filename in files_to_delete:
-        try:
-            os.remove(os.path.join(directory, filename))
-            logger.info("Deleted old state file: %s", filename)
-        except OSError as e:
-            logger.error("Error deleting file %s: %s", filename, str(e))
+    _remove_files([os.path.join(directory, filename) for filename in files_to_delete], "state")
 
 
 def cleanup_cache_files(directory: str = CACHE_DIR) -> None:
@@ -104,19 +187,26 @@ def cleanup_cache_files(directory: str = CACHE_DIR) -> None:
         logger.info("Cache directory not found: %s", directory)
         return
 
-    # Find all cache files
-    for filename in os.listdir(directory):
-        if filename.endswith(".json"):
-            filepath = os.path.join(directory, filename)
+    # Find all expired cache files
+    expired = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            filename = entry.name
+            if not filename.endswith(".json"):
+                continue
             try:
-                # Check file age
-                age = os.path.getmtime(filepath)
+                if not entry.is_file():
+                    continue
+                # Check file age (stat info is cached on the directory entry)
+                age = entry.stat().st_mtime
                 if (time.time() - age) > (7 * 24 * 60 * 60):  # 7 days
-                    os.remove(filepath)
-                    logger.info("Deleted old cache file: %s", filename)
+                    expired.append(entry.path)
             except OSError as e:
                 logger.error("Error processing file %s: %s", filename, str(e))
 
+    # Delete expired files
+    _remove_files(expired, "cache")
+
 
 if __name__ == "__main__":
     cleanup_recovery_files()
@@ -1,4 +1,5 @@
 import pytest
+from src.youtubesorter import api, cache, recovery
 from src.youtubesorter.quota import check_quota
 
 
@@ -14,6 +15,21 @@ def pytest_addoption(parser):
     )
 
 
+@pytest.fixture(autouse=True)
+def isolate_data_dirs(tmp_path, monkeypatch):
+    """Keep default cache and recovery files out of the repository's data directory."""
+    monkeypatch.setattr(cache, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(recovery, "RECOVERY_DIR", str(tmp_path / "recovery"))
+
+
+@pytest.fixture(autouse=True)
+def reset_module_api():
+    """Start each test without the module-level YouTubeAPI of earlier tests."""
+    api._api.cache_clear()
+    yield
+    api._api.cache_clear()
+
+
 def pytest_collection_modifyitems(config, items):
     if not config.getoption("--run-api"):
         skip_api = pytest.mark.skip(reason="need --run-api option to run")
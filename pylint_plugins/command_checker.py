@@ -29,7 +29,8 @@ class CommandChecker(BaseChecker):
     def visit_classdef(self, node: nodes.ClassDef) -> None:
         """Visit class definitions."""
         # Only check classes in the commands package
-        if not node.root().file.endswith(".py") or "src/commands" not in node.root().file:
+        file = node.root().file
+        if not file or not file.endswith(".py") or "src/commands" not in file:
             return
 
         # Skip the YouTubeCommand class itself
@@ -51,8 +52,9 @@ class CommandChecker(BaseChecker):
             )
 
         # Check inheritance
-        bases = [base.as_string() for base in node.bases]
-        if "YouTubeCommand" not in " ".join(bases):
+        if not any(
+            base.as_string().rsplit(".", 1)[-1] == "YouTubeCommand" for base in node.bases
+        ):
             self.add_message(
                 "invalid-command-inheritance",
                 node=node,
@@ -14,6 +14,8 @@ setup(
         "google-api-python-client>=2.0.0",
         "google-auth-oauthlib>=0.4.0",
         "openai>=1.0.0",
+        "orjson>=3.6.0",
+        "tiktoken>=0.5.0",
         "tqdm>=4.0.0",
     ],
     entry_points={
@@ -1,3 +1,21 @@
 """Package initialization."""
 
-from youtubesorter import *  # noqa: F403
+import importlib
+from typing import Any
+
+import youtubesorter
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve youtubesorter components and submodules on first access."""
+    try:
+        return getattr(youtubesorter, name)
+    except AttributeError:
+        pass
+    module_name = f"youtubesorter.{name}"
+    try:
+        return importlib.import_module(module_name)
+    except ModuleNotFoundError as e:
+        if e.name != module_name:
+            raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from e
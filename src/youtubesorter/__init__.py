@@ -1,27 +1,9 @@
 """YouTube playlist management tool."""
 
-__version__ = "0.1.0"
+import importlib
+from typing import Any, List
 
-# Import all public components
-from .api import YouTubeAPI
-from .auth import get_youtube_service
-from .cache import PlaylistCache
-from .classifier import classify_video_titles
-from .cli import main
-from .commands import YouTubeCommand
-from .commands.filter import FilterCommand
-from .commands.move import MoveCommand
-from .commands.quota import QuotaCommand
-from .consolidate import consolidate_playlists
-from .core import YouTubeBase
-from .deduplicate import deduplicate_playlist
-from .distribute import distribute_videos
-from .errors import YouTubeError
-from .logging_config import configure_logging, get_logger
-from .quota import with_quota_check
-from .recovery import RecoveryManager
-from .undo import UndoManager
-from .utils import find_latest_state
+__version__ = "0.1.0"
 
 # Import config variables
 from .config import (  # noqa: F401
@@ -33,6 +15,60 @@ from .config import (  # noqa: F401
     OPENAI_MODEL,
     BATCH_SIZE,
 )
+from .logging_config import configure_logging, get_logger
+
+# Public components, imported from their modules on first access
+_LAZY = {
+    "YouTubeAPI": "api",
+    "get_youtube_service": "auth",
+    "PlaylistCache": "cache",
+    "classify_video_titles": "classifier",
+    "main": "cli",
+    "YouTubeCommand": "commands",
+    "FilterCommand": "commands.filter",
+    "MoveCommand": "commands.move",
+    "QuotaCommand": "commands.quota",
+    "consolidate_playlists": "consolidate",
+    "YouTubeBase": "core",
+    "deduplicate_playlist": "deduplicate",
+    "distribute_videos": "distribute",
+    "YouTubeError": "errors",
+    "with_quota_check": "quota",
+    "RecoveryManager": "recovery",
+    "UndoManager": "undo",
+    "find_latest_state": "utils",
+}
+
+__all__ = sorted(
+    [
+        *_LAZY,
+        "configure_logging",
+        "get_logger",
+        "YOUTUBE_SCOPES",
+        "CLIENT_SECRETS_FILE",
+        "CREDENTIALS_DIR",
+        "TOKEN_FILE",
+        "OPENAI_API_KEY",
+        "OPENAI_MODEL",
+        "BATCH_SIZE",
+    ]
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Import public components on first access (PEP 562)."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_LAZY[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes, including lazily imported components."""
+    return sorted(set(globals()) | set(_LAZY))
+
 
 # Configure logging
 configure_logging()
@@ -1,14 +1,206 @@
 """YouTube API wrapper."""
 
+import functools
 import logging
-from typing import Dict, List
-
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from . import quota
+from .cache import PlaylistCache
+from .config import API_REQUEST_INTERVAL, CACHE_DIR
 from .errors import PlaylistNotFoundError, YouTubeError
+from .paging import ThreadHttp, iter_pages, service_credentials
 from .auth import get_youtube_service
 
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of sub-requests accepted in one batch HTTP request
+BATCH_REQUEST_LIMIT = 50
+
+# Maximum number of batch HTTP requests in flight at once
+MAX_BATCH_WORKERS = 8
+
+# Times a sub-request failing with a server error is retried, and the
+# delay before the first retry (doubled for each further attempt)
+BATCH_RETRIES = 2
+BATCH_RETRY_DELAY = 1.0
+
+# Partial response selectors, limiting playlist item payloads to the fields we read.
+# The ETag lets cached video pages be revalidated with a conditional request.
+PLAYLIST_VIDEO_FIELDS = (
+    "etag,items(contentDetails/videoId,snippet/title,snippet/description),nextPageToken"
+)
+PLAYLIST_ITEM_ID_FIELDS = "items(id,contentDetails/videoId),nextPageToken"
+PLAYLIST_INFO_FIELDS = "items(snippet(title,description))"
+
+# Playlist video pages kept for conditional requests, keyed by playlist and page token.
+# Pages are kept for PAGE_CACHE_TTL seconds, and only the PAGE_CACHE_SIZE most
+# recently fetched pages are kept, since every flush rewrites the whole file.
+PAGE_CACHE_FILE = os.path.join(CACHE_DIR, "playlist_pages.json")
+PAGE_CACHE_SIZE = 2000
+PAGE_CACHE_TTL = 7 * 24 * 60 * 60
+
+_page_cache: Optional[PlaylistCache] = None
+
+# Playlist video listings each YouTubeAPI keeps in memory, so a playlist it
+# reads more than once is listed once. Entries expire after VIDEO_LIST_TTL
+# seconds and are dropped when a batch write through the same YouTubeAPI
+# changes the playlist.
+VIDEO_LIST_CACHE_SIZE = 64
+VIDEO_LIST_TTL = 300.0
+
+
+def _http_status(exception: Optional[Exception]) -> Optional[int]:
+    """Get the HTTP status of a failed request.
+
+    Args:
+        exception: Exception raised by the request, if any
+
+    Returns:
+        HTTP status code, or None if the exception is not an HTTP error
+    """
+    status = getattr(getattr(exception, "resp", None), "status", None)
+    try:
+        return int(status)
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_server_error(exception: Optional[Exception]) -> bool:
+    """Check whether a request failed with a retryable 5xx server error.
+
+    Args:
+        exception: Exception raised by the request, if any
+
+    Returns:
+        True if the exception is an HTTP error with a 5xx status
+    """
+    status = _http_status(exception)
+    return status is not None and status >= 500
+
+
+def _get_page_cache() -> PlaylistCache:
+    """Get the playlist page cache, creating it on first use.
+
+    Returns:
+        Cache of playlist video pages and their ETags
+    """
+    global _page_cache  # pylint: disable=global-statement
+    if _page_cache is None:
+        _page_cache = PlaylistCache(cache_file=PAGE_CACHE_FILE, max_entries=PAGE_CACHE_SIZE)
+    return _page_cache
+
+
+def _playlist_video(item: Dict[str, Any]) -> Dict[str, str]:
+    """Convert a playlist item listed with PLAYLIST_VIDEO_FIELDS to a video dictionary.
+
+    Args:
+        item: Playlist item resource
+
+    Returns:
+        Video dictionary with video_id, title and description
+    """
+    return {
+        "video_id": item["contentDetails"]["videoId"],
+        "title": item["snippet"]["title"],
+        "description": item["snippet"]["description"],
+    }
+
+
+class _VideoListCache:
+    """Playlist video listings, least recently used first."""
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        # Listings keyed by playlist ID, with the time they were fetched
+        self._lists: "OrderedDict[str, Tuple[float, List[Dict[str, str]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, playlist_id: str) -> Optional[List[Dict[str, str]]]:
+        """Get a playlist video listing.
+
+        Args:
+            playlist_id: ID of the listed playlist
+
+        Returns:
+            Copy of the cached listing, or None if absent or expired
+        """
+        with self._lock:
+            entry = self._lists.get(playlist_id)
+            if entry is None:
+                return None
+            fetched_at, videos = entry
+            if time.monotonic() - fetched_at > VIDEO_LIST_TTL:
+                del self._lists[playlist_id]
+                return None
+            self._lists.move_to_end(playlist_id)
+            return list(videos)
+
+    def set(self, playlist_id: str, videos: List[Dict[str, str]]) -> None:
+        """Store a playlist video listing, evicting the least recently used one if full.
+
+        Args:
+            playlist_id: ID of the listed playlist
+            videos: Videos in the playlist
+        """
+        with self._lock:
+            self._lists[playlist_id] = (time.monotonic(), list(videos))
+            self._lists.move_to_end(playlist_id)
+            while len(self._lists) > VIDEO_LIST_CACHE_SIZE:
+                self._lists.popitem(last=False)
+
+    def invalidate(self, playlist_id: str) -> None:
+        """Drop the listing of a playlist.
+
+        Args:
+            playlist_id: ID of the changed playlist
+        """
+        with self._lock:
+            self._lists.pop(playlist_id, None)
+
+    def clear(self) -> None:
+        """Drop all listings."""
+        with self._lock:
+            self._lists.clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _service():
+    """Get the YouTube service, building it once per process.
+
+    Failures are raised rather than returned, so they are not cached.
+
+    Returns:
+        Authenticated YouTube service object
+
+    Raises:
+        YouTubeError: If the service cannot be created
+    """
+    youtube = get_youtube_service()
+    if not youtube:
+        raise YouTubeError("Failed to get YouTube service")
+    return youtube
+
+
+@functools.lru_cache(maxsize=1)
+def _api() -> "YouTubeAPI":
+    """Get the YouTubeAPI used by the module-level functions.
+
+    Sharing one instance lets those functions reuse its listing cache.
+
+    Returns:
+        YouTubeAPI for the process's YouTube service
+
+    Raises:
+        YouTubeError: If the service cannot be created
+    """
+    return YouTubeAPI(_service(), page_cache=_get_page_cache())
+
 
 def get_playlist_videos(playlist_id: str, use_cache: bool = True) -> List[Dict[str, str]]:
     """Get all videos in a playlist.
@@ -24,12 +216,7 @@ def get_playlist_videos(playlist_id: str, use_cache: bool = True) -> List[Dict[s
         PlaylistNotFoundError: If playlist is not found
         YouTubeError: If API request fails
     """
-    youtube = get_youtube_service()
-    if not youtube:
-        raise YouTubeError("Failed to get YouTube service")
-
-    api = YouTubeAPI(youtube)
-    return api.get_playlist_videos(playlist_id, use_cache)
+    return _api().get_playlist_videos(playlist_id, use_cache)
 
 
 def batch_move_videos_to_playlist(
@@ -53,12 +240,7 @@ def batch_move_videos_to_playlist(
         PlaylistNotFoundError: If either playlist is not found
         YouTubeError: If API request fails
     """
-    youtube = get_youtube_service()
-    if not youtube:
-        raise YouTubeError("Failed to get YouTube service")
-
-    api = YouTubeAPI(youtube)
-    return api.batch_move_videos_to_playlist(
+    return _api().batch_move_videos_to_playlist(
         source_playlist,
         target_playlist,
         video_ids,
@@ -79,86 +261,185 @@ def get_playlist_info(playlist_id: str) -> Dict[str, str]:
         PlaylistNotFoundError: If playlist is not found
         YouTubeError: If API request fails
     """
-    youtube = get_youtube_service()
-    if not youtube:
-        raise YouTubeError("Failed to get YouTube service")
-
-    api = YouTubeAPI(youtube)
-    return api.get_playlist_info(playlist_id)
+    return _api().get_playlist_info(playlist_id)
 
 
 class YouTubeAPI:
     """Wrapper for YouTube API operations."""
 
-    def __init__(self, youtube):
+    def __init__(self, youtube, page_cache: Optional[PlaylistCache] = None):
         """Initialize API wrapper.
 
         Args:
             youtube: YouTube API client
+            page_cache: Cache of playlist video pages. When set, pages listed
+                before are requested with If-None-Match and reused from the
+                cache if YouTube reports them unchanged.
         """
         self.youtube = youtube
+        self.page_cache = page_cache
+        self._thread_clients = ThreadHttp()
+        self._pace_lock = threading.Lock()
+        self._next_request_at = 0.0
+        self._video_lists = _VideoListCache()
 
     def get_playlist_videos(self, playlist_id: str, use_cache: bool = True) -> List[Dict[str, str]]:
         """Get all videos in a playlist.
 
+        A listing fetched earlier by this instance is reused until it expires
+        or the playlist is changed through batch_add_videos_to_playlist or
+        batch_remove_videos_from_playlist.
+
         Args:
             playlist_id: ID of playlist to get videos from
-            use_cache: Whether to use cached results
+            use_cache: Whether to reuse cached listings and revalidate pages
+                held in the page cache
 
         Returns:
             List of video dictionaries with video_id, title and description
 
+        Raises:
+            PlaylistNotFoundError: If playlist is not found
+            YouTubeError: If API request fails
+        """
+        if use_cache:
+            videos = self._video_lists.get(playlist_id)
+            if videos is not None:
+                return videos
+        videos = list(self.iter_playlist_videos(playlist_id, use_cache))
+        if use_cache:
+            self._video_lists.set(playlist_id, videos)
+        return videos
+
+    def invalidate_video_list(self, playlist_id: str) -> None:
+        """Drop the cached video listing of a playlist.
+
+        Args:
+            playlist_id: ID of the changed playlist
+        """
+        self._video_lists.invalidate(playlist_id)
+
+    def clear_video_list_cache(self) -> None:
+        """Drop all cached playlist video listings."""
+        self._video_lists.clear()
+
+    def iter_playlist_videos(
+        self, playlist_id: str, use_cache: bool = True
+    ) -> Iterator[Dict[str, str]]:
+        """Iterate over the videos in a playlist, one page at a time.
+
+        Lets callers process large playlists without holding every video
+        in memory at once.
+
+        Args:
+            playlist_id: ID of playlist to get videos from
+            use_cache: Whether to revalidate pages held in the page cache
+
+        Yields:
+            Video dictionaries with video_id, title and description
+
         Raises:
             PlaylistNotFoundError: If playlist is not found
             YouTubeError: If API request fails
         """
         try:
-            videos = []
-            page_token = None
-
-            while True:
-                # Get playlist items
-                request = self.youtube.playlistItems().list(
-                    part="snippet,contentDetails",
-                    playlistId=playlist_id,
-                    maxResults=50,
-                    pageToken=page_token,
+            for response in self._iter_playlist_pages(
+                playlist_id,
+                part="snippet,contentDetails",
+                fields=PLAYLIST_VIDEO_FIELDS,
+                error_message="Failed to get playlist videos",
+                page_cache=self.page_cache if use_cache else None,
+            ):
+                yield from map(_playlist_video, response.get("items", ()))
+
+        except PlaylistNotFoundError:
+            raise
+        except Exception as e:
+            raise YouTubeError(f"Failed to get playlist videos: {str(e)}") from e
+
+    def get_playlists_videos(
+        self, playlist_ids: List[str], use_cache: bool = True
+    ) -> Dict[str, List[Dict[str, str]]]:
+        """Get the videos of several playlists at once.
+
+        The playlists are paged through together: each round sends the next
+        page of every unfinished playlist in one batch HTTP request, so the
+        number of round trips is set by the longest playlist rather than the
+        total page count. Listings are cached as by get_playlist_videos.
+
+        Args:
+            playlist_ids: IDs of playlists to get videos from
+            use_cache: Whether to reuse cached listings and revalidate pages
+                held in the page cache
+
+        Returns:
+            Dictionary mapping each playlist ID to its list of video dictionaries
+
+        Raises:
+            PlaylistNotFoundError: If a playlist is not found
+            YouTubeError: If API request fails
+        """
+        videos: Dict[str, List[Dict[str, str]]] = {}
+        page_tokens: Dict[str, Optional[str]] = {}
+        for playlist_id in dict.fromkeys(playlist_ids):
+            cached = self._video_lists.get(playlist_id) if use_cache else None
+            if cached is not None:
+                videos[playlist_id] = cached
+            else:
+                videos[playlist_id] = []
+                page_tokens[playlist_id] = None
+        fetched = list(page_tokens)
+
+        page_cache = self.page_cache if use_cache else None
+        try:
+            while page_tokens:
+                pages = {
+                    playlist_id: self._page_request(
+                        playlist_id,
+                        "snippet,contentDetails",
+                        PLAYLIST_VIDEO_FIELDS,
+                        page_token,
+                        page_cache,
+                    )
+                    for playlist_id, page_token in page_tokens.items()
+                }
+                results = self._execute_batch(
+                    [(playlist_id, page[0]) for playlist_id, page in pages.items()]
                 )
 
-                try:
-                    response = request.execute()
-                except Exception as e:
-                    if "playlistNotFound" in str(e):
-                        raise PlaylistNotFoundError(f"Playlist {playlist_id} not found") from e
-                    raise YouTubeError(f"Failed to get playlist videos: {str(e)}") from e
-
-                # Extract video info
-                for item in response.get("items", []):
-                    video = {
-                        "video_id": item["contentDetails"]["videoId"],
-                        "title": item["snippet"]["title"],
-                        "description": item["snippet"]["description"],
-                    }
-                    videos.append(video)
-
-                # Get next page token
-                page_token = response.get("nextPageToken")
-                if not page_token:
-                    break
-
-            return videos
+                page_tokens = {}
+                for playlist_id, (_, key, cached) in pages.items():
+                    response, error = results[playlist_id]
+                    response = self._page_result(
+                        playlist_id,
+                        response,
+                        error,
+                        key,
+                        cached,
+                        page_cache,
+                        "Failed to get playlist videos",
+                    )
+                    videos[playlist_id].extend(map(_playlist_video, response.get("items", ())))
+                    if response.get("nextPageToken"):
+                        page_tokens[playlist_id] = response["nextPageToken"]
 
         except PlaylistNotFoundError:
             raise
         except Exception as e:
             raise YouTubeError(f"Failed to get playlist videos: {str(e)}") from e
 
+        if use_cache:
+            for playlist_id in fetched:
+                self._video_lists.set(playlist_id, videos[playlist_id])
+        return videos
+
     def batch_move_videos_to_playlist(
         self,
         source_playlist: str,
         target_playlist: str,
         video_ids: List[str],
         remove_from_source: bool = True,
+        source_item_ids: Optional[Dict[str, str]] = None,
     ) -> List[str]:
         """Move multiple videos between playlists.
 
@@ -167,6 +448,8 @@ class YouTubeAPI:
             target_playlist: ID of target playlist
             video_ids: List of video IDs to move
             remove_from_source: Whether to remove videos from source playlist
+            source_item_ids: Known playlist item IDs in the source playlist,
+                keyed by video ID, passed on to batch_remove_videos_from_playlist
 
         Returns:
             List of successfully moved video IDs
@@ -180,18 +463,28 @@ class YouTubeAPI:
 
         # If successful and remove_from_source is True, remove from source
         if added and remove_from_source:
-            removed = self.batch_remove_videos_from_playlist(source_playlist, video_ids)
+            removed = self.batch_remove_videos_from_playlist(
+                source_playlist, video_ids, item_ids=source_item_ids
+            )
             # Only return videos that were both added and removed
-            return [vid for vid in added if vid in removed]
+            removed_set = set(removed)
+            return [vid for vid in added if vid in removed_set]
 
         return added
 
-    def batch_add_videos_to_playlist(self, playlist_id: str, video_ids: List[str]) -> List[str]:
+    def batch_add_videos_to_playlist(
+        self,
+        playlist_id: str,
+        video_ids: List[str],
+        item_ids: Optional[Dict[str, str]] = None,
+    ) -> List[str]:
         """Add multiple videos to a playlist.
 
         Args:
             playlist_id: ID of playlist to add to
             video_ids: List of video IDs to add
+            item_ids: Optional dict to fill with the new playlist item ID of
+                each added video, keyed by video ID
 
         Returns:
             List of successfully added video IDs
@@ -200,11 +493,10 @@ class YouTubeAPI:
             PlaylistNotFoundError: If playlist is not found
             YouTubeError: If API request fails
         """
-        successful = []
-
-        for video_id in video_ids:
-            try:
-                request = self.youtube.playlistItems().insert(
+        requests = [
+            (
+                str(i),
+                self.youtube.playlistItems().insert(
                     part="snippet",
                     body={
                         "snippet": {
@@ -212,24 +504,46 @@ class YouTubeAPI:
                             "resourceId": {"kind": "youtube#video", "videoId": video_id},
                         }
                     },
-                )
-                request.execute()
+                ),
+            )
+            for i, video_id in enumerate(video_ids)
+        ]
+        try:
+            results = self._execute_batch(requests)
+        finally:
+            self.invalidate_video_list(playlist_id)
+
+        successful = []
+        for i, video_id in enumerate(video_ids):
+            response, error = results[str(i)]
+            if error is None:
                 successful.append(video_id)
-            except Exception as e:
-                if "playlistNotFound" in str(e):
-                    raise PlaylistNotFoundError(f"Playlist {playlist_id} not found") from e
-                logger.error(f"Failed to add video {video_id}: {str(e)}")
+                if item_ids is not None and response and "id" in response:
+                    item_ids[video_id] = response["id"]
+                continue
+            if "playlistNotFound" in str(error):
+                raise PlaylistNotFoundError(f"Playlist {playlist_id} not found") from error
+            logger.error(f"Failed to add video {video_id}: {str(error)}")
 
         return successful
 
     def batch_remove_videos_from_playlist(
-        self, playlist_id: str, video_ids: List[str]
+        self,
+        playlist_id: str,
+        video_ids: List[str],
+        item_ids: Optional[Dict[str, str]] = None,
     ) -> List[str]:
         """Remove multiple videos from a playlist.
 
+        Playlist items are deleted by item ID. IDs missing from item_ids are
+        looked up by listing the playlist; when item_ids covers every video
+        the listing is skipped.
+
         Args:
             playlist_id: ID of playlist to remove from
             video_ids: List of video IDs to remove
+            item_ids: Known playlist item IDs in this playlist, keyed by video ID,
+                e.g. as filled in by batch_add_videos_to_playlist
 
         Returns:
             List of successfully removed video IDs
@@ -239,45 +553,45 @@ class YouTubeAPI:
             YouTubeError: If API request fails
         """
         try:
-            # Get playlist items to find item IDs
-            item_map = {}  # Map video IDs to item IDs
-            page_token = None
+            # Map video IDs to item IDs
+            item_map = {
+                video_id: item_ids[video_id]
+                for video_id in video_ids
+                if item_ids and video_id in item_ids
+            }
+            wanted = set(video_ids).difference(item_map)
 
-            while True:
-                request = self.youtube.playlistItems().list(
+            # Get playlist items to find the remaining item IDs
+            if wanted:
+                for response in self._iter_playlist_pages(
+                    playlist_id,
                     part="id,contentDetails",
-                    playlistId=playlist_id,
-                    maxResults=50,
-                    pageToken=page_token,
-                )
-                try:
-                    response = request.execute()
-                except Exception as e:
-                    if "playlistNotFound" in str(e):
-                        raise PlaylistNotFoundError(f"Playlist {playlist_id} not found") from e
-                    raise YouTubeError(f"Failed to list playlist items: {str(e)}") from e
-
-                # Map video IDs to item IDs
-                for item in response.get("items", []):
-                    video_id = item["contentDetails"]["videoId"]
-                    if video_id in video_ids:
-                        item_map[video_id] = item["id"]
-
-                # Get next page token
-                page_token = response.get("nextPageToken")
-                if not page_token:
-                    break
+                    fields=PLAYLIST_ITEM_ID_FIELDS,
+                    error_message="Failed to list playlist items",
+                ):
+                    for item in response.get("items", []):
+                        video_id = item["contentDetails"]["videoId"]
+                        if video_id in wanted:
+                            item_map[video_id] = item["id"]
 
             # Remove videos using item IDs
+            to_remove = [video_id for video_id in video_ids if video_id in item_map]
+            requests = [
+                (str(i), self.youtube.playlistItems().delete(id=item_map[video_id]))
+                for i, video_id in enumerate(to_remove)
+            ]
+            try:
+                results = self._execute_batch(requests, retry_server_errors=True)
+            finally:
+                self.invalidate_video_list(playlist_id)
+
             successful = []
-            for video_id in video_ids:
-                if video_id in item_map:
-                    try:
-                        request = self.youtube.playlistItems().delete(id=item_map[video_id])
-                        request.execute()
-                        successful.append(video_id)
-                    except Exception as e:
-                        logger.error(f"Failed to remove video {video_id}: {str(e)}")
+            for i, video_id in enumerate(to_remove):
+                _, error = results[str(i)]
+                if error is None:
+                    successful.append(video_id)
+                else:
+                    logger.error(f"Failed to remove video {video_id}: {str(error)}")
 
             return successful
 
@@ -286,6 +600,291 @@ class YouTubeAPI:
         except Exception as e:
             raise YouTubeError(f"Failed to remove playlist items: {str(e)}") from e
 
+    def iter_playlist_items(self, playlist_id: str) -> Iterator[Tuple[str, str]]:
+        """Iterate over the items of a playlist in playlist order.
+
+        Unlike batch_remove_videos_from_playlist's lookup, a video listed more
+        than once yields each of its playlist items.
+
+        Args:
+            playlist_id: ID of playlist to list
+
+        Yields:
+            (video ID, playlist item ID) pairs
+
+        Raises:
+            PlaylistNotFoundError: If playlist is not found
+            YouTubeError: If API request fails
+        """
+        for response in self._iter_playlist_pages(
+            playlist_id,
+            part="id,contentDetails",
+            fields=PLAYLIST_ITEM_ID_FIELDS,
+            error_message="Failed to list playlist items",
+        ):
+            for item in response.get("items", []):
+                yield item["contentDetails"]["videoId"], item["id"]
+
+    def batch_delete_playlist_items(self, playlist_id: str, item_ids: List[str]) -> List[str]:
+        """Delete playlist items by item ID.
+
+        Args:
+            playlist_id: ID of the playlist holding the items
+            item_ids: IDs of playlist items to delete
+
+        Returns:
+            List of successfully deleted item IDs
+        """
+        requests = [
+            (str(i), self.youtube.playlistItems().delete(id=item_id))
+            for i, item_id in enumerate(item_ids)
+        ]
+        try:
+            results = self._execute_batch(requests, retry_server_errors=True)
+        finally:
+            self.invalidate_video_list(playlist_id)
+
+        deleted = []
+        for i, item_id in enumerate(item_ids):
+            _, error = results[str(i)]
+            if error is None:
+                deleted.append(item_id)
+            else:
+                logger.error("Failed to delete playlist item %s: %s", item_id, str(error))
+        return deleted
+
+    def _iter_playlist_pages(
+        self,
+        playlist_id: str,
+        part: str,
+        fields: str,
+        error_message: str,
+        page_cache: Optional[PlaylistCache] = None,
+    ) -> Iterator[Dict]:
+        """Iterate over playlistItems.list response pages.
+
+        While the caller processes a page, the next one is fetched on a
+        background thread. Pages are requested one at a time, since each
+        page token comes from the previous response. Closing the iterator
+        early cancels the prefetch, or waits for it if already sent, so no
+        request outlives the iteration.
+
+        Args:
+            playlist_id: ID of playlist to list
+            part: Resource parts to request
+            fields: Partial response selector
+            error_message: Prefix for errors raised on failed requests
+            page_cache: Cache of earlier responses. A cached page is sent with
+                If-None-Match and returned again when YouTube answers 304.
+
+        Yields:
+            Raw response pages
+
+        Raises:
+            PlaylistNotFoundError: If playlist is not found
+            YouTubeError: If API request fails
+        """
+        credentials = service_credentials(self.youtube)
+
+        def _fetch(page_token: Optional[str]) -> Dict:
+            request, key, cached = self._page_request(
+                playlist_id, part, fields, page_token, page_cache
+            )
+            # Send through this thread's own client, not the service's shared one
+            http = self._thread_clients.get(credentials) if credentials is not None else None
+            try:
+                response, error = request.execute(http=http), None
+            except Exception as e:
+                response, error = None, e
+            return self._page_result(
+                playlist_id, response, error, key, cached, page_cache, error_message
+            )
+
+        # Without credentials there is no client to give a prefetch thread
+        return iter_pages(_fetch, prefetch=credentials is not None)
+
+    def _page_request(
+        self,
+        playlist_id: str,
+        part: str,
+        fields: str,
+        page_token: Optional[str],
+        page_cache: Optional[PlaylistCache],
+    ) -> Tuple[Any, Optional[str], Optional[Dict]]:
+        """Build a playlistItems.list request for one page.
+
+        Args:
+            playlist_id: ID of playlist to list
+            part: Resource parts to request
+            fields: Partial response selector
+            page_token: Token of the page to request, None for the first page
+            page_cache: Cache of earlier responses, if any
+
+        Returns:
+            Tuple of (request, page cache key, cached response). The request
+            carries If-None-Match when a cached response with an ETag exists.
+        """
+        request = self.youtube.playlistItems().list(
+            part=part,
+            playlistId=playlist_id,
+            maxResults=50,
+            pageToken=page_token,
+            fields=fields,
+        )
+        key = cached = None
+        if page_cache is not None:
+            key = f"{playlist_id}:{part}:{fields}:{page_token or ''}"
+            cached = page_cache.get(key)
+            if cached and cached.get("etag"):
+                request.headers["If-None-Match"] = cached["etag"]
+        return request, key, cached
+
+    def _page_result(
+        self,
+        playlist_id: str,
+        response: Optional[Dict],
+        error: Optional[Exception],
+        key: Optional[str],
+        cached: Optional[Dict],
+        page_cache: Optional[PlaylistCache],
+        error_message: str,
+    ) -> Dict:
+        """Resolve the outcome of a request built by _page_request.
+
+        Args:
+            playlist_id: ID of the listed playlist
+            response: Response to the request, if it succeeded
+            error: Exception raised by the request, if it failed
+            key: Page cache key returned by _page_request
+            cached: Cached response returned by _page_request
+            page_cache: Cache of earlier responses, if any
+            error_message: Prefix for errors raised on failed requests
+
+        Returns:
+            The response page, or the cached page if YouTube answered 304
+
+        Raises:
+            PlaylistNotFoundError: If playlist is not found
+            YouTubeError: If the request failed
+        """
+        if error is not None:
+            if cached and _http_status(error) == 304:
+                return cached
+            if "playlistNotFound" in str(error):
+                raise PlaylistNotFoundError(f"Playlist {playlist_id} not found") from error
+            raise YouTubeError(f"{error_message}: {str(error)}") from error
+        if key is not None and response.get("etag"):
+            page_cache.set(key, response, ttl=PAGE_CACHE_TTL)
+        return response
+
+    def _execute_batch(
+        self, requests: List[Tuple[str, Any]], retry_server_errors: bool = False
+    ) -> Dict[str, Tuple[Any, Optional[Exception]]]:
+        """Execute API requests as batch HTTP requests.
+
+        Requests are sent in chunks of BATCH_REQUEST_LIMIT, one round trip per
+        chunk, with up to MAX_BATCH_WORKERS chunks in flight at once. Chunks
+        start at least API_REQUEST_INTERVAL seconds apart.
+        With retry_server_errors, sub-requests that fail with a 5xx server
+        error are sent again, up to BATCH_RETRIES times. Only idempotent
+        requests may be retried: a server error does not mean an insert was
+        not applied, so sending it again could add a video twice.
+
+        Args:
+            requests: List of (request ID, API request) pairs
+            retry_server_errors: Whether to resend requests failing with a 5xx
+
+        Returns:
+            Dictionary mapping each request ID to a (response, exception) pair
+        """
+        results: Dict[str, Tuple[Any, Optional[Exception]]] = {}
+
+        def _collect(request_id: str, response: Any, exception: Optional[Exception]) -> None:
+            results[request_id] = (response, exception)
+
+        def _execute_chunk(chunk: List[Tuple[str, Any]], http: Any = None) -> None:
+            self._pace()
+            batch = self.youtube.new_batch_http_request(callback=_collect)
+            for request_id, request in chunk:
+                batch.add(request, request_id=request_id)
+            try:
+                batch.execute(http=http)
+            except Exception as e:
+                for request_id, _ in chunk:
+                    results.setdefault(request_id, (None, e))
+
+        def _execute_all(requests: List[Tuple[str, Any]]) -> None:
+            chunks = [
+                requests[i : i + BATCH_REQUEST_LIMIT]
+                for i in range(0, len(requests), BATCH_REQUEST_LIMIT)
+            ]
+            credentials = service_credentials(self.youtube)
+
+            if len(chunks) <= 1 or credentials is None:
+                # Nothing to overlap, or no credentials to build per-thread clients from
+                for chunk in chunks:
+                    _execute_chunk(chunk)
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(MAX_BATCH_WORKERS, len(chunks))
+                ) as executor:
+                    list(
+                        executor.map(
+                            lambda chunk: _execute_chunk(
+                                chunk, self._thread_clients.get(credentials)
+                            ),
+                            chunks,
+                        )
+                    )
+
+        _execute_all(requests)
+        for attempt in range(BATCH_RETRIES if retry_server_errors else 0):
+            retry = [
+                (request_id, request)
+                for request_id, request in requests
+                if _is_server_error(results[request_id][1])
+            ]
+            if not retry:
+                break
+            logger.warning("Retrying %d batch requests after server errors", len(retry))
+            time.sleep(BATCH_RETRY_DELAY * 2**attempt)
+            for request_id, _ in retry:
+                del results[request_id]
+            _execute_all(retry)
+
+        return results
+
+    def _pace(self) -> None:
+        """Wait until the next batch HTTP request may start.
+
+        Spacing requests API_REQUEST_INTERVAL seconds apart avoids the rate
+        limit errors, and the retries they cause, of sending them in bursts.
+        """
+        if API_REQUEST_INTERVAL <= 0:
+            return
+        with self._pace_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_at)
+            self._next_request_at = start + API_REQUEST_INTERVAL
+        if start > now:
+            time.sleep(start - now)
+
+    def get_quota_info(self) -> Dict[str, int]:
+        """Get API quota usage.
+
+        Returns:
+            Dictionary with quota_used, quota_remaining and quota_limit
+
+        Raises:
+            YouTubeError: If quota information cannot be retrieved
+        """
+        used, remaining = quota.check_quota()
+        return {
+            "quota_used": used,
+            "quota_remaining": remaining,
+            "quota_limit": used + remaining,
+        }
+
     def get_playlist_info(self, playlist_id: str) -> Dict[str, str]:
         """Get playlist information.
 
@@ -303,6 +902,7 @@ class YouTubeAPI:
             request = self.youtube.playlists().list(
                 part="snippet",
                 id=playlist_id,
+                fields=PLAYLIST_INFO_FIELDS,
             )
             response = request.execute()
 
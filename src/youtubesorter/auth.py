@@ -1,13 +1,40 @@
 """YouTube API authentication handling."""
 
 import os
-import pickle
 from typing import Optional
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 
-from . import config
+from . import config, serialization
+
+
+def _migrate_legacy_token() -> None:
+    """Convert a pickled token saved by earlier versions to the JSON token file.
+
+    The pickle is removed once converted, so this only runs once. If it cannot
+    be converted, the user is told why they have to sign in again.
+    """
+    if os.path.exists(config.TOKEN_FILE) or not os.path.exists(config.LEGACY_TOKEN_FILE):
+        return
+
+    import pickle  # pylint: disable=import-outside-toplevel
+
+    try:
+        with open(config.LEGACY_TOKEN_FILE, "rb") as token:
+            creds = pickle.load(token)
+        with open(config.TOKEN_FILE, "w", encoding="utf-8") as token:
+            token.write(creds.to_json())
+    except Exception as e:
+        print(
+            f"Could not convert saved credentials in {config.LEGACY_TOKEN_FILE} "
+            f"to {config.TOKEN_FILE}, so you need to sign in again: {str(e)}"
+        )
+        return
+
+    os.remove(config.LEGACY_TOKEN_FILE)
+    print(f"Converted saved credentials to {config.TOKEN_FILE}")
 
 
 def get_youtube_service() -> Optional[object]:
@@ -22,10 +49,17 @@ def get_youtube_service() -> Optional[object]:
 
     creds = None
 
+    _migrate_legacy_token()
+
     # Load existing credentials if available
     if os.path.exists(config.TOKEN_FILE):
-        with open(config.TOKEN_FILE, "rb") as token:
-            creds = pickle.load(token)
+        with open(config.TOKEN_FILE, "r", encoding="utf-8") as token:
+            try:
+                creds = Credentials.from_authorized_user_info(
+                    serialization.loads(token.read()), config.YOUTUBE_SCOPES
+                )
+            except ValueError as e:
+                print(f"Ignoring invalid saved credentials: {str(e)}")
 
     # If there are no (valid) credentials available, let the user log in
     if not creds or not creds.valid:
@@ -43,8 +77,8 @@ def get_youtube_service() -> Optional[object]:
 
         # Save the credentials for the next run
         os.makedirs(os.path.dirname(config.TOKEN_FILE), exist_ok=True)
-        with open(config.TOKEN_FILE, "wb") as token:
-            pickle.dump(creds, token)
+        with open(config.TOKEN_FILE, "w", encoding="utf-8") as token:
+            token.write(creds.to_json())
 
     try:
         # Build the YouTube service
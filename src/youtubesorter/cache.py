@@ -1,15 +1,35 @@
 """Cache module for storing playlist information."""
 
-import json
+import atexit
 import os
-from datetime import datetime, timedelta
+import threading
+import time
+import weakref
+from datetime import datetime
 from typing import Dict, Optional
 
+from . import serialization
 from .config import CACHE_DIR
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Seconds to wait after a change before writing the cache file
+FLUSH_INTERVAL = 30.0
+
+# Expiry timestamp used for entries without a TTL
+NO_EXPIRY = float("inf")
+
+# Caches with changes to write at exit, held weakly so unused caches can be freed
+_open_caches: "weakref.WeakSet[PlaylistCache]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all() -> None:
+    """Write pending changes of every live cache."""
+    for cache in list(_open_caches):
+        cache.flush()
+
 
 class CacheStats:
     """Statistics for cache operations."""
@@ -30,58 +50,120 @@ class CacheStats:
 class PlaylistCache:
     """Cache for playlist information."""
 
-    def __init__(self, cache_file: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        cache_file: Optional[str] = None,
+        flush_interval: Optional[float] = FLUSH_INTERVAL,
+        max_entries: Optional[int] = None,
+    ) -> None:
         """Initialize playlist cache.
 
+        The cache file is read on first access rather than here. Changes are
+        kept in memory and written to the cache file by flush(), which runs
+        flush_interval seconds after the first unsaved change and at exit.
+
         Args:
             cache_file: Path to cache file. If None, uses default in cache directory.
+            flush_interval: Seconds before pending changes are written. If None,
+                changes are only written by explicit flush() calls and at exit.
+            max_entries: Maximum number of entries kept. When exceeded, the
+                entries set longest ago are dropped first. If None, unlimited.
         """
         if cache_file is None:
             os.makedirs(CACHE_DIR, exist_ok=True)
             cache_file = os.path.join(CACHE_DIR, "playlist_cache.json")
         self.cache_file = cache_file
-        self.cache: Dict = {}
+        self._cache: Optional[Dict] = None
         self.stats = CacheStats()
-
-        # Load cache from file if it exists
-        if os.path.exists(cache_file):
-            self._load_cache()
+        self.flush_interval = flush_interval
+        self.max_entries = max_entries
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        _open_caches.add(self)
+
+    @property
+    def cache(self) -> Dict:
+        """Cache entries, loaded from the cache file on first access."""
+        if self._cache is None:
+            self._cache = {}
+            if os.path.exists(self.cache_file):
+                self._load_cache()
+        return self._cache
+
+    @cache.setter
+    def cache(self, value: Dict) -> None:
+        self._cache = value
 
     def _load_cache(self) -> None:
         """Load cache from file."""
         try:
             with open(self.cache_file, "r", encoding="utf-8") as f:
-                self.cache = json.load(f)
+                cache = serialization.loads(f.read())
+            # Convert entries written with ISO format expiry strings
+            for entry in cache.values():
+                if "expiry" in entry:
+                    entry["expiry_ts"] = datetime.fromisoformat(entry.pop("expiry")).timestamp()
+            self.cache = cache
         except Exception as e:
             logger.error("Error loading cache: %s", str(e))
             self.cache = {}
 
     def _save_cache(self) -> None:
-        """Save cache to file."""
+        """Save cache to file.
+
+        The cache is written to a temporary file which then replaces the
+        cache file, so readers never see a partially written cache.
+        """
+        tmp_file = self.cache_file + ".tmp"
         try:
             os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(self.cache, f, indent=2)
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                f.write(serialization.dumps(self.cache))
+            os.replace(tmp_file, self.cache_file)
         except Exception as e:
             logger.error("Error saving cache: %s", str(e))
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+
+    def _mark_dirty(self) -> None:
+        """Mark cache as modified and schedule a flush."""
+        with self._lock:
+            self._dirty = True
+            if self._flush_timer is None and self.flush_interval is not None:
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Write pending changes to the cache file."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._save_cache()
 
     def _cleanup_expired(self) -> None:
         """Remove expired entries from cache."""
-        now = datetime.now()
-        expired = []
-        for key, entry in self.cache.items():
-            if "expiry" in entry:
-                expiry = datetime.fromisoformat(entry["expiry"])
-                if now > expiry:
-                    expired.append(key)
-                    self.stats.expired += 1
-
-        for key in expired:
-            del self.cache[key]
+        now = time.time()
+        cache = self.cache
+        live = {
+            key: entry
+            for key, entry in cache.items()
+            if entry.get("expiry_ts", NO_EXPIRY) >= now
+        }
+        expired = len(cache) - len(live)
 
         if expired:
-            self._save_cache()
-            logger.debug("Removed %d expired entries from cache", len(expired))
+            self.cache = live
+            self.stats.expired += expired
+            self._mark_dirty()
+            logger.debug("Removed %d expired entries from cache", expired)
 
     def get(self, key: str) -> Optional[Dict]:
         """Get value from cache.
@@ -92,22 +174,20 @@ class PlaylistCache:
         Returns:
             Cached value if found and not expired, None otherwise
         """
-        if key not in self.cache:
+        # Look up and remove entries in single dict operations, so another
+        # thread removing the same key cannot raise a KeyError here
+        entry = self.cache.get(key)
+        if entry is None:
             self.stats.misses += 1
             return None
 
-        entry = self.cache[key]
-        now = datetime.now()
-
         # Check expiry if set
-        if "expiry" in entry:
-            expiry = datetime.fromisoformat(entry["expiry"])
-            if now > expiry:
-                del self.cache[key]
-                self._save_cache()
-                self.stats.expired += 1
-                self.stats.misses += 1
-                return None
+        if time.time() > entry.get("expiry_ts", NO_EXPIRY):
+            if self.cache.pop(key, None) is not None:
+                self._mark_dirty()
+            self.stats.expired += 1
+            self.stats.misses += 1
+            return None
 
         self.stats.hits += 1
         return entry.get("value")
@@ -123,11 +203,16 @@ class PlaylistCache:
         entry = {"value": value}
 
         if ttl is not None:
-            expiry = datetime.now() + timedelta(seconds=ttl)
-            entry["expiry"] = expiry.isoformat()
+            entry["expiry_ts"] = time.time() + ttl
 
-        self.cache[key] = entry
-        self._save_cache()
+        cache = self.cache
+        # Re-insert so entries stay ordered by when they were last set
+        cache.pop(key, None)
+        cache[key] = entry
+        if self.max_entries is not None:
+            while len(cache) > self.max_entries:
+                cache.pop(next(iter(cache)), None)
+        self._mark_dirty()
 
     def invalidate(self, key: str) -> None:
         """Invalidate cache entry.
@@ -135,16 +220,33 @@ class PlaylistCache:
         Args:
             key: Cache key to invalidate
         """
-        if key in self.cache:
-            del self.cache[key]
-            self._save_cache()
+        if self.cache.pop(key, None) is not None:
+            self._mark_dirty()
 
     def clear(self) -> None:
         """Clear all cache entries."""
         self.cache = {}
-        self._save_cache()
+        self._mark_dirty()
         self.stats.reset()
 
 
-# Global cache instance
-playlist_cache = PlaylistCache()
+_playlist_cache: Optional[PlaylistCache] = None
+
+
+def get_playlist_cache() -> PlaylistCache:
+    """Get the shared playlist cache, creating it on first use.
+
+    Returns:
+        Global PlaylistCache instance
+    """
+    global _playlist_cache  # pylint: disable=global-statement
+    if _playlist_cache is None:
+        _playlist_cache = PlaylistCache()
+    return _playlist_cache
+
+
+def __getattr__(name: str):
+    """Create the global playlist_cache on first access (PEP 562)."""
+    if name == "playlist_cache":
+        return get_playlist_cache()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
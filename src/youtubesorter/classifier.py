@@ -1,26 +1,393 @@
 """Video classification using OpenAI API."""
 
+import atexit
+import functools
+import hashlib
 import logging
 import os
-from typing import Any, Dict, List
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import openai
 
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover
+    tiktoken = None
+
+from . import serialization
+from .cache import PlaylistCache
+from .config import CACHE_DIR, OPENAI_MODEL
 from .errors import YouTubeError
 
 
 logger = logging.getLogger(__name__)
 
-# Initialize OpenAI client
-client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Seconds to wait for an OpenAI response before giving up
+REQUEST_TIMEOUT = 60.0
+
+# Initialize OpenAI client. It holds one pooled HTTP client, so connections are
+# kept alive and reused across requests and worker threads. A process forked
+# after the first request must not reuse it; create a new client there.
+client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"), timeout=REQUEST_TIMEOUT)
+atexit.register(client.close)
+
+# Shown in place of a missing or ignored video description
+NO_DESCRIPTION = "(No description)"
+
+# Maximum number of videos classified per OpenAI request
+ITEMS_PER_REQUEST = 100
+
+# Input tokens per request; videos are packed into requests up to this budget
+INPUT_TOKEN_BUDGET = 6000
+
+# Characters per token assumed when no tokenizer is available
+CHARS_PER_TOKEN = 4
+
+# Completion tokens allowed per video; an '<index>:yes' line is about four
+TOKENS_PER_ANSWER = 6
+
+# Maximum number of OpenAI requests in flight at once
+MAX_CLASSIFY_WORKERS = 8
+
+SYSTEM_PROMPT = (
+    "You are a video classifier. You will be given video titles and descriptions "
+    "and need to determine if they match the given criteria. Respond with exactly "
+    "one line per video, in the form '<index>:yes' or '<index>:no'."
+)
+
+# File holding classification results from previous runs
+RESULT_CACHE_FILE = os.path.join(CACHE_DIR, "classification_results.json")
+
+# Earlier result cache, whose entries never expire and may hold answers
+# filled in for videos missing from a response; removed on first use
+LEGACY_RESULT_CACHE_FILE = os.path.join(CACHE_DIR, "classification_cache.json")
+
+# Seconds a cached classification result is reused before asking again
+RESULT_CACHE_TTL = 30 * 24 * 60 * 60
+
+_result_cache: Optional[PlaylistCache] = None
+
+# Worker pool shared by all callers, so concurrent classify_videos calls
+# together stay within MAX_CLASSIFY_WORKERS requests in flight
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# Batch API settings for offline classification
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_POLL_INTERVAL = 10.0
+BATCH_MAX_POLL_INTERVAL = 300.0
+BATCH_FINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+# One "<index>:yes" or "<index>:no" answer line
+_ANSWER_PATTERN = re.compile(r"^\s*(\d+)\s*:\s*(yes|no)", re.IGNORECASE | re.MULTILINE)
+
+
+def prewarm() -> None:
+    """Open a connection to the OpenAI API ahead of the first classification.
+
+    Makes a cheap authenticated request so the client's connection pool holds
+    a live connection by the time classification starts. Failures are ignored;
+    classification will simply connect on its first request.
+    """
+    try:
+        client.with_options(timeout=5.0, max_retries=0).models.list()
+    except Exception as e:
+        logger.debug("OpenAI connection prewarm failed: %s", str(e))
+
+
+def _get_result_cache() -> PlaylistCache:
+    """Get the classification result cache, creating it on first use.
+
+    Returns:
+        Cache of classification results keyed by _result_key
+    """
+    global _result_cache  # pylint: disable=global-statement
+    if _result_cache is None:
+        try:
+            os.remove(LEGACY_RESULT_CACHE_FILE)
+        except OSError:
+            pass
+        _result_cache = PlaylistCache(cache_file=RESULT_CACHE_FILE)
+    return _result_cache
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the shared classification worker pool, creating it on first use.
+
+    Returns:
+        Thread pool for OpenAI requests
+    """
+    global _executor  # pylint: disable=global-statement
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=MAX_CLASSIFY_WORKERS, thread_name_prefix="classify"
+            )
+        return _executor
+
+
+def _description(video: Dict[str, Any], use_description: bool) -> str:
+    """Get the description to show the classifier for a video.
+
+    Args:
+        video: Video dictionary with title and description
+        use_description: Whether to include the video's own description
+
+    Returns:
+        Description text
+    """
+    if not use_description:
+        return NO_DESCRIPTION
+    description = video.get("description", "")
+    return NO_DESCRIPTION if description is None else description
+
+
+def _result_key(
+    video: Dict[str, Any], filter_prompt: str, use_description: bool, model: str
+) -> str:
+    """Build the result cache key for a video and filter prompt.
+
+    Args:
+        video: Video dictionary with title and description
+        filter_prompt: Filter prompt to match against
+        use_description: Whether the video's description is classified
+        model: OpenAI model that classifies the video
+
+    Returns:
+        Hex digest of the model, filter prompt, title and description
+    """
+    description = _description(video, use_description)
+    content = "\x00".join((model, filter_prompt, video["title"], description))
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _dedupe_key(video: Dict[str, Any], use_description: bool) -> Tuple[str, str]:
+    """Build the key under which identical videos are classified once.
+
+    Args:
+        video: Video dictionary with title and description
+        use_description: Whether the video's description is classified
+
+    Returns:
+        Normalized (title, description) pair
+    """
+    description = _description(video, use_description)
+    return video["title"].strip().lower(), description.strip().lower()
+
+
+def _build_prompt(
+    videos: List[Dict[str, Any]], filter_prompt: str, use_description: bool = True
+) -> str:
+    """Build the user prompt for a group of videos.
+
+    Args:
+        videos: List of video dictionaries with titles and descriptions
+        filter_prompt: Filter prompt to match against
+        use_description: Whether to include video descriptions
+
+    Returns:
+        User prompt text
+    """
+    video_info = []
+    for index, video in enumerate(videos, 1):
+        description = _description(video, use_description)
+        video_info.append(f"[{index}] Title: {video['title']}\nDescription: {description}")
+
+    return (
+        f"Filter criteria: {filter_prompt}\n\n"
+        "Respond EXACTLY one line per video as '<index>:yes' if it matches the "
+        "criteria or '<index>:no' if it doesn't.\n\n" + "\n---\n".join(video_info)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _encoding(model: str) -> Any:
+    """Get the tokenizer for a model.
+
+    Args:
+        model: OpenAI model name
+
+    Returns:
+        tiktoken encoding, or None if tiktoken is not installed or the
+        encoding cannot be loaded
+    """
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:  # pylint: disable=broad-except
+        logger.debug("Falling back to estimated token counts: %s", str(e))
+        return None
+
+
+def _count_tokens(text: str, model: str) -> int:
+    """Count the tokens in a piece of text.
+
+    Args:
+        text: Text to count
+        model: OpenAI model whose tokenizer to use
+
+    Returns:
+        Token count, estimated from the text length if no tokenizer is available
+    """
+    encoding = _encoding(model)
+    if encoding is None:
+        return len(text) // CHARS_PER_TOKEN + 1
+    return len(encoding.encode(text))
+
+
+def _pack(
+    videos: List[Dict[str, Any]],
+    filter_prompt: str,
+    items_per_request: int,
+    use_description: bool,
+    model: str,
+) -> List[List[Dict[str, Any]]]:
+    """Split videos into request-sized chunks.
+
+    Videos are added to a chunk until the next one would take its prompt
+    past INPUT_TOKEN_BUDGET or the chunk holds items_per_request videos. A
+    video that exceeds the budget on its own gets a chunk to itself.
+
+    Args:
+        videos: List of video dictionaries with titles and descriptions
+        filter_prompt: Filter prompt to match against
+        items_per_request: Maximum number of videos per chunk
+        use_description: Whether to include video descriptions
+        model: OpenAI model whose tokenizer to use
+
+    Returns:
+        List of chunks, in order
+    """
+    base = _count_tokens(SYSTEM_PROMPT + _build_prompt([], filter_prompt), model)
+    chunks: List[List[Dict[str, Any]]] = []
+    chunk: List[Dict[str, Any]] = []
+    used = base
+    for video in videos:
+        description = _description(video, use_description)
+        tokens = _count_tokens(
+            f"[{len(chunk) + 1}] Title: {video['title']}\nDescription: {description}\n---\n",
+            model,
+        )
+        if chunk and (used + tokens > INPUT_TOKEN_BUDGET or len(chunk) >= items_per_request):
+            chunks.append(chunk)
+            chunk, used = [], base
+        chunk.append(video)
+        used += tokens
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _chat_request(
+    videos: List[Dict[str, Any]],
+    filter_prompt: str,
+    use_description: bool = True,
+    model: str = OPENAI_MODEL,
+) -> Dict[str, Any]:
+    """Build the chat completion parameters for a group of videos.
 
+    Output is capped at TOKENS_PER_ANSWER per video, which bounds the
+    response time of a request.
 
-def classify_videos(videos: List[Dict[str, Any]], filter_prompt: str) -> List[bool]:
+    Args:
+        videos: List of video dictionaries with titles and descriptions
+        filter_prompt: Filter prompt to match against
+        use_description: Whether to include video descriptions
+        model: OpenAI model to classify with
+
+    Returns:
+        Keyword arguments for chat.completions.create
+    """
+    return {
+        "model": model,
+        "max_tokens": max(16, len(videos) * TOKENS_PER_ANSWER),
+        "messages": [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": _build_prompt(videos, filter_prompt, use_description)},
+        ],
+        "temperature": 0,
+        "response_format": {"type": "text"},
+    }
+
+
+def _parse_answers(content: str, count: int) -> List[bool]:
+    """Parse a classification response.
+
+    Args:
+        content: Response text with one '<index>:yes' or '<index>:no' line per video
+        count: Number of videos in the request
+
+    Returns:
+        List of booleans indicating whether each video matches
+
+    Raises:
+        YouTubeError: If the response does not answer for every video
+    """
+    answers = {
+        int(index): answer.lower() == "yes" for index, answer in _ANSWER_PATTERN.findall(content)
+    }
+    missing = count - sum(1 for index in answers if 1 <= index <= count)
+    if missing:
+        raise YouTubeError(f"Classification response missing {missing} of {count} videos")
+
+    return [answers[index] for index in range(1, count + 1)]
+
+
+def _classify_chunk(
+    videos: List[Dict[str, Any]],
+    filter_prompt: str,
+    use_description: bool = True,
+    model: str = OPENAI_MODEL,
+) -> List[bool]:
+    """Classify a group of videos with a single OpenAI request.
+
+    Args:
+        videos: List of video dictionaries with titles and descriptions
+        filter_prompt: Filter prompt to match against
+        use_description: Whether to include video descriptions
+        model: OpenAI model to classify with
+
+    Returns:
+        List of booleans indicating whether each video matches
+    """
+    response = client.chat.completions.create(
+        **_chat_request(videos, filter_prompt, use_description, model)
+    )
+    return _parse_answers(response.choices[0].message.content, len(videos))
+
+
+def classify_videos(
+    videos: List[Dict[str, Any]],
+    filter_prompt: str,
+    items_per_request: int = ITEMS_PER_REQUEST,
+    use_cache: bool = True,
+    use_description: bool = True,
+    model: str = OPENAI_MODEL,
+) -> List[bool]:
     """Classify videos based on filter prompt.
 
+    Videos already classified with the same filter prompt, title and
+    description within RESULT_CACHE_TTL seconds are answered from the
+    result cache. Only answers parsed from a complete response are cached. The rest are packed
+    into requests of at most INPUT_TOKEN_BUDGET input tokens and
+    items_per_request videos, which are sent to OpenAI concurrently.
+    A blank filter prompt matches every video without calling OpenAI.
+
     Args:
         videos: List of video dictionaries with titles and descriptions
         filter_prompt: Filter prompt to match against
+        items_per_request: Maximum number of videos per OpenAI request
+        use_cache: Whether to use and update cached results
+        use_description: Whether to classify on descriptions as well as titles
+        model: OpenAI model to classify with
 
     Returns:
         List of booleans indicating whether each video matches
@@ -28,49 +395,31 @@ def classify_videos(videos: List[Dict[str, Any]], filter_prompt: str) -> List[bo
     Raises:
         YouTubeError: If classification fails
     """
-    try:
-        # Prepare video info for classification
-        video_info = []
-        for video in videos:
-            description = video.get("description", "")
-            if description is None:
-                description = "(No description)"
-            info = f"Title: {video['title']}\nDescription: {description}"
-            video_info.append(info)
-
-        # Create system prompt
-        system_prompt = (
-            "You are a video classifier. You will be given video titles and descriptions "
-            "and need to determine if they match the given criteria. Respond with only "
-            "'yes' or 'no' for each video."
-        )
-
-        # Create user prompt
-        user_prompt = (
-            f"Filter criteria: {filter_prompt}\n\n"
-            "For each video, respond with 'yes' if it matches the criteria, "
-            "or 'no' if it doesn't:\n\n" + "\n---\n".join(video_info)
-        )
+    if not filter_prompt.strip():
+        return [True] * len(videos)
 
-        # Get classification from OpenAI
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            temperature=0,
-        )
+    try:
+        if not use_cache:
+            return _classify_uncached(
+                videos, filter_prompt, items_per_request, use_description, model
+            )
 
-        # Parse response
-        results = response.choices[0].message.content.lower().split("\n")
-        matches = [r.strip().startswith("yes") for r in results if r.strip()]
+        cache = _get_result_cache()
+        keys = [_result_key(video, filter_prompt, use_description, model) for video in videos]
+        matches = [cache.get(key) for key in keys]
 
-        # Ensure we have a result for each video
-        if len(matches) != len(videos):
-            raise YouTubeError(
-                f"Classification returned {len(matches)} results for {len(videos)} videos"
+        misses = [i for i, match in enumerate(matches) if match is None]
+        if misses:
+            fresh = _classify_uncached(
+                [videos[i] for i in misses],
+                filter_prompt,
+                items_per_request,
+                use_description,
+                model,
             )
+            for i, match in zip(misses, fresh):
+                matches[i] = match
+                cache.set(keys[i], match, ttl=RESULT_CACHE_TTL)
 
         return matches
 
@@ -78,6 +427,191 @@ def classify_videos(videos: List[Dict[str, Any]], filter_prompt: str) -> List[bo
         raise YouTubeError(f"Classification failed: {str(e)}")
 
 
+def _classify_uncached(
+    videos: List[Dict[str, Any]],
+    filter_prompt: str,
+    items_per_request: int,
+    use_description: bool,
+    model: str,
+) -> List[bool]:
+    """Classify videos with OpenAI, sending chunks concurrently.
+
+    Videos with the same normalized title and description are sent once
+    and share the answer. Chunks run on the shared worker pool, so requests
+    from concurrent callers are interleaved rather than each caller opening
+    its own pool.
+
+    Args:
+        videos: List of video dictionaries with titles and descriptions
+        filter_prompt: Filter prompt to match against
+        items_per_request: Maximum number of videos per OpenAI request
+        use_description: Whether to include video descriptions
+        model: OpenAI model to classify with
+
+    Returns:
+        List of booleans indicating whether each video matches
+    """
+    unique_index: Dict[Tuple[str, str], int] = {}
+    unique: List[Dict[str, Any]] = []
+    positions = []
+    for video in videos:
+        key = _dedupe_key(video, use_description)
+        if key not in unique_index:
+            unique_index[key] = len(unique)
+            unique.append(video)
+        positions.append(unique_index[key])
+
+    if len(unique) < len(videos):
+        logger.debug("Classifying %d unique of %d videos", len(unique), len(videos))
+    matches = _classify_unique(unique, filter_prompt, items_per_request, use_description, model)
+    return [matches[i] for i in positions]
+
+
+def _classify_unique(
+    videos: List[Dict[str, Any]],
+    filter_prompt: str,
+    items_per_request: int,
+    use_description: bool,
+    model: str,
+) -> List[bool]:
+    """Split videos into chunks and classify them on the shared worker pool.
+
+    Args:
+        videos: List of video dictionaries with titles and descriptions
+        filter_prompt: Filter prompt to match against
+        items_per_request: Maximum number of videos per OpenAI request
+        use_description: Whether to include video descriptions
+        model: OpenAI model to classify with
+
+    Returns:
+        List of booleans indicating whether each video matches
+    """
+    chunks = _pack(videos, filter_prompt, items_per_request, use_description, model)
+
+    if len(chunks) <= 1:
+        return _classify_chunk(videos, filter_prompt, use_description, model) if videos else []
+
+    results = _get_executor().map(
+        lambda chunk: _classify_chunk(chunk, filter_prompt, use_description, model), chunks
+    )
+    return [match for matches in results for match in matches]
+
+
+def classify_videos_batch(
+    videos: List[Dict[str, Any]],
+    filter_prompt: str,
+    items_per_request: int = ITEMS_PER_REQUEST,
+    batch_id: Optional[str] = None,
+    on_submit: Optional[Callable[[str], None]] = None,
+    poll_interval: float = BATCH_POLL_INTERVAL,
+    use_description: bool = True,
+    model: str = OPENAI_MODEL,
+) -> List[bool]:
+    """Classify videos through the OpenAI Batch API.
+
+    Intended for large offline runs: batch requests cost less than
+    chat completions but may take up to 24 hours. Blocks until the batch
+    finishes.
+
+    Args:
+        videos: List of video dictionaries with titles and descriptions
+        filter_prompt: Filter prompt to match against
+        items_per_request: Maximum number of videos per batch request line
+        batch_id: ID of a previously submitted batch to wait for instead of
+            submitting a new one. Must have been created from the same videos
+            in the same order.
+        on_submit: Called with the batch ID once a new batch is submitted, so
+            callers can persist it and resume waiting after a crash
+        poll_interval: Seconds between the first status checks; doubles up to
+            BATCH_MAX_POLL_INTERVAL
+        use_description: Whether to classify on descriptions as well as titles
+        model: OpenAI model to classify with
+
+    Returns:
+        List of booleans indicating whether each video matches
+
+    Raises:
+        YouTubeError: If the batch cannot be submitted or does not complete
+    """
+    try:
+        chunks = _pack(videos, filter_prompt, items_per_request, use_description, model)
+        if not chunks:
+            return []
+
+        if batch_id is None:
+            lines = [
+                serialization.dumps(
+                    {
+                        "custom_id": str(i),
+                        "method": "POST",
+                        "url": BATCH_ENDPOINT,
+                        "body": _chat_request(chunk, filter_prompt, use_description, model),
+                    }
+                )
+                for i, chunk in enumerate(chunks)
+            ]
+            input_file = client.files.create(
+                file=("classify.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch"
+            )
+            batch = client.batches.create(
+                input_file_id=input_file.id,
+                endpoint=BATCH_ENDPOINT,
+                completion_window="24h",
+            )
+            batch_id = batch.id
+            logger.info("Submitted classification batch %s", batch_id)
+            if on_submit:
+                on_submit(batch_id)
+
+        batch = _wait_for_batch(batch_id, poll_interval)
+        if batch.status != "completed" or not batch.output_file_id:
+            raise YouTubeError(f"Batch {batch_id} ended with status {batch.status}")
+
+        results: Dict[int, List[bool]] = {}
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            result = serialization.loads(line)
+            index = int(result["custom_id"])
+            response = result.get("response") or {}
+            if response.get("status_code") != 200:
+                logger.error("Batch request %d failed: %s", index, result.get("error"))
+                continue
+            content = response["body"]["choices"][0]["message"]["content"]
+            results[index] = _parse_answers(content, len(chunks[index]))
+
+        return [
+            match
+            for i, chunk in enumerate(chunks)
+            for match in results.get(i, [False] * len(chunk))
+        ]
+
+    except YouTubeError:
+        raise
+    except Exception as e:
+        raise YouTubeError(f"Batch classification failed: {str(e)}")
+
+
+def _wait_for_batch(batch_id: str, poll_interval: float) -> Any:
+    """Poll a batch until it reaches a final status.
+
+    Args:
+        batch_id: ID of the batch to wait for
+        poll_interval: Seconds between the first status checks
+
+    Returns:
+        The finished batch object
+    """
+    delay = poll_interval
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in BATCH_FINAL_STATUSES:
+            return batch
+        logger.debug("Batch %s is %s, checking again in %.0fs", batch_id, batch.status, delay)
+        time.sleep(delay)
+        delay = min(delay * 2, BATCH_MAX_POLL_INTERVAL)
+
+
 def classify_video_titles(videos: List[Dict[str, Any]], filter_prompt: str) -> List[bool]:
     """Classify videos based on titles only.
 
@@ -91,11 +625,4 @@ def classify_video_titles(videos: List[Dict[str, Any]], filter_prompt: str) -> L
     Raises:
         YouTubeError: If classification fails
     """
-    # Create videos with empty descriptions
-    videos_with_empty_desc = []
-    for video in videos:
-        video_copy = video.copy()
-        video_copy["description"] = "(No description)"
-        videos_with_empty_desc.append(video_copy)
-
-    return classify_videos(videos_with_empty_desc, filter_prompt)
+    return classify_videos(videos, filter_prompt, use_description=False)
@@ -33,18 +33,20 @@ def clear_playlist(youtube: Resource, playlist_id: str) -> bool:
         bool: True if operation was successful, False otherwise
     """
     try:
-        # First, get all videos
+        youtube_api = api.YouTubeAPI(youtube)
+
+        # List videos as their pages arrive, keeping only the IDs
         logger.info("Fetching videos from playlist...")
-        videos = api.get_playlist_videos(youtube, playlist_id)
+        video_ids = []
+        for i, video in enumerate(youtube_api.iter_playlist_videos(playlist_id), 1):
+            logger.info("%d. %s", i, video["title"])
+            video_ids.append(video["video_id"])
 
-        if not videos:
+        if not video_ids:
             logger.info("No videos found in playlist.")
             return True
 
-        # Show videos that will be removed
-        logger.info("\nFound %d videos:", len(videos))
-        for i, video in enumerate(videos, 1):
-            logger.info("%d. %s", i, video["title"])
+        logger.info("\nFound %d videos.", len(video_ids))
 
         # Ask for confirmation
         logger.warning("\n⚠️  WARNING: This will remove ALL videos from the playlist!")
@@ -56,13 +58,11 @@ def clear_playlist(youtube: Resource, playlist_id: str) -> bool:
 
         # Remove videos in batches
         logger.info("\nRemoving videos...")
-        video_ids = [v["video_id"] for v in videos]
-        youtube_api = api.YouTubeAPI(youtube)
         removed = youtube_api.batch_remove_videos_from_playlist(playlist_id, video_ids)
 
         # Report results
         success_count = len(removed)
-        failed_count = len(videos) - success_count
+        failed_count = len(video_ids) - success_count
         logger.info("\n✅ Successfully removed: %d videos", success_count)
         if failed_count > 0:
             logger.warning("❌ Failed to remove: %d videos", failed_count)
@@ -3,10 +3,11 @@
 import argparse
 import logging
 import sys
+import threading
+from typing import Any, Callable, Dict
 
-from . import auth, commands, quota, utils, common
+from . import auth, commands, quota, utils
 from .errors import YouTubeError
-from .recovery import RecoveryManager
 
 
 logger = logging.getLogger(__name__)
@@ -19,6 +20,8 @@ def list_recovery_destinations(playlist_id: str, operation_type: str) -> None:
         playlist_id (str): The playlist ID to check
         operation_type (str): The operation type (move or filter)
     """
+    from .recovery import RecoveryManager
+
     state_file = utils.find_latest_state(playlist_id)
     if not state_file:
         logger.info("No recovery state found for playlist %s", playlist_id)
@@ -96,6 +99,11 @@ def create_parser() -> argparse.ArgumentParser:
     # Quota command
     quota_parser = subparsers.add_parser("quota", help="Check API quota usage")
     quota_parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose output")
+    quota_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Fetch quota usage instead of reusing a recent reading",
+    )
 
     # Undo command
     undo_parser = subparsers.add_parser("undo", help="Undo last operation")
@@ -113,6 +121,110 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _run_command(command: commands.YouTubeCommand) -> int:
+    """Validate and run a command.
+
+    Args:
+        command: Command to run
+
+    Returns:
+        int: Exit code
+    """
+    try:
+        command.validate()
+        if not command.run():
+            logger.error("Command failed to run successfully")
+            return 1
+        return 0
+    except YouTubeError as e:
+        logger.error("Command failed: %s", str(e))
+        return 1
+    except Exception as e:
+        logger.error("Command failed: %s", str(e))
+        return 1
+
+
+def _run_move(args: argparse.Namespace, youtube: Any) -> int:
+    """Run the move command."""
+    from .commands import MoveCommand
+
+    return _run_command(
+        MoveCommand(
+            youtube=youtube,
+            source_playlist=args.source,
+            target_playlist=args.target,
+            filter_pattern=None,  # Move command doesn't use filter pattern
+            dry_run=getattr(args, "dry_run", False),
+            resume=getattr(args, "resume", False),
+            resume_destination=getattr(args, "resume_destination", None),
+            retry_failed=getattr(args, "retry_failed", False),
+            verbose=getattr(args, "verbose", False),
+            limit=getattr(args, "limit", None),
+        )
+    )
+
+
+def _run_filter(args: argparse.Namespace, youtube: Any) -> int:
+    """Run the filter command."""
+    from .commands import FilterCommand
+
+    return _run_command(
+        FilterCommand(
+            youtube=youtube,
+            source_playlist=args.source,
+            target_playlist=args.target,
+            filter_pattern=args.prompt,
+            dry_run=getattr(args, "dry_run", False),
+            resume=getattr(args, "resume", False),
+            resume_destination=getattr(args, "resume_destination", None),
+            retry_failed=getattr(args, "retry_failed", False),
+            verbose=getattr(args, "verbose", False),
+            limit=getattr(args, "limit", None),
+        )
+    )
+
+
+def _run_list_destinations(args: argparse.Namespace, youtube: Any) -> int:
+    """Run the list-destinations command."""
+    try:
+        list_recovery_destinations(args.playlist, args.operation)
+        return 0
+    except (argparse.ArgumentError, ValueError) as e:
+        logger.error("Failed to list destinations: %s", str(e))
+        return 1
+
+
+def _run_undo(args: argparse.Namespace, youtube: Any) -> int:
+    """Run the undo command."""
+    from . import common
+
+    success = common.undo_operation(youtube, args.verbose)
+    return 0 if success else 1
+
+
+def _run_quota(args: argparse.Namespace, youtube: Any) -> int:
+    """Run the quota command."""
+    from .api import YouTubeAPI
+    from .commands.quota import QuotaCommand
+
+    return _run_command(
+        QuotaCommand(
+            youtube=YouTubeAPI(youtube),
+            use_cache=not getattr(args, "no_cache", False),
+        )
+    )
+
+
+# Subcommand name -> handler(args, youtube) returning an exit code
+HANDLERS: Dict[str, Callable[[argparse.Namespace, Any], int]] = {
+    "move": _run_move,
+    "filter": _run_filter,
+    "list-destinations": _run_list_destinations,
+    "undo": _run_undo,
+    "quota": _run_quota,
+}
+
+
 def main() -> int:
     """Main entry point.
 
@@ -130,6 +242,12 @@ def main() -> int:
     else:
         logging.basicConfig(level=logging.INFO)
 
+    # Connect to OpenAI in the background while we authenticate with YouTube
+    if args.command == "filter":
+        from . import classifier
+
+        threading.Thread(target=classifier.prewarm, daemon=True).start()
+
     # Get YouTube service
     youtube = auth.get_youtube_service()
     if not youtube:
@@ -143,75 +261,13 @@ def main() -> int:
         return 1
 
     # Execute command
-    try:
-        if args.command == "move":
-            command = commands.MoveCommand(
-                youtube=youtube,
-                source_playlist=args.source,
-                target_playlist=args.target,
-                filter_pattern=None,  # Move command doesn't use filter pattern
-                dry_run=getattr(args, "dry_run", False),
-                resume=getattr(args, "resume", False),
-                resume_destination=getattr(args, "resume_destination", None),
-                retry_failed=getattr(args, "retry_failed", False),
-                verbose=getattr(args, "verbose", False),
-                limit=getattr(args, "limit", None),
-            )
-            try:
-                command.validate()
-                if not command.run():
-                    logger.error("Command failed to run successfully")
-                    return 1
-                return 0
-            except YouTubeError as e:
-                logger.error("Command failed: %s", str(e))
-                return 1
-            except Exception as e:
-                logger.error("Command failed: %s", str(e))
-                return 1
-        elif args.command == "filter":
-            command = commands.FilterCommand(
-                youtube=youtube,
-                source_playlist=args.source,
-                target_playlist=args.target,
-                filter_pattern=args.prompt,
-                dry_run=getattr(args, "dry_run", False),
-                resume=getattr(args, "resume", False),
-                resume_destination=getattr(args, "resume_destination", None),
-                retry_failed=getattr(args, "retry_failed", False),
-                verbose=getattr(args, "verbose", False),
-                limit=getattr(args, "limit", None),
-            )
-            try:
-                command.validate()
-                if not command.run():
-                    logger.error("Command failed to run successfully")
-                    return 1
-                return 0
-            except YouTubeError as e:
-                logger.error("Command failed: %s", str(e))
-                return 1
-            except Exception as e:
-                logger.error("Command failed: %s", str(e))
-                return 1
-        elif args.command == "list-destinations":
-            try:
-                list_recovery_destinations(args.playlist, args.operation)
-                return 0
-            except (argparse.ArgumentError, ValueError) as e:
-                logger.error("Failed to list destinations: %s", str(e))
-                return 1
-            except SystemExit as e:
-                return 1 if e.code == 2 else e.code
-        elif args.command == "undo":
-            success = common.undo_operation(youtube, args.verbose)
-            return 0 if success else 1
-        elif args.command == "quota":
-            return 0
-        else:
-            parser.print_help()
-            return 1
+    handler = HANDLERS.get(args.command)
+    if handler is None:
+        parser.print_help()
+        return 1
 
+    try:
+        return handler(args, youtube)
     except SystemExit as e:
         return 1 if e.code == 2 else e.code
     except Exception as e:
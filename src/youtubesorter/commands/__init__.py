@@ -1,7 +1,24 @@
 """Command module initialization."""
 
+import importlib
+from typing import Any
+
 from .base import YouTubeCommand
-from .filter import FilterCommand  # noqa: F401
-from .move import MoveCommand  # noqa: F401
+
+# Command classes, imported from their modules on first access
+_LAZY = {
+    "FilterCommand": "filter",
+    "MoveCommand": "move",
+}
 
 __all__ = ["YouTubeCommand", "FilterCommand", "MoveCommand"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import command classes on first access (PEP 562)."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_LAZY[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
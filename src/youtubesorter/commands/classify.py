@@ -8,6 +8,7 @@ This command inherits from YouTubeCommand (in src/commands/__init__.py) which pr
 """
 
 import logging
+import time
 from typing import Optional, List, Dict, Any
 
 from ..api import YouTubeAPI
@@ -19,6 +20,11 @@ from . import YouTubeCommand
 # Get logger instance
 logger = logging.getLogger(__name__)
 
+# Save recovery state after this many video updates or this many seconds,
+# whichever comes first
+SAVE_EVERY = 50
+SAVE_INTERVAL = 5.0
+
 
 class ClassifyCommand(YouTubeCommand):
     """Command for classifying videos into multiple playlists."""
@@ -58,6 +64,8 @@ class ClassifyCommand(YouTubeCommand):
         self.batch_size = 50
         self.dry_run = dry_run
         self.limit = limit
+        self._unsaved = 0
+        self._last_save = time.monotonic()
 
     def validate(self) -> None:
         """Validate command arguments."""
@@ -96,6 +104,63 @@ class ClassifyCommand(YouTubeCommand):
         """
         return self.target_playlists[0] if self.target_playlists else None
 
+    def _record_progress(self, recovery: RecoveryManager, count: int = 1) -> None:
+        """Count video updates and checkpoint recovery state when one is due.
+
+        Args:
+            recovery: Recovery manager holding the updated state
+            count: Number of videos updated
+        """
+        self._unsaved += count
+        if self._unsaved >= SAVE_EVERY or time.monotonic() - self._last_save >= SAVE_INTERVAL:
+            recovery.checkpoint()
+            self._unsaved = 0
+            self._last_save = time.monotonic()
+
+    def _process_batch(self, recovery: RecoveryManager, videos: List[Dict[str, Any]]) -> None:
+        """Classify a batch of videos and add them to their target playlists.
+
+        Args:
+            recovery: Recovery manager to record results in
+            videos: Videos to process
+        """
+        by_target: Dict[str, List[str]] = {}
+        for video in videos:
+            video_id = video["video_id"]
+            title = video.get("title", "Unknown")
+            try:
+                target_playlist = self.classify_video(video)
+            except Exception as e:
+                self._logger.error("Failed to process %s: %s", title, str(e))
+                recovery.failed_videos.add(video_id)
+                continue
+
+            if not target_playlist:
+                self._logger.info("No target playlist for video: %s", title)
+                recovery.processed_videos.add(video_id)
+            elif self.dry_run:
+                self._logger.info("Would add video '%s' to playlist '%s'", title, target_playlist)
+                recovery.processed_videos.add(video_id)
+            else:
+                by_target.setdefault(target_playlist, []).append(video_id)
+
+        # Add videos to each target playlist in one call
+        for target_playlist, video_ids in by_target.items():
+            try:
+                added = set(self.youtube.batch_add_videos_to_playlist(video_ids, target_playlist))
+            except Exception as e:
+                self._logger.error(
+                    "Failed to add %d videos to %s: %s", len(video_ids), target_playlist, str(e)
+                )
+                recovery.failed_videos.update(video_ids)
+                continue
+
+            not_added = [video_id for video_id in video_ids if video_id not in added]
+            for video_id in not_added:
+                self._logger.error("Failed to process %s: Video not added", video_id)
+            recovery.processed_videos.update(added.intersection(video_ids))
+            recovery.failed_videos.update(not_added)
+
     def _run(self) -> bool:
         """Execute the command.
 
@@ -112,17 +177,22 @@ class ClassifyCommand(YouTubeCommand):
                 if self.resume:
                     recovery.load_state()
 
+                # Videos finished in earlier runs
+                done = recovery.processed_videos | recovery.failed_videos
+
                 # Get videos from playlist
                 try:
                     videos = self.youtube.get_playlist_videos(self.source_playlist_id)
-                    for video in videos:
-                        recovery.assign_video(video["video_id"], None, video_data=video)
+                    recovery.videos.update((video["video_id"], video) for video in videos)
+                    recovery.save_state()
                 except Exception as e:
                     self._logger.error("Failed to get videos from playlist: %s", str(e))
                     return False
 
                 # Get remaining videos to process
-                remaining = recovery.get_remaining_videos()
+                remaining = [video for video in videos if video["video_id"] not in done]
+                if self.limit:
+                    remaining = remaining[: self.limit]
 
                 if not remaining:
                     self._logger.info("No videos to process")
@@ -130,48 +200,12 @@ class ClassifyCommand(YouTubeCommand):
 
                 self._logger.info("Processing %d videos...", len(remaining))
 
-                # Process each video
-                for video in remaining:
-                    video_id = video["video_id"]
-                    title = video.get("title", "Unknown")
-
-                    try:
-                        # Classify video
-                        target_playlist = self.classify_video(video)
-                        if not target_playlist:
-                            self._logger.info("No target playlist for video: %s", title)
-                            recovery.processed_videos.add(video_id)
-                            continue
-
-                        if self.dry_run:
-                            self._logger.info(
-                                "Would add video '%s' to playlist '%s'",
-                                title,
-                                target_playlist,
-                            )
-                            recovery.processed_videos.add(video_id)
-                            continue
-
-                        # Add video to target playlist
-                        try:
-                            added = self.youtube.batch_add_videos_to_playlist(
-                                [video_id], target_playlist
-                            )
-                            if video_id in added:
-                                recovery.processed_videos.add(video_id)
-                            else:
-                                self._logger.error("Failed to process %s: Video not added", title)
-                                recovery.failed_videos.add(video_id)
-                        except Exception as e:
-                            self._logger.error("Failed to process %s: %s", title, str(e))
-                            recovery.failed_videos.add(video_id)
-
-                        recovery.save_state()
-
-                    except Exception as e:
-                        self._logger.error("Failed to process %s: %s", title, str(e))
-                        recovery.failed_videos.add(video_id)
-                        recovery.save_state()
+                # Process videos in batches. State is saved periodically here and
+                # once more when the recovery manager exits.
+                for start in range(0, len(remaining), self.batch_size):
+                    batch = remaining[start : start + self.batch_size]
+                    self._process_batch(recovery, batch)
+                    self._record_progress(recovery, len(batch))
 
                 self._logger.info("Classification complete")
                 return True
@@ -1,7 +1,9 @@
 """Command for deduplicating playlists."""
 
 import logging
-from typing import Optional, List, Dict, Any
+import time
+from collections import Counter
+from typing import Optional, List, Dict, Any, Set, Tuple
 
 from ..api import YouTubeAPI
 from ..core import YouTubeBase
@@ -12,6 +14,14 @@ from . import YouTubeCommand
 # Get logger instance
 logger = logging.getLogger(__name__)
 
+# Number of removal batches sent together by default
+MAX_REMOVE_WORKERS = 4
+
+# Recovery state is checkpointed after this many completed removal groups, or
+# once SAVE_INTERVAL seconds have passed since the last checkpoint
+SAVE_EVERY_BATCHES = 8
+SAVE_INTERVAL = 5.0
+
 
 class DeduplicateCommand(YouTubeCommand):
     """Command for deduplicating playlists."""
@@ -25,6 +35,7 @@ class DeduplicateCommand(YouTubeCommand):
         retry_failed: bool = False,
         dry_run: bool = False,
         limit: Optional[int] = None,
+        max_workers: int = MAX_REMOVE_WORKERS,
     ) -> None:
         """Initialize command.
 
@@ -36,6 +47,7 @@ class DeduplicateCommand(YouTubeCommand):
             retry_failed: Whether to retry failed videos
             dry_run: Whether to run in dry run mode
             limit: Maximum number of videos to process
+            max_workers: Maximum number of removal batches sent at once
         """
         super().__init__(youtube)
         self.name = "deduplicate"
@@ -48,6 +60,7 @@ class DeduplicateCommand(YouTubeCommand):
         self.batch_size = 50
         self.dry_run = dry_run
         self.limit = limit
+        self.max_workers = max_workers
 
     def validate(self) -> None:
         """Validate command arguments."""
@@ -63,15 +76,91 @@ class DeduplicateCommand(YouTubeCommand):
             if not state_file:
                 raise ValueError(f"No recovery state found for playlist {self.playlist_id}")
 
-            with RecoveryManager(self.playlist_id, self.name) as recovery:
-                if self.resume_destination:
-                    if self.resume_destination not in recovery.destination_metadata:
-                        raise ValueError(
-                            f"Destination {self.resume_destination} not found in recovery state"
-                        )
-                    progress = recovery.get_destination_progress(self.resume_destination)
-                    if progress.get("completed", False):
-                        raise ValueError(f"Destination {self.resume_destination} already completed")
+            # Keep the loaded state for _run() instead of parsing it again
+            if not self.recovery:
+                self.recovery = RecoveryManager(self.playlist_id, self.name)
+            if self.resume_destination:
+                if self.resume_destination not in self.recovery.destination_metadata:
+                    raise ValueError(
+                        f"Destination {self.resume_destination} not found in recovery state"
+                    )
+                progress = self.recovery.get_destination_progress(self.resume_destination)
+                if progress.get("completed", False):
+                    raise ValueError(f"Destination {self.resume_destination} already completed")
+
+    def _remove_duplicates(self, recovery: RecoveryManager, duplicates: List[str]) -> bool:
+        """Remove duplicate videos by deleting their extra playlist items.
+
+        The playlist is listed once to map every duplicate to its own playlist
+        item, keeping the first copy of each video, so a video listed three
+        times loses two distinct items. Items are deleted in groups of
+        max_workers batches; the API client sends each group's batches
+        concurrently. Results are recorded after each group, with periodic
+        checkpoints; the recovery manager saves the final state on exit.
+
+        Args:
+            recovery: Recovery manager to record results in
+            duplicates: IDs of duplicate videos to remove, once per extra copy
+
+        Returns:
+            True if all duplicates were removed, False otherwise
+        """
+        wanted = Counter(duplicates)
+        remaining = len(duplicates)
+        seen: Set[str] = set()
+        items: List[Tuple[str, str]] = []
+        if remaining:
+            try:
+                for video_id, item_id in self.youtube.iter_playlist_items(self.playlist_id):
+                    if video_id not in seen:
+                        seen.add(video_id)
+                    elif wanted[video_id] > 0:
+                        wanted[video_id] -= 1
+                        items.append((video_id, item_id))
+                        remaining -= 1
+                        if not remaining:
+                            break
+            except Exception as e:
+                self._logger.error("Failed to list playlist items: %s", str(e))
+                recovery.failed_videos.update(duplicates)
+                return False
+
+        # Copies that are no longer in the playlist need no removal
+        recovery.processed_videos.update(video_id for video_id, count in wanted.items() if count)
+
+        group_size = self.batch_size * self.max_workers
+        success = True
+        unsaved = 0
+        last_save = time.monotonic()
+        for start in range(0, len(items), group_size):
+            group = items[start : start + group_size]
+            try:
+                deleted = set(
+                    self.youtube.batch_delete_playlist_items(
+                        self.playlist_id, [item_id for _, item_id in group]
+                    )
+                )
+            except Exception as e:
+                self._logger.error("Failed to remove duplicates: %s", str(e))
+                recovery.failed_videos.update(video_id for video_id, _ in items[start:])
+                return False
+
+            failed = {video_id for video_id, item_id in group if item_id not in deleted}
+            recovery.processed_videos.update(
+                video_id for video_id, _ in group if video_id not in failed
+            )
+            if failed:
+                recovery.processed_videos.difference_update(failed)
+                recovery.failed_videos.update(failed)
+                success = False
+
+            unsaved += 1
+            if unsaved >= SAVE_EVERY_BATCHES or time.monotonic() - last_save >= SAVE_INTERVAL:
+                recovery.checkpoint()
+                unsaved = 0
+                last_save = time.monotonic()
+
+        return success
 
     def _run(self) -> bool:
         """Execute the command.
@@ -80,80 +169,51 @@ class DeduplicateCommand(YouTubeCommand):
             True if successful, False otherwise
         """
         try:
-            # Initialize recovery manager
-            with RecoveryManager(
+            # Reuse the recovery manager opened by validate(), which already
+            # loaded any previous state
+            with self.recovery or RecoveryManager(
                 playlist_id=self.playlist_id, operation_type=self.name
             ) as recovery:
                 self.recovery = recovery
 
-                # Load previous state if resuming
-                if self.resume:
-                    recovery.load_state()
-
-                # Get videos from playlist
+                # Find duplicates as pages of the playlist arrive
+                seen: Set[str] = set()
+                duplicates = []
+                processed = (
+                    recovery.processed_videos if self.resume and not self.retry_failed else set()
+                )
                 try:
-                    videos = self.youtube.get_playlist_videos(self.playlist_id)
-                    for video in videos:
-                        recovery.assign_video(video["video_id"], None, video_data=video)
+                    for video in self.youtube.iter_playlist_videos(self.playlist_id):
+                        video_id = video["video_id"]
+                        if video_id not in seen:
+                            seen.add(video_id)
+                            recovery.videos[video_id] = video
+                        elif video_id not in processed:
+                            duplicates.append(video_id)
+                            # Stop reading further pages once the limit is reached
+                            if self.limit and len(duplicates) >= self.limit:
+                                break
                 except Exception as e:
                     self._logger.error("Failed to get videos from playlist: %s", str(e))
                     return False
 
-                # Get remaining videos to process
-                remaining = recovery.get_remaining_videos()
-
-                if not remaining:
+                if not seen:
                     self._logger.info("No videos to process")
                     return True
 
-                # Find duplicates
-                seen = {}
-                duplicates = []
-                for video in remaining:
-                    video_id = video["video_id"]
-                    if video_id in seen:
-                        if (
-                            not self.resume
-                            or self.retry_failed
-                            or video_id not in recovery.processed_videos
-                        ):
-                            duplicates.append(video_id)
-                    else:
-                        seen[video_id] = True
-
                 if not duplicates:
                     self._logger.info("No duplicates found")
                     return True
 
-                self._logger.info("Found %d duplicates", len(duplicates))
-
                 if self.dry_run:
-                    for video_id in duplicates:
-                        self._logger.info("Would remove duplicate: %s", video_id)
+                    self._logger.info("Found %d duplicates, would remove them", len(duplicates))
+                    if self._logger.isEnabledFor(logging.DEBUG):
+                        for video_id in duplicates:
+                            self._logger.debug("Would remove duplicate: %s", video_id)
                     return True
 
-                # Remove duplicates in batches
-                success = True
-                for i in range(0, len(duplicates), self.batch_size):
-                    batch = duplicates[i : i + self.batch_size]
-                    try:
-                        removed = self.youtube.batch_remove_videos_from_playlist(
-                            batch, self.playlist_id
-                        )
-                        for video_id in removed:
-                            recovery.processed_videos.add(video_id)
-                        for video_id in set(batch) - set(removed):
-                            recovery.failed_videos.add(video_id)
-                            success = False
-                        recovery.save_state()
-                    except Exception as e:
-                        self._logger.error("Failed to remove duplicates: %s", str(e))
-                        for video_id in batch:
-                            recovery.failed_videos.add(video_id)
-                        recovery.save_state()
-                        return False
-
-                return success
+                self._logger.info("Found %d duplicates", len(duplicates))
+                return self._remove_duplicates(recovery, duplicates)
 
         except Exception as e:
             self._logger.error("Error deduplicating playlist: %s", str(e))
@@ -1,6 +1,6 @@
 """Filter command for YouTube playlists."""
 
-from typing import Optional
+from typing import Optional, Set
 
 from ..core import YouTubeBase
 from ..errors import YouTubeError
@@ -103,32 +103,36 @@ class FilterCommand(YouTubeCommand):
             if not self.recovery:
                 self.recovery = RecoveryManager(self.source_playlist, "filter")
 
-            # Get videos from source playlist
-            videos = self.youtube.get_playlist_videos(self.source_playlist)
-            if not videos:
-                logger.info("No videos found in source playlist")
-                return True
+            # Filter videos and handle resume state as pages of the source playlist arrive
+            # Snapshot processed videos, and failed ones unless retrying them,
+            # so each video needs a single set lookup
+            skip: Set[str] = set()
+            if self.resume:
+                skip.update(self.recovery.processed_videos)
+                if not self.retry_failed:
+                    skip.update(self.recovery.failed_videos)
 
-            # Filter videos and handle resume state
+            found = False
             filtered_videos = []
-            for video in videos:
+            pattern = self.filter_pattern.lower() if self.filter_pattern else None
+            for video in self.youtube.iter_playlist_videos(self.source_playlist):
+                found = True
                 video_id = video["video_id"]
 
-                # Skip already processed videos when resuming
-                if self.resume and video_id in self.recovery.processed_videos:
-                    continue
-
-                # Skip failed videos unless retry_failed is True
-                if (
-                    self.resume
-                    and video_id in self.recovery.failed_videos
-                    and not self.retry_failed
-                ):
+                # Skip videos finished in an earlier run
+                if video_id in skip:
                     continue
 
                 # Apply filter pattern
-                if self.filter_pattern and self.filter_pattern.lower() in video["title"].lower():
+                if pattern and pattern in video["title"].lower():
                     filtered_videos.append(video_id)
+                    # Stop reading further pages once the limit is reached
+                    if self.limit and len(filtered_videos) >= self.limit:
+                        break
+
+            if not found:
+                logger.info("No videos found in source playlist")
+                return True
 
             if not filtered_videos:
                 logger.info("No videos to process")
@@ -1,6 +1,6 @@
 """Move command for YouTube playlists."""
 
-from typing import Optional
+from typing import List, Optional, Set
 
 from ..core import YouTubeBase
 from ..logging_config import get_logger
@@ -102,34 +102,38 @@ class MoveCommand(YouTubeCommand):
             if not self.recovery and self.resume:
                 self.recovery = RecoveryManager(self.source_playlist, "move")
 
-            # Get videos from source playlist
-            videos = self.youtube.get_playlist_videos(self.source_playlist)
-            if not videos:
-                logger.info("No videos found in source playlist")
-                return True
-
-            # Filter videos if pattern provided and handle resume state
-            filtered_videos = []
-            for video in videos:
+            # Filter videos if pattern provided and handle resume state as pages
+            # of the source playlist arrive
+            # Snapshot processed videos, and failed ones unless retrying them,
+            # so each video needs a single set lookup
+            skip: Set[str] = set()
+            if self.recovery:
+                skip.update(self.recovery.processed_videos)
+                if not self.retry_failed:
+                    skip.update(self.recovery.failed_videos)
+
+            found = False
+            filtered_ids: List[str] = []
+            for video in self.youtube.iter_playlist_videos(self.source_playlist):
+                found = True
                 video_id = video["video_id"]
 
-                # Skip already processed videos when resuming
-                if self.recovery and video_id in self.recovery.processed_videos:
-                    continue
-
-                # Skip failed videos unless retry_failed is True
-                if (
-                    self.recovery
-                    and video_id in self.recovery.failed_videos
-                    and not self.retry_failed
-                ):
+                # Skip videos finished in an earlier run
+                if video_id in skip:
                     continue
 
                 # Apply filter pattern if provided
                 if not self.filter_pattern or self.filter_pattern in video["title"]:
-                    filtered_videos.append(video)
+                    filtered_ids.append(video_id)
+                    # Stop reading further pages once the limit is reached
+                    if self.limit and len(filtered_ids) >= self.limit:
+                        break
+
+            if not found:
+                logger.info("No videos found in source playlist")
+                return True
 
-            if not filtered_videos:
+            if not filtered_ids:
                 logger.info("No videos to process")
                 return True
 
@@ -137,29 +141,28 @@ class MoveCommand(YouTubeCommand):
             if not self.dry_run:
                 try:
                     moved = self.youtube.batch_move_videos_to_playlist(
-                        [v["video_id"] for v in filtered_videos],
+                        filtered_ids,
                         self.source_playlist,
                         self.target_playlist,
                     )
 
                     # Update recovery state
                     if self.recovery:
-                        for video in filtered_videos:
-                            if video["video_id"] in moved:
-                                self.recovery.processed_videos.add(video["video_id"])
-                            else:
-                                self.recovery.failed_videos.add(video["video_id"])
+                        moved_ids = set(moved)
+                        self.recovery.processed_videos.update(moved_ids.intersection(filtered_ids))
+                        self.recovery.failed_videos.update(
+                            video_id for video_id in filtered_ids if video_id not in moved_ids
+                        )
                         self.recovery.save_state()
 
                     logger.info("Moved %d videos to target playlist", len(moved))
                 except Exception as e:
                     if self.recovery:
-                        for video in filtered_videos:
-                            self.recovery.failed_videos.add(video["video_id"])
+                        self.recovery.failed_videos.update(filtered_ids)
                         self.recovery.save_state()
                     raise e
             else:
-                logger.info("Would move %d videos to target playlist", len(filtered_videos))
+                logger.info("Would move %d videos to target playlist", len(filtered_ids))
 
             return True
 
@@ -1,19 +1,55 @@
 """Quota command for YouTube playlists."""
 
+import time
+from typing import Any, Optional, Tuple
+
 from . import YouTubeCommand
 from ..logging_config import get_logger
 from ..api import YouTubeAPI
 
 logger = get_logger(__name__)
 
+# Seconds a fetched quota reading is reused for
+QUOTA_CACHE_TTL = 30.0
+
 
 class QuotaCommand(YouTubeCommand):
     """Command to check YouTube API quota usage."""
 
-    def __init__(self, youtube: YouTubeAPI) -> None:
+    # Last reading shared by all instances, as (fetch time, client, quota info)
+    _cache: Optional[Tuple[float, Any, Any]] = None
+
+    def __init__(self, youtube: YouTubeAPI, use_cache: bool = True) -> None:
+        """Initialize command.
+
+        Args:
+            youtube: YouTube API client
+            use_cache: Whether to reuse a reading fetched within QUOTA_CACHE_TTL seconds
+        """
         super().__init__(youtube)
         self.name = "quota"
         self.help = "Check YouTube API quota usage"
+        self.use_cache = use_cache
+
+    def _get_quota_info(self) -> Any:
+        """Get quota information, from the cache while it is fresh.
+
+        Returns:
+            Quota information from the client
+        """
+        now = time.monotonic()
+        cached = QuotaCommand._cache
+        if (
+            self.use_cache
+            and cached is not None
+            and cached[1] is self.youtube
+            and now - cached[0] < QUOTA_CACHE_TTL
+        ):
+            return cached[2]
+
+        quota_info = self.youtube.get_quota_info()
+        QuotaCommand._cache = (now, self.youtube, quota_info)
+        return quota_info
 
     def _run(self) -> bool:
         """Run the quota command.
@@ -22,7 +58,7 @@ class QuotaCommand(YouTubeCommand):
             bool: True if successful, False otherwise
         """
         try:
-            quota_info = self.youtube.get_quota_info()
+            quota_info = self._get_quota_info()
             logger.info("Quota usage: %s", quota_info)
             return True
         except Exception as e:
@@ -1,20 +1,36 @@
 """Common utilities for YouTube playlist operations."""
 
 import argparse
-import json
+import fnmatch
+import hashlib
 import logging
 import os
-from glob import glob
-from typing import List, Optional, Tuple, Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Optional, Set, Tuple, Dict, Any
 from datetime import datetime
 
-from . import api
-from . import classifier
+from . import serialization
 from .config import STATE_DIR
 from .logging_config import get_logger
+from .utils import cached_scan, invalidate_scan
+
+# The API client and classifier pull in googleapiclient and openai, which
+# commands such as undo never need. The classifier is imported where used.
+if TYPE_CHECKING:
+    from .api import YouTubeAPI
 
 logger = get_logger(__name__)
 
+# Videos classified together while the next page of the source playlist is
+# fetched; one page of playlist items
+CLASSIFY_CHUNK_SIZE = 50
+
+# Directories already created by _ensure_dir in this process
+_dirs_created: Set[str] = set()
+
+# Fingerprint of the contents last written to each state file
+_last_written: Dict[str, str] = {}
+
 
 def classify_video_titles(videos: List[Dict[str, Any]], filter_prompt: str) -> List[bool]:
     """Classify videos based on titles.
@@ -26,6 +42,8 @@ def classify_video_titles(videos: List[Dict[str, Any]], filter_prompt: str) -> L
     Returns:
         List of booleans indicating whether each video matches
     """
+    from . import classifier
+
     return classifier.classify_video_titles(videos, filter_prompt)
 
 
@@ -38,17 +56,25 @@ def find_latest_state(playlist_id: str) -> Optional[str]:
     Returns:
         Path to latest state file if found, None otherwise
     """
-    pattern = (
-        os.path.join(STATE_DIR, f"youtubesorter_{playlist_id}*.json")
-        if playlist_id
-        else os.path.join(STATE_DIR, "youtubesorter_*.json")
-    )
-    files = glob(pattern)
-    if not files:
-        return None
+    pattern = f"youtubesorter_{playlist_id}*.json" if playlist_id else "youtubesorter_*.json"
+
+    def _scan() -> Optional[str]:
+        latest, latest_ctime = None, None
+        # One pass over the directory, without a second stat per match
+        with os.scandir(STATE_DIR) as entries:
+            for entry in entries:
+                if not fnmatch.fnmatchcase(entry.name, pattern):
+                    continue
+                ctime = entry.stat().st_ctime
+                if latest_ctime is None or ctime > latest_ctime:
+                    latest, latest_ctime = entry.path, ctime
+        return latest
 
     try:
-        return max(files, key=os.path.getctime)
+        return cached_scan(STATE_DIR, pattern, _scan)
+    except FileNotFoundError:
+        # No state has been saved yet
+        return None
     except OSError:
         logger.error("Failed to access state files")
         return None
@@ -105,24 +131,71 @@ def log_operation_summary(
     )
 
     if verbose:
-        if processed:
-            logger.info("\nSuccessfully moved videos:")
-            for video_id in processed:
-                logger.info(f"- {video_id}")
+        # One message per list rather than one per video
+        for heading, video_ids in (
+            ("Successfully moved videos", processed),
+            ("Failed videos", failed),
+            ("Skipped videos", skipped),
+        ):
+            if video_ids:
+                logger.info("\n%s:\n%s", heading, "\n".join(f"- {v}" for v in video_ids))
 
-        if failed:
-            logger.info("\nFailed videos:")
-            for video_id in failed:
-                logger.info(f"- {video_id}")
 
-        if skipped:
-            logger.info("\nSkipped videos:")
-            for video_id in skipped:
-                logger.info(f"- {video_id}")
+def _matching_video_ids(
+    youtube: "YouTubeAPI", source_playlist: str, filter_prompt: str
+) -> Tuple[bool, List[str]]:
+    """Collect the IDs of source playlist videos matching a filter prompt.
+
+    Videos are classified a chunk at a time in a worker thread while later
+    pages of the playlist are fetched. A video listed more than once is
+    returned once.
+
+    Args:
+        youtube: YouTube API client
+        source_playlist: Source playlist ID
+        filter_prompt: Filter prompt for video matching; all videos match if blank
+
+    Returns:
+        Tuple of (whether the playlist has any videos, matching video IDs in
+        playlist order)
+    """
+    classify = bool(filter_prompt and filter_prompt.strip())
+    found = False
+    video_ids: Dict[str, None] = {}
+    pending: List[Tuple[List[Dict[str, Any]], "Future[List[bool]]"]] = []
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        chunk: List[Dict[str, Any]] = []
+        for video in youtube.iter_playlist_videos(source_playlist):
+            found = True
+            if not classify:
+                video_ids.setdefault(video["video_id"])
+                continue
+            chunk.append(video)
+            if len(chunk) >= CLASSIFY_CHUNK_SIZE:
+                pending.append(
+                    (chunk, executor.submit(classify_video_titles, chunk, filter_prompt))
+                )
+                chunk = []
+        if chunk:
+            pending.append(
+                (chunk, executor.submit(classify_video_titles, chunk, filter_prompt))
+            )
+
+        for chunk, future in pending:
+            matches = future.result()
+            video_ids.update(dict.fromkeys(v["video_id"] for v, m in zip(chunk, matches) if m))
+    finally:
+        # Drop classifications still queued if fetching or classifying failed
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+    return found, list(video_ids)
 
 
 def process_videos(
-    youtube: api.YouTubeAPI,
+    youtube: "YouTubeAPI",
     source_playlist: str,
     filter_prompt: str,
     target_playlist: str,
@@ -146,24 +219,15 @@ def process_videos(
     """
     video_ids = []  # Initialize video_ids before try block
     try:
-        # Get source videos
-        videos = youtube.get_playlist_videos(source_playlist)
-        if not videos:
+        found, video_ids = _matching_video_ids(youtube, source_playlist, filter_prompt)
+        if not found:
             logger.info("No videos found in source playlist")
             return [], [], []
 
-        # Filter videos if prompt provided
-        if filter_prompt:
-            matches = classify_video_titles(videos, filter_prompt)
-            videos = [v for v, m in zip(videos, matches) if m]
-
-        if not videos:
+        if not video_ids:
             logger.info("No videos matched filter criteria")
             return [], [], []
 
-        # Get video IDs
-        video_ids = [v["video_id"] for v in videos]
-
         # Process videos
         if dry_run:
             logger.info("Dry run - no changes will be made")
@@ -172,20 +236,70 @@ def process_videos(
         # Move or copy videos
         if copy:
             processed = youtube.batch_add_videos_to_playlist(target_playlist, video_ids)
-            failed = [v for v in video_ids if v not in processed]
-            return processed, failed, []
         else:
             processed = youtube.batch_move_videos_to_playlist(
                 source_playlist, target_playlist, video_ids
             )
-            failed = [v for v in video_ids if v not in processed]
-            return processed, failed, []
+        processed_set = set(processed)
+        failed = [v for v in video_ids if v not in processed_set]
+        return processed, failed, []
 
     except Exception as e:
         logger.error(f"Error processing playlist {source_playlist}: {str(e)}")
         return [], video_ids, []
 
 
+def _ensure_dir(directory: str) -> None:
+    """Create a directory unless this process already has.
+
+    Args:
+        directory: Directory path
+    """
+    if directory not in _dirs_created:
+        os.makedirs(directory, exist_ok=True)
+        _dirs_created.add(directory)
+
+
+def _write_state(state_file: str, state: Dict[str, Any]) -> None:
+    """Write a state file atomically.
+
+    The state is written to a temporary file which then replaces the state
+    file, so an interrupted save never leaves a truncated state. The write is
+    skipped when the file still holds the same contents as the last save.
+
+    Args:
+        state_file: Path to state file
+        state: State to write
+
+    Raises:
+        IOError: If the state file cannot be written
+    """
+    data = serialization.dumpb(state, indent=True)
+    fingerprint = hashlib.blake2b(data, digest_size=16).hexdigest()
+    if _last_written.get(state_file) == fingerprint and os.path.exists(state_file):
+        return
+
+    directory = os.path.dirname(state_file)
+    if directory:
+        _ensure_dir(directory)
+    tmp_file = state_file + ".tmp"
+    try:
+        with open(tmp_file, "wb") as f:
+            f.write(data)
+        os.replace(tmp_file, state_file)
+        _last_written[state_file] = fingerprint
+        invalidate_scan(directory or ".")
+    except IOError:
+        # The directory may have been removed since it was created
+        _dirs_created.discard(directory)
+        _last_written.pop(state_file, None)
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+        raise
+
+
 def save_operation_state(
     target_playlist: str,
     processed: List[str],
@@ -204,23 +318,19 @@ def save_operation_state(
     """
     try:
         if state_file is None:
-            os.makedirs(STATE_DIR, exist_ok=True)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             state_file = os.path.join(STATE_DIR, f"youtubesorter_{target_playlist}_{timestamp}.json")
 
-        os.makedirs(os.path.dirname(state_file), exist_ok=True)
-        with open(state_file, "w", encoding="utf-8") as f:
-            json.dump(
-                {
-                    "target_playlist": target_playlist,
-                    "processed_videos": processed,
-                    "failed_videos": failed,
-                    "skipped_videos": skipped,
-                    "operation_type": "move",
-                },
-                f,
-                indent=2,
-            )
+        _write_state(
+            state_file,
+            {
+                "target_playlist": target_playlist,
+                "processed_videos": processed,
+                "failed_videos": failed,
+                "skipped_videos": skipped,
+                "operation_type": "move",
+            },
+        )
     except IOError:
         logger.error("Failed to save operation state")
 
@@ -243,23 +353,19 @@ def save_undo_operation(
     """
     try:
         if state_file is None:
-            os.makedirs(STATE_DIR, exist_ok=True)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             state_file = os.path.join(STATE_DIR, f"youtubesorter_undo_{target_playlist}_{timestamp}.json")
 
-        os.makedirs(os.path.dirname(state_file), exist_ok=True)
-        with open(state_file, "w", encoding="utf-8") as f:
-            json.dump(
-                {
-                    "target_playlist": target_playlist,
-                    "processed_videos": processed,
-                    "failed_videos": failed,
-                    "skipped_videos": skipped,
-                    "operation_type": "undo",
-                },
-                f,
-                indent=2,
-            )
+        _write_state(
+            state_file,
+            {
+                "target_playlist": target_playlist,
+                "processed_videos": processed,
+                "failed_videos": failed,
+                "skipped_videos": skipped,
+                "operation_type": "undo",
+            },
+        )
     except IOError:
         logger.error("Failed to save undo operation state")
 
@@ -273,8 +379,8 @@ def load_operation_state(state_file: str) -> dict:
     Returns:
         Operation state dictionary
     """
-    with open(state_file, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(state_file, "rb") as f:
+        return serialization.loads(f.read())
 
 
 def undo_operation(youtube, verbose=False):
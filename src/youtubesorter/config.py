@@ -16,9 +16,13 @@ RECOVERY_DIR = os.getenv("RECOVERY_DIR", os.path.join(DATA_DIR, "recovery"))
 # YouTube API Settings
 YOUTUBE_SCOPES = ["https://www.googleapis.com/auth/youtube.force-ssl"]
 CLIENT_SECRETS_FILE = os.getenv("GOOGLE_CLIENT_SECRETS_FILE")
-TOKEN_FILE = os.path.join(CREDENTIALS_DIR, "token.pickle")
+TOKEN_FILE = os.path.join(CREDENTIALS_DIR, "token.json")
+# Pickled token saved by earlier versions, converted to TOKEN_FILE on first use
+LEGACY_TOKEN_FILE = os.path.join(CREDENTIALS_DIR, "token.pickle")
+# Minimum seconds between starting batch HTTP requests, to stay under rate limits
+API_REQUEST_INTERVAL = float(os.getenv("YTS_API_REQUEST_INTERVAL_MS", "150")) / 1000
 
 # OpenAI Settings
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-OPENAI_MODEL = "gpt-3.5-turbo"
+OPENAI_MODEL = os.getenv("YTS_CLASSIFIER_MODEL", "gpt-4o-mini")
 BATCH_SIZE = 10  # Number of videos to process in one LLM call
@@ -2,7 +2,6 @@
 
 import argparse
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Optional, Set, Tuple
 
 from . import common, errors
@@ -59,6 +58,7 @@ def process_playlist(
     verbose: bool = False,
     processed_videos: Optional[Set[str]] = None,
     failed_videos: Optional[Set[str]] = None,
+    api: Optional[YouTubeAPI] = None,
 ) -> Tuple[List[str], List[str], List[str]]:
     """Process a single playlist for consolidation.
 
@@ -71,6 +71,8 @@ def process_playlist(
         verbose: Whether to output verbose progress
         processed_videos: Set of already processed video IDs
         failed_videos: Set of failed video IDs
+        api: API wrapper to use. Sharing one across playlists keeps its HTTP
+            clients and request pacing; a new one is created if omitted.
 
     Returns:
         Tuple of (successful_moves, failed_moves, skipped_videos)
@@ -80,24 +82,37 @@ def process_playlist(
     if failed_videos is None:
         failed_videos = set()
 
-    api = YouTubeAPI(youtube)
+    if api is None:
+        api = YouTubeAPI(youtube)
     try:
-        videos = api.get_playlist_videos(source_playlist)
-        if not videos:
-            logger.info("No videos found in source playlist")
-            return [], [], []
+        # With a limit, pages are streamed so reading stops once enough new
+        # videos are found. Otherwise the whole listing is needed, and it may
+        # already be cached by consolidate_playlists.
+        if limit:
+            videos = api.iter_playlist_videos(source_playlist)
+        else:
+            videos = api.get_playlist_videos(source_playlist)
 
         # Filter out already processed videos
-        videos = [v for v in videos if v["video_id"] not in processed_videos]
-        if limit:
-            videos = videos[:limit]
+        found = False
+        video_ids = []
+        for video in videos:
+            found = True
+            if video["video_id"] in processed_videos:
+                continue
+            video_ids.append(video["video_id"])
+            if limit and len(video_ids) >= limit:
+                break
+
+        if not found:
+            logger.info("No videos found in source playlist")
+            return [], [], []
 
-        if not videos:
+        if not video_ids:
             logger.info("No new videos to process")
             return [], [], []
 
         # Process videos
-        video_ids = [v["video_id"] for v in videos]
         if copy:
             processed = api.batch_add_videos_to_playlist(target_playlist, video_ids)
         else:
@@ -105,7 +120,8 @@ def process_playlist(
                 source_playlist, target_playlist, video_ids
             )
 
-        failed = [v for v in video_ids if v not in processed]
+        processed_set = set(processed)
+        failed = [v for v in video_ids if v not in processed_set]
         skipped = []
 
         # Update tracking sets
@@ -149,6 +165,9 @@ def consolidate_playlists(
         resume: Whether to resume from last state
         retry_failed: Whether to retry previously failed videos
     """
+    # A playlist given more than once is processed once
+    source_playlist_ids = list(dict.fromkeys(source_playlist_ids))
+
     # Initialize or load state
     recovery_manager = RecoveryManager(
         playlist_id=source_playlist_ids[0],  # Use first playlist as primary
@@ -169,6 +188,15 @@ def consolidate_playlists(
     total_failed = []
     total_skipped = []
 
+    # List all sources together up front; process_playlist then reads the
+    # cached listings. With a limit, later sources may never be needed.
+    api = YouTubeAPI(youtube)
+    if limit is None and len(source_playlist_ids) > 1:
+        try:
+            api.get_playlists_videos(source_playlist_ids)
+        except Exception as e:
+            logger.warning("Could not list source playlists together: %s", str(e))
+
     # Process playlists sequentially to maintain consistent state
     for playlist_id in source_playlist_ids:
         try:
@@ -189,6 +217,7 @@ def consolidate_playlists(
                 verbose=verbose,
                 processed_videos=processed_videos,
                 failed_videos=failed_videos,
+                api=api,
             )
 
             total_successful.extend(successful)
@@ -196,10 +225,10 @@ def consolidate_playlists(
             total_skipped.extend(skipped)
 
             # Update recovery state after each playlist
-            for video_id in successful:
-                recovery_manager.assign_video(video_id, target_playlist_id)
-            for video_id in failed:
-                recovery_manager.assign_video(video_id, target_playlist_id, success=False)
+            if successful:
+                recovery_manager.assign_videos(successful, target_playlist_id)
+            if failed:
+                recovery_manager.assign_videos(failed, target_playlist_id, success=False)
 
             if verbose:
                 logger.info("Completed processing playlist %s", playlist_id)
@@ -1,14 +1,19 @@
 """Core functionality and shared utilities."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional
 
 from .logging_config import get_logger
 from .errors import PlaylistNotFoundError
+from .paging import ThreadHttp, iter_pages, service_credentials
 
 
 # Get logger for this module
 logger = get_logger(__name__)
 
+# Partial response selectors, limiting payloads to the fields we read
+PLAYLIST_INFO_FIELDS = "items(id,snippet(title,description))"
+PLAYLIST_ITEM_FIELDS = "items(snippet(title,description,resourceId/videoId)),nextPageToken"
+
 
 class YouTubeBase:
     """Base class for YouTube operations."""
@@ -21,6 +26,7 @@ class YouTubeBase:
         """
         self.youtube = youtube
         self._logger = logger
+        self._thread_clients = ThreadHttp()
 
     def get_playlist_info(self, playlist_id: str) -> Dict:
         """Get basic playlist information.
@@ -39,6 +45,7 @@ class YouTubeBase:
                 part="snippet",
                 id=playlist_id,
                 maxResults=1,
+                fields=PLAYLIST_INFO_FIELDS,
             )
             response = request.execute()
 
@@ -65,38 +72,49 @@ class YouTubeBase:
         Returns:
             List of video information dictionaries
         """
-        videos = []
-        next_page_token = None
-
         try:
-            while True:
-                request = self.youtube.playlistItems().list(
-                    part="snippet",
-                    playlistId=playlist_id,
-                    maxResults=50,
-                    pageToken=next_page_token,
-                )
-                response = request.execute()
+            return list(self.iter_playlist_videos(playlist_id))
+        except Exception as e:
+            self._logger.error("Error getting playlist videos: %s", str(e))
+            return []
 
-                for item in response.get("items", []):
-                    video_id = item["snippet"]["resourceId"]["videoId"]
-                    title = item["snippet"]["title"]
-                    description = item["snippet"].get("description", "")
+    def iter_playlist_videos(self, playlist_id: str) -> Iterator[Dict]:
+        """Iterate over the videos in a playlist as pages arrive.
 
-                    videos.append(
-                        {
-                            "video_id": video_id,
-                            "title": title,
-                            "description": description,
-                        }
-                    )
+        The next page is fetched on a background thread while the caller
+        processes the current one. Closing the iterator early cancels that
+        fetch, or waits for it if already sent, so the client is free again.
 
-                next_page_token = response.get("nextPageToken")
-                if not next_page_token:
-                    break
+        Args:
+            playlist_id: YouTube playlist ID
 
-            return videos
+        Yields:
+            Video information dictionaries
+        """
+        credentials = service_credentials(self.youtube)
 
-        except Exception as e:
-            self._logger.error("Error getting playlist videos: %s", str(e))
-            return []
+        def _fetch(page_token: Optional[str]) -> Dict:
+            request = self.youtube.playlistItems().list(
+                part="snippet",
+                playlistId=playlist_id,
+                maxResults=50,
+                pageToken=page_token,
+                fields=PLAYLIST_ITEM_FIELDS,
+            )
+            # Send through this thread's own client, not the service's shared one
+            http = self._thread_clients.get(credentials) if credentials is not None else None
+            return request.execute(http=http)
+
+        # Without credentials there is no client to give a prefetch thread
+        pages = iter_pages(_fetch, prefetch=credentials is not None)
+        try:
+            for response in pages:
+                for item in response.get("items", []):
+                    yield {
+                        "video_id": item["snippet"]["resourceId"]["videoId"],
+                        "title": item["snippet"]["title"],
+                        "description": item["snippet"].get("description", ""),
+                    }
+        finally:
+            # Stop the prefetch as soon as the caller stops
+            pages.close()
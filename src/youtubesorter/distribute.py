@@ -55,7 +55,8 @@ def distribute_videos(
                 video_ids, source_playlist, target_playlist
             )
             successful_videos.extend(moved)
-            failed_videos.extend([v for v in video_ids if v not in moved])
+            moved_set = set(moved)
+            failed_videos.extend([v for v in video_ids if v not in moved_set])
 
             if verbose:
                 logger.info("Moved %d videos to target playlist", len(moved))
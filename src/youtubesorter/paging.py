@@ -0,0 +1,90 @@
+"""Paged API listings fetched over per-thread HTTP clients."""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, Optional
+
+import google_auth_httplib2
+from googleapiclient.http import build_http
+
+
+def service_credentials(service: Any) -> Optional[Any]:
+    """Get the credentials an API service authorizes its requests with.
+
+    Args:
+        service: API service object
+
+    Returns:
+        Credentials, or None if the service has none
+    """
+    return getattr(getattr(service, "_http", None), "credentials", None)
+
+
+class ThreadHttp:
+    """Authorized HTTP clients, one per thread.
+
+    httplib2 connections are not thread-safe, so each thread sending requests
+    uses its own client instead of the one shared by the service.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no clients."""
+        self._local = threading.local()
+
+    def get(self, credentials: Any) -> Any:
+        """Get the client for the current thread, creating it on first use.
+
+        Args:
+            credentials: Credentials to authorize requests with
+
+        Returns:
+            Authorized HTTP client
+        """
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(credentials, http=build_http())
+            self._local.http = http
+        return http
+
+
+def iter_pages(fetch: Callable[[Optional[str]], Dict], prefetch: bool = True) -> Iterator[Dict]:
+    """Iterate over the pages of a paged listing.
+
+    With prefetch, the next page is fetched on a background thread while
+    the caller processes the current one; fetch must then not send requests
+    over a client shared with the calling thread. Closing the iterator early
+    cancels the prefetch, or waits for it if already sent, so no request
+    outlives the iteration.
+
+    Args:
+        fetch: Function fetching the page with a given token, None for the first
+        prefetch: Whether to fetch the next page in the background
+
+    Yields:
+        Response pages
+    """
+    if not prefetch:
+        page_token = None
+        while True:
+            response = fetch(page_token)
+            yield response
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    future: Optional["Future[Dict]"] = None
+    try:
+        response = fetch(None)
+        while True:
+            # Start fetching the next page before handing this one over
+            page_token = response.get("nextPageToken")
+            future = executor.submit(fetch, page_token) if page_token else None
+            yield response
+            if future is None:
+                break
+            response = future.result()
+    finally:
+        if future is not None:
+            future.cancel()
+        executor.shutdown(wait=True)
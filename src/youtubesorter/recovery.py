@@ -1,14 +1,114 @@
 """Manages recovery state for interrupted operations."""
 
-import json
 import os
-from typing import Dict, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 
+from . import serialization
 from .config import RECOVERY_DIR
 from .logging_config import get_logger
 
+if TYPE_CHECKING:
+    from .api import YouTubeAPI
+
 logger = get_logger(__name__)
 
+# Journal lines written between full state saves before checkpoint() compacts
+COMPACT_EVERY = 10000
+
+
+class JournalingSet(set):
+    """Set of video IDs that records additions and removals.
+
+    The recorded changes are what RecoveryManager.checkpoint() appends to
+    the recovery journal. Bulk operations that cannot be recorded item by
+    item mark the set as untracked, which forces a full save instead.
+    """
+
+    def __init__(self, items: Iterable[str] = ()) -> None:
+        """Initialize set.
+
+        Args:
+            items: Initial items, which are not recorded as changes
+        """
+        super().__init__(items)
+        self.changes: List[Tuple[bool, str]] = []
+        self.untracked = False
+
+    def add(self, item: str) -> None:
+        """Add an item, recording the change."""
+        if item not in self:
+            super().add(item)
+            self.changes.append((True, item))
+
+    def discard(self, item: str) -> None:
+        """Remove an item if present, recording the change."""
+        if item in self:
+            super().discard(item)
+            self.changes.append((False, item))
+
+    def remove(self, item: str) -> None:
+        """Remove an item, recording the change.
+
+        Raises:
+            KeyError: If the item is not in the set
+        """
+        super().remove(item)
+        self.changes.append((False, item))
+
+    def pop(self) -> str:
+        """Remove and return an arbitrary item, recording the change."""
+        item = super().pop()
+        self.changes.append((False, item))
+        return item
+
+    def update(self, *others: Iterable[str]) -> None:
+        """Add items from iterables, recording each change."""
+        for other in others:
+            for item in other:
+                self.add(item)
+
+    def difference_update(self, *others: Iterable[str]) -> None:
+        """Remove items found in iterables, recording each change."""
+        for other in others:
+            for item in other:
+                self.discard(item)
+
+    def __ior__(self, other: Any) -> "JournalingSet":
+        self.update(other)
+        return self
+
+    def __isub__(self, other: Any) -> "JournalingSet":
+        self.difference_update(other)
+        return self
+
+    def clear(self) -> None:
+        """Remove all items."""
+        super().clear()
+        self.untracked = True
+
+    def intersection_update(self, *others: Iterable[Any]) -> None:
+        """Keep only items found in all iterables."""
+        super().intersection_update(*others)
+        self.untracked = True
+
+    def symmetric_difference_update(self, other: Iterable[Any]) -> None:
+        """Keep items found in exactly one of the set and the iterable."""
+        super().symmetric_difference_update(other)
+        self.untracked = True
+
+    def __iand__(self, other: Any) -> "JournalingSet":
+        self.intersection_update(other)
+        return self
+
+    def __ixor__(self, other: Any) -> "JournalingSet":
+        self.symmetric_difference_update(other)
+        return self
+
+    def mark_saved(self) -> None:
+        """Forget recorded changes once they are on disk."""
+        self.changes.clear()
+        self.untracked = False
+
 
 class RecoveryManager:
     """Manages recovery state for interrupted operations."""
@@ -32,16 +132,39 @@ class RecoveryManager:
             os.makedirs(RECOVERY_DIR, exist_ok=True)
             state_file = os.path.join(RECOVERY_DIR, f"recovery_{playlist_id}_{operation_type}.json")
         self.state_file = state_file
+        self.journal_file = state_file + ".journal"
+        self._journal_lines = 0
+        self._needs_compaction = True
         self.destination_metadata: Dict = {}
         self.destination_progress: Dict = {}
         self.videos: Dict = {}
         self.video_assignments: Dict[str, str] = {}  # For backward compatibility
-        self.processed_videos: Set[str] = set()  # For backward compatibility
-        self.failed_videos: Set[str] = set()  # For backward compatibility
+        self.processed_videos = set()  # For backward compatibility
+        self.failed_videos = set()  # For backward compatibility
 
         if os.path.exists(self.state_file):
             self.load_state()
 
+    @property
+    def processed_videos(self) -> JournalingSet:
+        """IDs of videos processed successfully."""
+        return self._processed_videos
+
+    @processed_videos.setter
+    def processed_videos(self, videos: Iterable[str]) -> None:
+        self._processed_videos = JournalingSet(videos)
+        self._needs_compaction = True
+
+    @property
+    def failed_videos(self) -> JournalingSet:
+        """IDs of videos that failed to process."""
+        return self._failed_videos
+
+    @failed_videos.setter
+    def failed_videos(self, videos: Iterable[str]) -> None:
+        self._failed_videos = JournalingSet(videos)
+        self._needs_compaction = True
+
     def __enter__(self):
         """Enter context manager."""
         return self
@@ -60,8 +183,8 @@ class RecoveryManager:
     def load_state(self) -> None:
         """Load recovery state from file."""
         try:
-            with open(self.state_file, "r", encoding="utf-8") as f:
-                state = json.load(f)
+            with open(self.state_file, "rb") as f:
+                state = serialization.loads(f.read())
                 self.destination_metadata = state.get("destination_metadata", {})
                 self.destination_progress = state.get("destination_progress", {})
                 self.videos = state.get("videos", {})
@@ -70,9 +193,10 @@ class RecoveryManager:
                 if "video_assignments" in state:
                     self.video_assignments = state["video_assignments"]
                 if "processed_videos" in state:
-                    self.processed_videos = set(state["processed_videos"])
+                    self.processed_videos = state["processed_videos"]
                 if "failed_videos" in state:
-                    self.failed_videos = set(state["failed_videos"])
+                    self.failed_videos = state["failed_videos"]
+                self._replay_journal()
 
                 # Convert old format to new format if needed
                 if self.processed_videos and not any(
@@ -83,11 +207,41 @@ class RecoveryManager:
                             self.processed_videos
                         )
 
+            # The loaded state matches what is on disk
+            self.processed_videos.mark_saved()
+            self.failed_videos.mark_saved()
+            self._needs_compaction = False
+
         except Exception as e:
             logger.error("Error loading recovery state: %s", str(e))
 
+    def _replay_journal(self) -> None:
+        """Apply changes recorded in the journal since the last full save."""
+        try:
+            with open(self.journal_file, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return
+
+        sets = {"P": self.processed_videos, "F": self.failed_videos}
+        for line in lines:
+            op, _, video_id = line.partition("\t")
+            # Skip anything malformed, such as a line cut short by a crash
+            if len(op) != 2 or op[0] not in sets or op[1] not in "+-" or not video_id:
+                continue
+            if op[1] == "+":
+                sets[op[0]].add(video_id)
+            else:
+                sets[op[0]].discard(video_id)
+        self._journal_lines = len(lines)
+
     def save_state(self) -> None:
-        """Save recovery state to file."""
+        """Save recovery state to file.
+
+        The state is written to a temporary file which then replaces the
+        state file, so an interrupted save never leaves a truncated state.
+        """
+        tmp_file = self.state_file + ".tmp"
         try:
             os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
             state = {
@@ -100,10 +254,65 @@ class RecoveryManager:
                 "processed_videos": list(self.processed_videos),  # For backward compatibility
                 "failed_videos": list(self.failed_videos),  # For backward compatibility
             }
-            with open(self.state_file, "w", encoding="utf-8") as f:
-                json.dump(state, f, indent=2)
+            with open(tmp_file, "wb") as f:
+                f.write(serialization.dumpb(state, indent=True))
+            os.replace(tmp_file, self.state_file)
         except Exception as e:
             logger.error("Error saving recovery state: %s", str(e))
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+            return
+
+        # Everything in the journal is now part of the state file
+        try:
+            os.remove(self.journal_file)
+        except OSError:
+            pass
+        self._journal_lines = 0
+        self._needs_compaction = False
+        self.processed_videos.mark_saved()
+        self.failed_videos.mark_saved()
+
+    def checkpoint(self) -> None:
+        """Save progress at a cost proportional to the changes since the last save.
+
+        Appends processed and failed video changes to the journal, which
+        load_state() replays on top of the state file. Other state, such as
+        destination progress and video metadata, is written by the next
+        save_state(), which also runs on context manager exit. Falls back
+        to save_state() when the journal cannot describe the changes or has
+        grown past COMPACT_EVERY lines.
+        """
+        if (
+            self._needs_compaction
+            or self.processed_videos.untracked
+            or self.failed_videos.untracked
+            or self._journal_lines >= COMPACT_EVERY
+            or not os.path.exists(self.state_file)
+        ):
+            self.save_state()
+            return
+
+        lines = [
+            f"{code}{'+' if added else '-'}\t{video_id}\n"
+            for code, videos in (("P", self.processed_videos), ("F", self.failed_videos))
+            for added, video_id in videos.changes
+        ]
+        if not lines:
+            return
+
+        try:
+            with open(self.journal_file, "a", encoding="utf-8") as f:
+                f.write("".join(lines))
+        except Exception as e:
+            logger.error("Error writing recovery journal: %s", str(e))
+            return
+
+        self._journal_lines += len(lines)
+        self.processed_videos.mark_saved()
+        self.failed_videos.mark_saved()
 
     def add_destination(self, dest_id: str, metadata: Dict) -> None:
         """Add a destination to track.
@@ -167,7 +376,7 @@ class RecoveryManager:
         ]
 
     def get_remaining_videos(
-        self, api: Optional[YouTubeAPI] = None, use_cache: bool = True
+        self, api: Optional["YouTubeAPI"] = None, use_cache: bool = True
     ) -> List[str]:
         """Get list of videos not yet processed for any destination.
 
@@ -176,21 +385,22 @@ class RecoveryManager:
             use_cache: Whether to use cached playlist data (for backward compatibility)
 
         Returns:
-            List of video IDs not yet processed
+            List of video IDs not yet processed, in the order they were recorded
         """
-        all_videos = set(self.videos.keys())
-        processed = set()
-        failed = set()
-
+        # Per-destination lists are the only ones needing a set built; the
+        # top-level sets are checked in place rather than copied
+        done = set()
         for progress in self.destination_progress.values():
-            processed.update(progress.get("processed_videos", []))
-            failed.update(progress.get("failed_videos", []))
-
-        # For backward compatibility
-        processed.update(self.processed_videos)
-        failed.update(self.failed_videos)
+            done.update(progress.get("processed_videos", []))
+            done.update(progress.get("failed_videos", []))
 
-        return list(all_videos - processed - failed)
+        processed = self.processed_videos
+        failed = self.failed_videos
+        return [
+            video_id
+            for video_id in self.videos
+            if video_id not in done and video_id not in processed and video_id not in failed
+        ]
 
     def get_videos_for_destination(self, dest_id: str) -> List[Dict]:
         """Get list of videos assigned to a destination.
@@ -211,7 +421,12 @@ class RecoveryManager:
         ]  # Minimal video data for compatibility
 
     def assign_video(
-        self, video_id: str, dest_id: str, video_data: Optional[Dict] = None, success: bool = True
+        self,
+        video_id: str,
+        dest_id: str,
+        video_data: Optional[Dict] = None,
+        success: bool = True,
+        save: bool = True,
     ) -> None:
         """Assign a video to a destination.
 
@@ -220,6 +435,8 @@ class RecoveryManager:
             dest_id: Destination ID
             video_data: Optional video metadata
             success: Whether assignment was successful (for backward compatibility)
+            save: Whether to save state now. Callers assigning many videos can
+                pass False and call save_state() once afterwards.
         """
         if video_data:
             self.videos[video_id] = video_data
@@ -253,6 +470,19 @@ class RecoveryManager:
             if video_id in self.processed_videos:
                 self.processed_videos.remove(video_id)
 
+        if save:
+            self.save_state()
+
+    def assign_videos(self, video_ids: Iterable[str], dest_id: str, success: bool = True) -> None:
+        """Assign several videos to a destination and save state once.
+
+        Args:
+            video_ids: Video IDs
+            dest_id: Destination ID
+            success: Whether assignment was successful
+        """
+        for video_id in video_ids:
+            self.assign_video(video_id, dest_id, success=success, save=False)
         self.save_state()
 
     def mark_video_failed(self, video_id: str, dest_id: str) -> None:
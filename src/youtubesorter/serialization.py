@@ -0,0 +1,72 @@
+"""JSON serialization helpers.
+
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise. Decode errors are json.JSONDecodeError in both cases.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON document.
+
+    Args:
+        data: JSON document as text or UTF-8 bytes
+
+    Returns:
+        Deserialized object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize an object to a JSON string.
+
+    Args:
+        obj: Object to serialize
+        indent: Whether to pretty-print with two-space indentation
+
+    Returns:
+        JSON document
+
+    Raises:
+        TypeError: If the object is not JSON serializable
+    """
+    if orjson is not None:
+        return dumpb(obj, indent).decode("utf-8")
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def dumpb(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Cheaper than dumps() when the result is written to a binary file, as
+    orjson produces bytes directly.
+
+    Args:
+        obj: Object to serialize
+        indent: Whether to pretty-print with two-space indentation
+
+    Returns:
+        JSON document as UTF-8 bytes
+
+    Raises:
+        TypeError: If the object is not JSON serializable
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
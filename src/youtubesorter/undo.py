@@ -7,6 +7,7 @@ from typing import Dict, List, Optional, Set
 
 from .config import STATE_DIR
 from .logging_config import get_logger
+from .utils import invalidate_scan
 
 logger = get_logger(__name__)
 
@@ -80,6 +81,7 @@ class UndoManager:
             os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
             with open(self.state_file, "w", encoding="utf-8") as f:
                 json.dump(state, f, indent=2)
+            invalidate_scan(os.path.dirname(self.state_file))
             logger.info("Saved undo operation to %s", self.state_file)
         except Exception as e:
             logger.error("Error saving undo operation: %s", str(e))
@@ -132,6 +134,7 @@ class UndoManager:
         try:
             with open(self.state_file, "w", encoding="utf-8") as f:
                 json.dump(self.state, f, indent=2)
+            invalidate_scan(os.path.dirname(self.state_file))
         except Exception as e:
             logger.error("Error saving undo state: %s", str(e))
 
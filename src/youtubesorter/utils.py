@@ -1,13 +1,78 @@
 """Utility functions for YouTube playlist operations."""
 
-import glob
+import fnmatch
 import os
 import re
-from typing import Optional
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Results of state file scans, keyed by (directory, pattern), with the
+# directory modification time they were computed at
+_scan_cache: Dict[Tuple[str, str], Tuple[int, Optional[str]]] = {}
+_scan_cache_lock = threading.Lock()
+
+# Scans of directories modified more recently than this are not cached, since
+# filesystems with coarse (up to 2 second) timestamps may not move the
+# modification time on for a change made in the same tick
+RACY_MTIME_NS = 2_000_000_000
+
+
+def cached_scan(directory: str, pattern: str, scan: Callable[[], Optional[str]]) -> Optional[str]:
+    """Return a cached directory scan result while the directory is unchanged.
+
+    Creating, removing or replacing a file in the directory updates its
+    modification time, which invalidates the cached result. Rewriting a file
+    in place does not, so writers call invalidate_scan() afterwards. Results
+    are only cached once the modification time is old enough that a later
+    change must move it on.
+
+    Args:
+        directory: Directory that the scan reads
+        pattern: File pattern the scan looks for, part of the cache key
+        scan: Function performing the scan
+
+    Returns:
+        Result of scan, possibly from an earlier call
+    """
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        return scan()
+
+    key = (os.path.abspath(directory), pattern)
+    with _scan_cache_lock:
+        cached = _scan_cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    result = scan()
+    if time.time_ns() - mtime >= RACY_MTIME_NS:
+        with _scan_cache_lock:
+            _scan_cache[key] = (mtime, result)
+    return result
+
+
+def invalidate_scan(directory: str) -> None:
+    """Forget cached scan results for a directory after writing to it.
+
+    Args:
+        directory: Directory that was written to
+    """
+    path = os.path.abspath(directory)
+    with _scan_cache_lock:
+        for key in [key for key in _scan_cache if key[0] == path]:
+            del _scan_cache[key]
+
+
+def clear_scan_cache() -> None:
+    """Forget all cached directory scan results."""
+    with _scan_cache_lock:
+        _scan_cache.clear()
+
 
 def parse_playlist_url(playlist_str: str) -> str:
     """Extract playlist ID from a YouTube playlist URL or return the raw ID.
@@ -48,13 +113,20 @@ def find_latest_state(playlist_id: Optional[str] = None) -> Optional[str]:
     if playlist_id:
         pattern = f".youtubesorter_{playlist_id}_recovery.json"
 
-    try:
-        files = glob.glob(pattern)
-        if not files:
-            return None
+    def _scan() -> Optional[str]:
+        latest, latest_mtime = None, None
+        # DirEntry.stat() reuses data from the directory listing where it can
+        with os.scandir(".") as entries:
+            for entry in entries:
+                if not fnmatch.fnmatchcase(entry.name, pattern) or not entry.is_file():
+                    continue
+                mtime = entry.stat().st_mtime
+                if latest_mtime is None or mtime > latest_mtime:
+                    latest, latest_mtime = entry.name, mtime
+        return latest
 
-        # Sort by modification time, newest first
-        return max(files, key=os.path.getmtime)
+    try:
+        return cached_scan(".", pattern, _scan)
     except Exception as e:
         logger.error("Error finding latest state file: %s", str(e))
         return None
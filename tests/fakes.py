@@ -0,0 +1,31 @@
+"""Test doubles shared across test modules."""
+
+
+class FakeBatchHttpRequest:
+    """Stand-in for googleapiclient's BatchHttpRequest.
+
+    Executes the added requests in order and reports each result to the
+    callback, so tests can keep mocking individual request ``execute`` calls.
+    """
+
+    def __init__(self, callback=None):
+        """Initialize fake batch.
+
+        Args:
+            callback: Callback invoked as callback(request_id, response, exception)
+        """
+        self._callback = callback
+        self._requests = []
+
+    def add(self, request, callback=None, request_id=None):
+        """Queue a request."""
+        self._requests.append((request_id, request, callback or self._callback))
+
+    def execute(self, http=None):
+        """Run queued requests and report results."""
+        for request_id, request, callback in self._requests:
+            try:
+                response, exception = request.execute(), None
+            except Exception as e:  # pylint: disable=broad-except
+                response, exception = None, e
+            callback(request_id, response, exception)
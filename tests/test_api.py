@@ -1,21 +1,53 @@
 """Tests for the YouTube API wrapper."""
 
+import threading
+
 import pytest
 from unittest.mock import MagicMock, patch
 
+from googleapiclient.errors import HttpError
+
+from src.youtubesorter import api as api_module
 from src.youtubesorter.api import (
+    PLAYLIST_VIDEO_FIELDS,
     YouTubeAPI,
     get_playlist_videos,
     batch_move_videos_to_playlist,
     get_playlist_info,
 )
+from src.youtubesorter.cache import PlaylistCache
 from src.youtubesorter.errors import PlaylistNotFoundError, YouTubeError
+from tests.fakes import FakeBatchHttpRequest
+
+
+@pytest.fixture(autouse=True)
+def clear_service_cache():
+    """Reset the memoized YouTube service around each test."""
+    api_module._service.cache_clear()
+    yield
+    api_module._service.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def no_request_pacing():
+    """Send batch requests without waiting between them, unless a test opts in."""
+    with patch.object(api_module, "API_REQUEST_INTERVAL", 0):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def page_cache(tmp_path):
+    """Use an empty playlist page cache for each test."""
+    cache = PlaylistCache(cache_file=str(tmp_path / "playlist_pages.json"), flush_interval=None)
+    with patch.object(api_module, "_page_cache", cache):
+        yield cache
 
 
 @pytest.fixture
 def youtube_client():
     """Create a mock YouTube client."""
     client = MagicMock()
+    client.new_batch_http_request.side_effect = FakeBatchHttpRequest
 
     # Mock playlist items list
     playlist_items = MagicMock()
@@ -76,8 +108,130 @@ def test_get_playlist_videos(api, youtube_client):
         playlistId="playlist1",
         maxResults=50,
         pageToken=None,
+        fields=PLAYLIST_VIDEO_FIELDS,
+    )
+
+
+def test_iter_playlist_videos(api, youtube_client):
+    """Test streaming videos from a playlist."""
+    videos = api.iter_playlist_videos("playlist1")
+
+    assert next(videos) == {
+        "video_id": "vid1",
+        "title": "Video 1",
+        "description": "Description 1",
+    }
+    assert [video["video_id"] for video in videos] == ["vid2"]
+
+
+def test_get_playlist_videos_reuses_listing(api, youtube_client):
+    """Test that a listing is reused until the playlist is changed."""
+    list_request = youtube_client.playlistItems.return_value.list
+    assert len(api.get_playlist_videos("playlist1")) == 2
+    assert len(api.get_playlist_videos("playlist1")) == 2
+    assert list_request.call_count == 1
+
+    api.get_playlist_videos("playlist1", use_cache=False)
+    assert list_request.call_count == 2
+
+    api.batch_add_videos_to_playlist("playlist1", ["vid3"])
+    api.get_playlist_videos("playlist1")
+    assert list_request.call_count == 3
+
+    with patch("src.youtubesorter.api.time.monotonic", return_value=1e12):
+        api.get_playlist_videos("playlist1")
+    assert list_request.call_count == 4
+
+
+def test_video_list_cache_per_instance(api, youtube_client):
+    """Test that listings are not shared between YouTubeAPI instances."""
+    other_client = MagicMock()
+    other_client.playlistItems.return_value.list.return_value.execute.return_value = {
+        "items": []
+    }
+    assert len(api.get_playlist_videos("playlist1")) == 2
+    assert YouTubeAPI(other_client).get_playlist_videos("playlist1") == []
+
+    # Changes through another instance leave this instance's listing alone
+    YouTubeAPI(other_client).invalidate_video_list("playlist1")
+    api.get_playlist_videos("playlist1")
+    assert youtube_client.playlistItems.return_value.list.call_count == 1
+
+
+def test_playlist_pages_use_thread_clients(api, youtube_client):
+    """Test that pages are not fetched over the service's shared connection."""
+    pages = [{"items": [], "nextPageToken": "token1"}, {"items": []}]
+    calls = []
+
+    def execute(http=None):
+        calls.append((threading.get_ident(), http))
+        return pages[len(calls) - 1]
+
+    youtube_client.playlistItems.return_value.list.return_value.execute.side_effect = execute
+    with patch(
+        "src.youtubesorter.paging.google_auth_httplib2.AuthorizedHttp",
+        side_effect=lambda *args, **kwargs: MagicMock(),
+    ):
+        list(api.iter_playlist_videos("playlist1", use_cache=False))
+
+    assert len(calls) == 2
+    assert all(http is not None for _, http in calls)
+    # The prefetch thread has its own client
+    assert calls[0][0] != calls[1][0]
+    assert calls[0][1] is not calls[1][1]
+
+
+def test_get_playlists_videos(api, youtube_client):
+    """Test that several playlists are paged through in shared batch requests."""
+
+    def _page(video_id, next_page_token=None):
+        page = {
+            "items": [
+                {
+                    "contentDetails": {"videoId": video_id},
+                    "snippet": {"title": video_id, "description": ""},
+                }
+            ]
+        }
+        if next_page_token:
+            page["nextPageToken"] = next_page_token
+        return page
+
+    pages = {
+        ("playlist1", None): _page("vid1", "token1"),
+        ("playlist1", "token1"): _page("vid2"),
+        ("playlist2", None): _page("vid3"),
+    }
+
+    def _list(playlistId, pageToken, **kwargs):
+        request = MagicMock(headers={})
+        request.execute.return_value = pages[(playlistId, pageToken)]
+        return request
+
+    youtube_client.playlistItems.return_value.list.side_effect = _list
+
+    videos = api.get_playlists_videos(["playlist1", "playlist2", "playlist1"])
+
+    assert {pid: [v["video_id"] for v in vids] for pid, vids in videos.items()} == {
+        "playlist1": ["vid1", "vid2"],
+        "playlist2": ["vid3"],
+    }
+    assert youtube_client.new_batch_http_request.call_count == 2
+
+    # The listings are cached for later single-playlist reads
+    assert [v["video_id"] for v in api.get_playlist_videos("playlist2")] == ["vid3"]
+    assert youtube_client.playlistItems.return_value.list.call_count == 3
+
+
+def test_get_playlists_videos_not_found(api, youtube_client):
+    """Test that a missing playlist fails the whole listing."""
+    youtube_client.playlistItems.return_value.list.return_value.execute.side_effect = Exception(
+        "playlistNotFound"
     )
 
+    with pytest.raises(PlaylistNotFoundError):
+        api.get_playlists_videos(["playlist1", "playlist2"])
+
 
 def test_get_playlist_videos_pagination(api, youtube_client):
     """Test getting videos with pagination."""
@@ -150,6 +304,19 @@ def test_batch_add_videos_to_playlist(api, youtube_client):
     assert youtube_client.playlistItems.return_value.insert.call_count == 2
 
 
+def test_batch_add_videos_records_item_ids(api, youtube_client):
+    """Test that new playlist item IDs are reported when requested."""
+    youtube_client.playlistItems.return_value.insert.return_value.execute.side_effect = [
+        {"id": "item1"},
+        {"id": "item2"},
+    ]
+
+    item_ids = {}
+    api.batch_add_videos_to_playlist("playlist1", ["vid1", "vid2"], item_ids=item_ids)
+
+    assert item_ids == {"vid1": "item1", "vid2": "item2"}
+
+
 def test_batch_add_videos_to_playlist_partial_failure(api, youtube_client):
     """Test handling partial failure when adding videos."""
     # First video succeeds, second fails
@@ -164,6 +331,20 @@ def test_batch_add_videos_to_playlist_partial_failure(api, youtube_client):
     assert successful == ["vid1"]
 
 
+@patch("src.youtubesorter.api.time.sleep")
+def test_batch_add_videos_server_errors_not_retried(mock_sleep, api, youtube_client):
+    """Test that inserts failing with a 5xx error are not sent again."""
+    server_error = HttpError(MagicMock(status=500, reason="Backend Error"), b"")
+    execute = youtube_client.playlistItems.return_value.insert.return_value.execute
+    execute.side_effect = [server_error, {}]
+
+    successful = api.batch_add_videos_to_playlist("playlist1", ["vid1", "vid2"])
+
+    assert successful == ["vid2"]
+    assert execute.call_count == 2
+    mock_sleep.assert_not_called()
+
+
 def test_batch_add_videos_playlist_not_found(api, youtube_client):
     """Test adding videos to a non-existent playlist."""
     youtube_client.playlistItems.return_value.insert.return_value.execute.side_effect = Exception(
@@ -190,6 +371,52 @@ def test_batch_remove_videos_from_playlist(api, youtube_client):
     assert youtube_client.playlistItems.return_value.delete.call_count == 2
 
 
+def test_batch_remove_videos_with_known_item_ids(api, youtube_client):
+    """Test that known item IDs skip listing the playlist."""
+    successful = api.batch_remove_videos_from_playlist(
+        "playlist1", ["vid1", "vid2"], item_ids={"vid1": "item1", "vid2": "item2"}
+    )
+
+    assert successful == ["vid1", "vid2"]
+    youtube_client.playlistItems.return_value.list.assert_not_called()
+    youtube_client.playlistItems.return_value.delete.assert_any_call(id="item2")
+
+
+@patch("src.youtubesorter.api.time.sleep")
+def test_batch_remove_videos_retries_server_errors(mock_sleep, api, youtube_client):
+    """Test that sub-requests failing with a 5xx error are retried."""
+    server_error = HttpError(MagicMock(status=500, reason="Backend Error"), b"")
+    youtube_client.playlistItems.return_value.delete.return_value.execute.side_effect = [
+        server_error,
+        {},
+        {},
+    ]
+
+    successful = api.batch_remove_videos_from_playlist(
+        "playlist1", ["vid1", "vid2"], item_ids={"vid1": "item1", "vid2": "item2"}
+    )
+
+    assert sorted(successful) == ["vid1", "vid2"]
+    mock_sleep.assert_called_once_with(api_module.BATCH_RETRY_DELAY)
+
+
+@patch("src.youtubesorter.api.time.sleep")
+def test_batch_remove_videos_client_errors_not_retried(mock_sleep, api, youtube_client):
+    """Test that 4xx errors fail without a retry."""
+    client_error = HttpError(MagicMock(status=404, reason="Not Found"), b"")
+    youtube_client.playlistItems.return_value.delete.return_value.execute.side_effect = [
+        client_error,
+        {},
+    ]
+
+    successful = api.batch_remove_videos_from_playlist(
+        "playlist1", ["vid1", "vid2"], item_ids={"vid1": "item1", "vid2": "item2"}
+    )
+
+    assert successful == ["vid2"]
+    mock_sleep.assert_not_called()
+
+
 def test_batch_remove_videos_playlist_not_found(api, youtube_client):
     """Test removing videos from a non-existent playlist."""
     youtube_client.playlistItems.return_value.list.return_value.execute.side_effect = Exception(
@@ -200,6 +427,33 @@ def test_batch_remove_videos_playlist_not_found(api, youtube_client):
         api.batch_remove_videos_from_playlist("nonexistent", ["vid1"])
 
 
+def test_iter_playlist_items_yields_every_copy(api, youtube_client):
+    """Test that each playlist item of a repeated video is listed."""
+    youtube_client.playlistItems.return_value.list.return_value.execute.return_value = {
+        "items": [
+            {"id": "item1", "contentDetails": {"videoId": "vid1"}},
+            {"id": "item2", "contentDetails": {"videoId": "vid1"}},
+        ]
+    }
+
+    assert list(api.iter_playlist_items("playlist1")) == [("vid1", "item1"), ("vid1", "item2")]
+
+
+def test_batch_delete_playlist_items(api, youtube_client):
+    """Test deleting playlist items by item ID."""
+    client_error = HttpError(MagicMock(status=404, reason="Not Found"), b"")
+    youtube_client.playlistItems.return_value.delete.return_value.execute.side_effect = [
+        {},
+        client_error,
+    ]
+
+    deleted = api.batch_delete_playlist_items("playlist1", ["item1", "item2"])
+
+    assert deleted == ["item1"]
+    youtube_client.playlistItems.return_value.list.assert_not_called()
+    youtube_client.playlistItems.return_value.delete.assert_any_call(id="item2")
+
+
 def test_batch_move_videos_to_playlist(api, youtube_client):
     """Test moving videos between playlists."""
     # Mock getting playlist items for removal
@@ -240,6 +494,7 @@ def test_get_playlist_info(api, youtube_client):
     youtube_client.playlists.return_value.list.assert_called_once_with(
         part="snippet",
         id="playlist1",
+        fields=api_module.PLAYLIST_INFO_FIELDS,
     )
 
 
@@ -303,6 +558,17 @@ def test_module_get_playlist_info(mock_get_service, youtube_client):
     assert info["description"] == "Description 1"
 
 
+@patch("src.youtubesorter.api.get_youtube_service")
+def test_module_functions_reuse_service(mock_get_service, youtube_client):
+    """Test the YouTube service is built once and shared by module functions."""
+    mock_get_service.return_value = youtube_client
+
+    get_playlist_videos("playlist1")
+    get_playlist_info("playlist1")
+
+    mock_get_service.assert_called_once()
+
+
 def test_get_playlist_videos_no_service():
     """Test getting videos when YouTube service is not available."""
     with patch("src.youtubesorter.api.get_youtube_service", return_value=None):
@@ -384,6 +650,15 @@ def test_batch_remove_videos_api_error(api, youtube_client):
     assert successful == ["vid1"]
 
 
+def test_batch_add_videos_uses_batch_requests(api, youtube_client):
+    """Test that inserts are sent in batch requests of at most 50."""
+    video_ids = [f"vid{i}" for i in range(120)]
+    successful = api.batch_add_videos_to_playlist("playlist1", video_ids)
+
+    assert successful == video_ids
+    assert youtube_client.new_batch_http_request.call_count == 3
+
+
 def test_get_playlist_videos_with_cache(api, youtube_client):
     """Test getting videos with cache enabled."""
     with patch("src.youtubesorter.api.get_youtube_service") as mock_service:
@@ -398,3 +673,69 @@ def test_get_playlist_videos_without_cache(api, youtube_client):
         mock_service.return_value = youtube_client
         videos = get_playlist_videos("playlist1", use_cache=False)
         assert len(videos) == 2
+
+
+def test_get_playlist_videos_revalidates_cached_pages(youtube_client, page_cache):
+    """Test that unchanged pages are reused after a 304 response."""
+    request = youtube_client.playlistItems.return_value.list.return_value
+    request.headers = {}
+    request.execute.return_value = {
+        "etag": "etag1",
+        "items": [
+            {
+                "contentDetails": {"videoId": "vid1"},
+                "snippet": {"title": "Video 1", "description": "Description 1"},
+            }
+        ],
+    }
+    api = YouTubeAPI(youtube_client, page_cache=page_cache)
+    assert [v["video_id"] for v in api.get_playlist_videos("playlist1")] == ["vid1"]
+    assert "If-None-Match" not in request.headers
+
+    # A later process has only the page cache to go on
+    api.clear_video_list_cache()
+    request.execute.side_effect = HttpError(MagicMock(status=304), b"")
+    assert [v["video_id"] for v in api.get_playlist_videos("playlist1")] == ["vid1"]
+    assert request.headers["If-None-Match"] == "etag1"
+
+    # Without the cache the request is unconditional and the 304 is an error
+    request.headers = {}
+    with pytest.raises(YouTubeError):
+        api.get_playlist_videos("playlist1", use_cache=False)
+    assert "If-None-Match" not in request.headers
+
+
+@patch("src.youtubesorter.quota.check_quota", return_value=(100, 9900))
+def test_get_quota_info(mock_check_quota, api):
+    """Test reporting quota usage."""
+    assert api.get_quota_info() == {
+        "quota_used": 100,
+        "quota_remaining": 9900,
+        "quota_limit": 10000,
+    }
+
+
+def test_page_cache_entries_expire(page_cache, youtube_client):
+    """Test that cached pages are stored with PAGE_CACHE_TTL."""
+    youtube_client.playlistItems.return_value.list.return_value.execute.return_value = {
+        "etag": "etag1",
+        "items": [],
+    }
+    api = YouTubeAPI(youtube_client, page_cache=page_cache)
+    with patch("src.youtubesorter.cache.time.time", return_value=1000.0):
+        api.get_playlist_videos("playlist1")
+
+    expiries = [entry["expiry_ts"] for entry in page_cache.cache.values()]
+    assert expiries == [1000.0 + api_module.PAGE_CACHE_TTL]
+
+
+@patch("src.youtubesorter.api.time.sleep")
+def test_batch_requests_are_paced(mock_sleep, api, youtube_client):
+    """Test that batch requests start API_REQUEST_INTERVAL seconds apart."""
+    with patch.object(api_module, "API_REQUEST_INTERVAL", 0.5), patch(
+        "src.youtubesorter.api.time.monotonic", return_value=100.0
+    ):
+        api.batch_add_videos_to_playlist("playlist1", [f"vid{i}" for i in range(120)])
+
+    assert youtube_client.new_batch_http_request.call_count == 3
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
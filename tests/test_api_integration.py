@@ -3,8 +3,9 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
-from src.youtubesorter.api import YouTubeAPI
+from src.youtubesorter.api import PLAYLIST_VIDEO_FIELDS, YouTubeAPI
 from src.youtubesorter.errors import PlaylistNotFoundError, YouTubeError
+from tests.fakes import FakeBatchHttpRequest
 
 
 class TestAPIIntegration(unittest.TestCase):
@@ -14,6 +15,7 @@ class TestAPIIntegration(unittest.TestCase):
         """Set up test fixtures."""
         # Mock only the YouTube service, not individual methods
         self.mock_youtube = MagicMock()
+        self.mock_youtube.new_batch_http_request.side_effect = FakeBatchHttpRequest
         self.api = YouTubeAPI(self.mock_youtube)
 
     def test_get_playlist_videos_complete_flow(self):
@@ -77,6 +79,7 @@ class TestAPIIntegration(unittest.TestCase):
             playlistId="test_playlist",
             maxResults=50,
             pageToken="token123",
+            fields=PLAYLIST_VIDEO_FIELDS,
         )
 
     def test_batch_move_videos_to_playlist(self):
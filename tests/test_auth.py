@@ -2,6 +2,7 @@
 
 import os
 import pickle
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch, mock_open
 
 import pytest
@@ -13,6 +14,13 @@ from src.youtubesorter.auth import get_youtube_service
 from src.youtubesorter import config
 
 
+@pytest.fixture(autouse=True)
+def client_secrets_file():
+    """Point the config at a client secrets file."""
+    with patch.object(config, "CLIENT_SECRETS_FILE", "client_secrets.json"):
+        yield
+
+
 @pytest.fixture
 def mock_credentials():
     """Create mock credentials."""
@@ -31,15 +39,15 @@ def test_get_youtube_service_no_secrets_file():
 
 @patch("src.youtubesorter.auth.build")
 @patch("os.path.exists")
-@patch("builtins.open", new_callable=mock_open)
-@patch("pickle.load")
+@patch("builtins.open", new_callable=mock_open, read_data="{}")
+@patch("src.youtubesorter.auth.Credentials.from_authorized_user_info")
 def test_get_youtube_service_existing_valid_creds(
-    mock_pickle_load, mock_file, mock_exists, mock_build, mock_credentials
+    mock_load_creds, mock_file, mock_exists, mock_build, mock_credentials
 ):
     """Test service creation with existing valid credentials."""
     # Mock existing valid credentials
     mock_exists.return_value = True
-    mock_pickle_load.return_value = mock_credentials
+    mock_load_creds.return_value = mock_credentials
     mock_youtube = MagicMock()
     mock_build.return_value = mock_youtube
 
@@ -53,18 +61,17 @@ def test_get_youtube_service_existing_valid_creds(
 
 @patch("src.youtubesorter.auth.build")
 @patch("os.path.exists")
-@patch("builtins.open", new_callable=mock_open)
-@patch("pickle.load")
-@patch("pickle.dump")
+@patch("builtins.open", new_callable=mock_open, read_data="{}")
+@patch("src.youtubesorter.auth.Credentials.from_authorized_user_info")
 def test_get_youtube_service_refresh_expired_creds(
-    mock_pickle_dump, mock_pickle_load, mock_file, mock_exists, mock_build, mock_credentials
+    mock_load_creds, mock_file, mock_exists, mock_build, mock_credentials
 ):
     """Test service creation with expired credentials that can be refreshed."""
     # Mock expired credentials that can be refreshed
     mock_credentials.valid = False
     mock_credentials.expired = True
     mock_exists.return_value = True
-    mock_pickle_load.return_value = mock_credentials
+    mock_load_creds.return_value = mock_credentials
     mock_youtube = MagicMock()
     mock_build.return_value = mock_youtube
 
@@ -75,19 +82,17 @@ def test_get_youtube_service_refresh_expired_creds(
     assert service == mock_youtube
     mock_credentials.refresh.assert_called_once()
     mock_build.assert_called_once_with("youtube", "v3", credentials=mock_credentials)
-    mock_pickle_dump.assert_called_once()
+    mock_file().write.assert_called_once_with(mock_credentials.to_json())
 
 
 @patch("src.youtubesorter.auth.build")
 @patch("os.path.exists")
-@patch("builtins.open", new_callable=mock_open)
-@patch("pickle.load")
-@patch("pickle.dump")
+@patch("builtins.open", new_callable=mock_open, read_data="{}")
+@patch("src.youtubesorter.auth.Credentials.from_authorized_user_info")
 @patch("google_auth_oauthlib.flow.InstalledAppFlow.from_client_secrets_file")
 def test_get_youtube_service_new_auth_flow(
     mock_flow,
-    mock_pickle_dump,
-    mock_pickle_load,
+    mock_load_creds,
     mock_file,
     mock_exists,
     mock_build,
@@ -96,7 +101,7 @@ def test_get_youtube_service_new_auth_flow(
     """Test service creation with new authentication flow."""
     # Mock new auth flow
     mock_exists.return_value = True
-    mock_pickle_load.return_value = None
+    mock_load_creds.return_value = None
     mock_flow.return_value.run_local_server.return_value = mock_credentials
     mock_youtube = MagicMock()
     mock_build.return_value = mock_youtube
@@ -108,21 +113,21 @@ def test_get_youtube_service_new_auth_flow(
     assert service == mock_youtube
     mock_flow.assert_called_once_with(config.CLIENT_SECRETS_FILE, config.YOUTUBE_SCOPES)
     mock_build.assert_called_once_with("youtube", "v3", credentials=mock_credentials)
-    mock_pickle_dump.assert_called_once()
+    mock_file().write.assert_called_once_with(mock_credentials.to_json())
 
 
 @patch("src.youtubesorter.auth.build")
 @patch("os.path.exists")
-@patch("builtins.open", new_callable=mock_open)
-@patch("pickle.load")
+@patch("builtins.open", new_callable=mock_open, read_data="{}")
+@patch("src.youtubesorter.auth.Credentials.from_authorized_user_info")
 @patch("google_auth_oauthlib.flow.InstalledAppFlow.from_client_secrets_file")
 def test_get_youtube_service_auth_flow_error(
-    mock_flow, mock_pickle_load, mock_file, mock_exists, mock_build
+    mock_flow, mock_load_creds, mock_file, mock_exists, mock_build
 ):
     """Test service creation when authentication flow fails."""
     # Mock auth flow error
     mock_exists.return_value = True
-    mock_pickle_load.return_value = None
+    mock_load_creds.return_value = None
     mock_flow.side_effect = Exception("Auth failed")
 
     # Call function
@@ -135,16 +140,15 @@ def test_get_youtube_service_auth_flow_error(
 
 @patch("src.youtubesorter.auth.build")
 @patch("os.path.exists")
-@patch("builtins.open", new_callable=mock_open)
-@patch("pickle.load")
-@patch("pickle.dump")
+@patch("builtins.open", new_callable=mock_open, read_data="{}")
+@patch("src.youtubesorter.auth.Credentials.from_authorized_user_info")
 def test_get_youtube_service_build_error(
-    mock_pickle_dump, mock_pickle_load, mock_file, mock_exists, mock_build, mock_credentials
+    mock_load_creds, mock_file, mock_exists, mock_build, mock_credentials
 ):
     """Test service creation when build fails."""
     # Mock build error
     mock_exists.return_value = True
-    mock_pickle_load.return_value = mock_credentials
+    mock_load_creds.return_value = mock_credentials
     mock_build.side_effect = Exception("Build failed")
 
     # Call function
@@ -157,14 +161,12 @@ def test_get_youtube_service_build_error(
 
 @patch("src.youtubesorter.auth.build")
 @patch("os.path.exists")
-@patch("builtins.open", new_callable=mock_open)
-@patch("pickle.load")
+@patch("builtins.open", new_callable=mock_open, read_data="{}")
+@patch("src.youtubesorter.auth.Credentials.from_authorized_user_info")
 @patch("os.makedirs")
-@patch("pickle.dump")
 def test_get_youtube_service_create_token_dir(
-    mock_pickle_dump,
     mock_makedirs,
-    mock_pickle_load,
+    mock_load_creds,
     mock_file,
     mock_exists,
     mock_build,
@@ -172,8 +174,9 @@ def test_get_youtube_service_create_token_dir(
 ):
     """Test service creation creates token directory if needed."""
     # Mock directory creation
-    mock_exists.side_effect = lambda path: path != config.TOKEN_FILE  # Token file doesn't exist
-    mock_pickle_load.return_value = None  # No existing credentials
+    # Token files don't exist
+    mock_exists.side_effect = lambda path: path not in (config.TOKEN_FILE, config.LEGACY_TOKEN_FILE)
+    mock_load_creds.return_value = None  # No existing credentials
     mock_flow = MagicMock()
     mock_flow.run_local_server.return_value = mock_credentials
     with patch(
@@ -189,4 +192,71 @@ def test_get_youtube_service_create_token_dir(
         # Verify results
         assert service == mock_youtube
         mock_makedirs.assert_called_once_with(os.path.dirname(config.TOKEN_FILE), exist_ok=True)
-        mock_pickle_dump.assert_called_once()
+        mock_file().write.assert_called_once_with(mock_credentials.to_json())
+
+
+@patch("src.youtubesorter.auth.build")
+@patch("os.path.exists")
+@patch("builtins.open", new_callable=mock_open, read_data="not json")
+@patch("google_auth_oauthlib.flow.InstalledAppFlow.from_client_secrets_file")
+def test_get_youtube_service_invalid_token_file(
+    mock_flow, mock_file, mock_exists, mock_build, mock_credentials
+):
+    """Test an unreadable token file falls back to the authentication flow."""
+    mock_exists.return_value = True
+    mock_flow.return_value.run_local_server.return_value = mock_credentials
+
+    service = get_youtube_service()
+
+    assert service == mock_build.return_value
+    mock_flow.assert_called_once_with(config.CLIENT_SECRETS_FILE, config.YOUTUBE_SCOPES)
+
+
+@pytest.fixture
+def token_files(tmp_path):
+    """Point the config at token files in a temporary directory."""
+    token_file = tmp_path / "token.json"
+    legacy_token_file = tmp_path / "token.pickle"
+    with patch.object(config, "TOKEN_FILE", str(token_file)), patch.object(
+        config, "LEGACY_TOKEN_FILE", str(legacy_token_file)
+    ):
+        yield token_file, legacy_token_file
+
+
+@patch("src.youtubesorter.auth.build")
+def test_get_youtube_service_migrates_pickled_token(mock_build, token_files):
+    """Test a token pickled by earlier versions is converted to JSON once."""
+    token_file, legacy_token_file = token_files
+    creds = Credentials(
+        token="token",
+        refresh_token="refresh",
+        client_id="client",
+        client_secret="secret",
+        token_uri="https://oauth2.googleapis.com/token",
+        expiry=datetime.utcnow() + timedelta(hours=1),
+    )
+    legacy_token_file.write_bytes(pickle.dumps(creds))
+
+    assert get_youtube_service() == mock_build.return_value
+
+    assert not legacy_token_file.exists()
+    loaded = Credentials.from_authorized_user_file(str(token_file))
+    assert loaded.refresh_token == "refresh"
+    assert mock_build.call_args[1]["credentials"].token == "token"
+
+
+@patch("src.youtubesorter.auth.build")
+@patch("google_auth_oauthlib.flow.InstalledAppFlow.from_client_secrets_file")
+def test_get_youtube_service_unreadable_pickled_token(
+    mock_flow, mock_build, token_files, mock_credentials, capsys
+):
+    """Test an unreadable pickled token explains why a new sign-in is needed."""
+    _, legacy_token_file = token_files
+    legacy_token_file.write_bytes(b"not a pickle")
+    mock_credentials.to_json.return_value = "{}"
+    mock_flow.return_value.run_local_server.return_value = mock_credentials
+
+    assert get_youtube_service() == mock_build.return_value
+
+    assert "you need to sign in again" in capsys.readouterr().out
+    mock_flow.assert_called_once_with(config.CLIENT_SECRETS_FILE, config.YOUTUBE_SCOPES)
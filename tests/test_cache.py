@@ -2,21 +2,20 @@
 
 import json
 import os
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import datetime
 from unittest.mock import MagicMock, patch, mock_open
 import pytest
 
+from src.youtubesorter import cache as cache_module
 from src.youtubesorter.cache import PlaylistCache, CacheStats
 
 
 @pytest.fixture
-def cache():
+def cache(tmp_path):
     """Create a PlaylistCache instance."""
-    cache = PlaylistCache(cache_file="data/cache/test_cache.json")
-    yield cache
-    # Clean up cache file after test
-    if os.path.exists("data/cache/test_cache.json"):
-        os.remove("data/cache/test_cache.json")
+    return PlaylistCache(cache_file=str(tmp_path / "test_cache.json"))
 
 
 def test_cache_stats_init():
@@ -39,10 +38,11 @@ def test_cache_stats_reset():
     assert stats.expired == 0
 
 
-def test_playlist_cache_init():
+def test_playlist_cache_init(tmp_path):
     """Test PlaylistCache initialization."""
-    cache = PlaylistCache(cache_file="data/cache/test_cache.json")
-    assert cache.cache_file == "data/cache/test_cache.json"
+    cache_file = str(tmp_path / "test_cache.json")
+    cache = PlaylistCache(cache_file=cache_file)
+    assert cache.cache_file == cache_file
     assert cache.cache == {}
     assert isinstance(cache.stats, CacheStats)
 
@@ -51,8 +51,16 @@ def test_playlist_cache_init_default():
     """Test PlaylistCache initialization with default path."""
     with patch("os.makedirs") as mock_makedirs:
         cache = PlaylistCache()
-        assert cache.cache_file == "data/cache/playlist_cache.json"
-        mock_makedirs.assert_called_once_with("data/cache", exist_ok=True)
+        assert cache.cache_file == os.path.join(cache_module.CACHE_DIR, "playlist_cache.json")
+        mock_makedirs.assert_called_once_with(cache_module.CACHE_DIR, exist_ok=True)
+
+
+def test_global_playlist_cache_created_on_first_use():
+    """Test the global playlist cache is created lazily and shared."""
+    with patch.object(cache_module, "_playlist_cache", None), patch("os.makedirs"):
+        cache = cache_module.get_playlist_cache()
+        assert isinstance(cache, PlaylistCache)
+        assert cache_module.playlist_cache is cache
 
 
 def test_playlist_cache_load_existing():
@@ -68,6 +76,29 @@ def test_playlist_cache_load_existing():
             assert cache.cache == cache_data
 
 
+def test_playlist_cache_load_legacy_expiry():
+    """Test ISO format expiry strings are converted to timestamps on load."""
+    expiry = datetime(2030, 1, 1, 12, 0, 0)
+    cache_data = {"key1": {"value": "test1", "expiry": expiry.isoformat()}}
+    with patch("builtins.open", mock_open(read_data=json.dumps(cache_data))):
+        with patch("os.path.exists", return_value=True):
+            cache = PlaylistCache()
+            assert cache.cache == {
+                "key1": {"value": "test1", "expiry_ts": expiry.timestamp()}
+            }
+
+
+def test_playlist_cache_load_deferred():
+    """Test that the cache file is not read until the cache is used."""
+    with patch.object(PlaylistCache, "_load_cache") as mock_load:
+        with patch("os.path.exists", return_value=True):
+            cache = PlaylistCache()
+            mock_load.assert_not_called()
+
+            cache.get("key1")
+            mock_load.assert_called_once()
+
+
 def test_playlist_cache_load_error():
     """Test error handling when loading cache."""
     with patch("builtins.open", mock_open()) as mock_file:
@@ -82,14 +113,43 @@ def test_playlist_cache_save():
     """Test saving cache to file."""
     cache = PlaylistCache()
     cache.cache = {"key1": {"value": "test1"}}
-    with patch("builtins.open", mock_open()) as mock_file:
+    with patch("builtins.open", mock_open()) as mock_file, patch("os.replace") as mock_replace:
         cache._save_cache()
+        mock_file.assert_called_with(cache.cache_file + ".tmp", "w", encoding="utf-8")
         handle = mock_file()
         # Get the actual data written to the file
         written_data = "".join(call.args[0] for call in handle.write.call_args_list)
         # Parse it back to compare
         actual_data = json.loads(written_data)
         assert actual_data == {"key1": {"value": "test1"}}
+        mock_replace.assert_called_once_with(cache.cache_file + ".tmp", cache.cache_file)
+
+
+def test_playlist_cache_save_round_trip(tmp_path):
+    """Test that a saved cache file loads back without leaving temp files."""
+    cache_file = str(tmp_path / "cache.json")
+    cache = PlaylistCache(cache_file=cache_file)
+    cache.set("key1", {"data": "test1"})
+    cache.flush()
+
+    assert os.listdir(tmp_path) == ["cache.json"]
+    assert PlaylistCache(cache_file=cache_file).get("key1") == {"data": "test1"}
+
+
+def test_playlist_cache_set_defers_save():
+    """Test that set() only writes the cache file on flush."""
+    cache = PlaylistCache(flush_interval=None)
+    with patch.object(cache, "_save_cache") as mock_save:
+        cache.set("key1", {"data": "test1"})
+        cache.set("key2", {"data": "test2"})
+        mock_save.assert_not_called()
+
+        cache.flush()
+        mock_save.assert_called_once()
+
+        # Nothing pending, so a second flush does not write
+        cache.flush()
+        mock_save.assert_called_once()
 
 
 def test_playlist_cache_save_error():
@@ -102,14 +162,12 @@ def test_playlist_cache_save_error():
 
 def test_playlist_cache_cleanup_expired():
     """Test cleaning up expired cache entries."""
-    now = datetime.now()
-    expired = (now - timedelta(seconds=10)).isoformat()
-    future = (now + timedelta(seconds=10)).isoformat()
+    now = time.time()
 
     cache = PlaylistCache()
     cache.cache = {
-        "expired": {"value": "test1", "expiry": expired},
-        "valid": {"value": "test2", "expiry": future},
+        "expired": {"value": "test1", "expiry_ts": now - 10},
+        "valid": {"value": "test2", "expiry_ts": now + 10},
         "no_expiry": {"value": "test3"},
     }
 
@@ -142,11 +200,8 @@ def test_playlist_cache_get_miss():
 
 def test_playlist_cache_get_expired():
     """Test getting expired cache entry."""
-    now = datetime.now()
-    expired = (now - timedelta(seconds=10)).isoformat()
-
     cache = PlaylistCache()
-    cache.cache = {"key1": {"value": "test1", "expiry": expired}}
+    cache.cache = {"key1": {"value": "test1", "expiry_ts": time.time() - 10}}
 
     with patch("builtins.open", mock_open()):
         value = cache.get("key1")
@@ -163,24 +218,28 @@ def test_playlist_cache_set():
     with patch("builtins.open", mock_open()):
         cache.set("key1", {"data": "test1"})
         assert cache.cache["key1"]["value"] == {"data": "test1"}
-        assert "expiry" not in cache.cache["key1"]
+        assert "expiry_ts" not in cache.cache["key1"]
 
 
 def test_playlist_cache_set_with_ttl():
     """Test setting cache entry with TTL."""
     cache = PlaylistCache()
     with patch("builtins.open", mock_open()):
-        with patch("datetime.datetime") as mock_datetime:
-            now = datetime.now()
-            mock_datetime.now.return_value = now
-
+        with patch("src.youtubesorter.cache.time.time", return_value=1000.0):
             cache.set("key1", {"data": "test1"}, ttl=60)
             assert cache.cache["key1"]["value"] == {"data": "test1"}
-            expected_expiry = now + timedelta(seconds=60)
-            actual_expiry = datetime.fromisoformat(cache.cache["key1"]["expiry"])
-            assert (
-                abs((actual_expiry - expected_expiry).total_seconds()) < 0.1
-            )  # Allow 0.1s difference
+            assert cache.cache["key1"]["expiry_ts"] == 1060.0
+
+
+def test_playlist_cache_max_entries(tmp_path):
+    """Test that the entries set longest ago are dropped past max_entries."""
+    cache = PlaylistCache(cache_file=str(tmp_path / "cache.json"), max_entries=2)
+    cache.set("key1", {"data": "test1"})
+    cache.set("key2", {"data": "test2"})
+    cache.set("key1", {"data": "test1b"})
+    cache.set("key3", {"data": "test3"})
+
+    assert list(cache.cache) == ["key1", "key3"]
 
 
 def test_playlist_cache_invalidate():
@@ -192,6 +251,29 @@ def test_playlist_cache_invalidate():
         assert "key1" not in cache.cache
 
 
+def test_playlist_cache_invalidate_concurrent(cache):
+    """Test that racing invalidations of one key do not raise."""
+    cache.set("key1", {"data": "test1"})
+    errors = []
+
+    def invalidate():
+        try:
+            for _ in range(1000):
+                cache.invalidate("key1")
+                cache.get("key1")
+        except Exception as e:  # pylint: disable=broad-except
+            errors.append(e)
+
+    threads = [threading.Thread(target=invalidate) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert "key1" not in cache.cache
+
+
 def test_playlist_cache_invalidate_nonexistent():
     """Test invalidating nonexistent cache entry."""
     cache = PlaylistCache()
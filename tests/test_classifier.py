@@ -1,9 +1,15 @@
 """Test cases for video classification."""
 
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase, main
 from unittest.mock import patch, MagicMock
 
 from src.youtubesorter import classifier
+from src.youtubesorter.cache import PlaylistCache
+from src.youtubesorter.errors import YouTubeError
 
 
 class TestClassifier(TestCase):
@@ -30,11 +36,22 @@ class TestClassifier(TestCase):
         ]
         self.filter_prompt = "Videos about programming"
 
+        # Use an empty result cache for each test
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.result_cache = PlaylistCache(
+            cache_file=os.path.join(self.temp_dir.name, "classification_cache.json"),
+            flush_interval=None,
+        )
+        cache_patch = patch.object(classifier, "_result_cache", self.result_cache)
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+
     @patch("src.youtubesorter.classifier.client")
     def test_classification_with_descriptions(self, mock_client):
         """Test that classification uses both title and description."""
         mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content="yes\nno\nyes"))]
+        mock_response.choices = [MagicMock(message=MagicMock(content="1:yes\n2:no\n3:yes"))]
         mock_client.chat.completions.create.return_value = mock_response
 
         results = classifier.classify_videos(self.test_videos, self.filter_prompt)
@@ -58,7 +75,7 @@ class TestClassifier(TestCase):
         ]
 
         mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content="yes\nno"))]
+        mock_response.choices = [MagicMock(message=MagicMock(content="1:yes\n2:no"))]
         mock_client.chat.completions.create.return_value = mock_response
 
         results = classifier.classify_video_titles(videos, self.filter_prompt)
@@ -86,7 +103,7 @@ class TestClassifier(TestCase):
         ]
 
         mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content="yes\nno"))]
+        mock_response.choices = [MagicMock(message=MagicMock(content="1:yes\n2:no"))]
         mock_client.chat.completions.create.return_value = mock_response
 
         results = classifier.classify_video_titles(videos, self.filter_prompt)
@@ -98,5 +115,259 @@ class TestClassifier(TestCase):
         self.assertEqual(results, [True, False])
 
 
+    @patch("src.youtubesorter.classifier.client")
+    def test_classification_split_into_chunks(self, mock_client):
+        """Test that large inputs are classified in concurrent chunks."""
+        videos = [
+            {"video_id": f"video{i}", "title": f"Video {i}", "description": ""}
+            for i in range(45)
+        ]
+
+        def respond(**kwargs):
+            count = kwargs["messages"][1]["content"].count("Title: ")
+            content = "\n".join(f"{i}:yes" for i in range(1, count + 1))
+            return MagicMock(choices=[MagicMock(message=MagicMock(content=content))])
+
+        mock_client.chat.completions.create.side_effect = respond
+
+        results = classifier.classify_videos(videos, self.filter_prompt, items_per_request=20)
+
+        self.assertEqual(mock_client.chat.completions.create.call_count, 3)
+        self.assertEqual(results, [True] * 45)
+
+    @patch("src.youtubesorter.classifier.INPUT_TOKEN_BUDGET", 300)
+    @patch("src.youtubesorter.classifier.client")
+    def test_classification_packed_by_token_budget(self, mock_client):
+        """Test that long descriptions get fewer videos per request."""
+        videos = [
+            {"video_id": f"video{i}", "title": f"Video {i}", "description": "word " * 100}
+            for i in range(6)
+        ]
+
+        def respond(**kwargs):
+            count = kwargs["messages"][1]["content"].count("Title: ")
+            content = "\n".join(f"{i}:no" for i in range(1, count + 1))
+            return MagicMock(choices=[MagicMock(message=MagicMock(content=content))])
+
+        mock_client.chat.completions.create.side_effect = respond
+
+        results = classifier.classify_videos(videos, self.filter_prompt, use_cache=False)
+
+        self.assertEqual(results, [False] * 6)
+        self.assertGreater(mock_client.chat.completions.create.call_count, 1)
+        for call in mock_client.chat.completions.create.call_args_list:
+            prompt = call[1]["messages"][1]["content"]
+            self.assertLessEqual(classifier._count_tokens(prompt, "gpt-4o-mini"), 300)
+
+    @patch("src.youtubesorter.classifier.client")
+    def test_classification_parses_indexed_answers(self, mock_client):
+        """Test that answers are matched by index, in any order."""
+        mock_response = MagicMock()
+        mock_response.choices = [
+            MagicMock(message=MagicMock(content="Here you go:\n3: YES\n1:no\n2: No\n"))
+        ]
+        mock_client.chat.completions.create.return_value = mock_response
+
+        results = classifier.classify_videos(self.test_videos, self.filter_prompt)
+
+        prompt = mock_client.chat.completions.create.call_args[1]["messages"][1]["content"]
+        self.assertIn("[2] Title: Cat Video", prompt)
+        self.assertEqual(results, [False, False, True])
+
+    @patch("src.youtubesorter.classifier.client")
+    def test_classification_model_and_token_cap(self, mock_client):
+        """Test that the model is passed through and output tokens are capped."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="1:yes\n2:no\n3:yes"))]
+        mock_client.chat.completions.create.return_value = mock_response
+
+        classifier.classify_videos(self.test_videos, self.filter_prompt, model="gpt-4o")
+
+        call_args = mock_client.chat.completions.create.call_args[1]
+        self.assertEqual(call_args["model"], "gpt-4o")
+        self.assertEqual(call_args["max_tokens"], 18)
+
+    @patch("src.youtubesorter.classifier.client")
+    def test_classification_deduplicates_videos(self, mock_client):
+        """Test that identical videos are sent once and share the answer."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="1:yes\n2:no"))]
+        mock_client.chat.completions.create.return_value = mock_response
+        videos = [
+            {"video_id": "video1", "title": "Python Tutorial", "description": "Learn"},
+            {"video_id": "video2", "title": "Cat Video", "description": ""},
+            {"video_id": "video3", "title": " python tutorial ", "description": "learn "},
+        ]
+
+        results = classifier.classify_videos(videos, self.filter_prompt, use_cache=False)
+
+        self.assertEqual(results, [True, False, True])
+        prompt = mock_client.chat.completions.create.call_args[1]["messages"][1]["content"]
+        self.assertEqual(prompt.count("Title: "), 2)
+
+    @patch("src.youtubesorter.classifier.client")
+    def test_classification_uses_result_cache(self, mock_client):
+        """Test that previously classified videos are not sent again."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="1:yes\n2:no\n3:yes"))]
+        mock_client.chat.completions.create.return_value = mock_response
+        classifier.classify_videos(self.test_videos, self.filter_prompt)
+
+        new_video = {"video_id": "video4", "title": "Rust Tutorial", "description": ""}
+        mock_response.choices = [MagicMock(message=MagicMock(content="1:yes"))]
+        results = classifier.classify_videos(
+            self.test_videos + [new_video], self.filter_prompt
+        )
+
+        self.assertEqual(results, [True, False, True, True])
+        self.assertEqual(mock_client.chat.completions.create.call_count, 2)
+        prompt = mock_client.chat.completions.create.call_args[1]["messages"][1]["content"]
+        self.assertIn("Rust Tutorial", prompt)
+        self.assertNotIn("Cat Video", prompt)
+
+    @patch("src.youtubesorter.classifier.client")
+    def test_concurrent_callers_share_worker_pool(self, mock_client):
+        """Test that concurrent classify_videos calls use one shared pool."""
+        videos = [
+            {"video_id": f"video{i}", "title": f"Video {i}", "description": ""}
+            for i in range(4)
+        ]
+        mock_client.chat.completions.create.return_value = MagicMock(
+            choices=[MagicMock(message=MagicMock(content="1:yes\n2:no"))]
+        )
+
+        with ThreadPoolExecutor(max_workers=2) as callers:
+            results = list(
+                callers.map(
+                    lambda prompt: classifier.classify_videos(
+                        videos, prompt, items_per_request=2
+                    ),
+                    ["prompt 1", "prompt 2"],
+                )
+            )
+
+        self.assertEqual(results, [[True, False, True, False]] * 2)
+        self.assertIs(classifier._get_executor(), classifier._get_executor())
+        self.assertEqual(mock_client.chat.completions.create.call_count, 4)
+
+    @patch("src.youtubesorter.classifier.time.sleep")
+    @patch("src.youtubesorter.classifier.client")
+    def test_classification_batch_api(self, mock_client, mock_sleep):
+        """Test classification through the OpenAI Batch API."""
+        mock_client.files.create.return_value = MagicMock(id="file-in")
+        mock_client.batches.create.return_value = MagicMock(id="batch-1")
+        mock_client.batches.retrieve.side_effect = [
+            MagicMock(status="in_progress"),
+            MagicMock(status="completed", output_file_id="file-out"),
+        ]
+        output = [
+            {
+                "custom_id": "1",
+                "response": {
+                    "status_code": 200,
+                    "body": {"choices": [{"message": {"content": "1:yes"}}]},
+                },
+            },
+            {
+                "custom_id": "0",
+                "response": {
+                    "status_code": 200,
+                    "body": {"choices": [{"message": {"content": "1:no\n2:yes"}}]},
+                },
+            },
+        ]
+        mock_client.files.content.return_value.text = "\n".join(json.dumps(o) for o in output)
+        on_submit = MagicMock()
+
+        results = classifier.classify_videos_batch(
+            self.test_videos, self.filter_prompt, items_per_request=2, on_submit=on_submit
+        )
+
+        self.assertEqual(results, [False, True, True])
+        on_submit.assert_called_once_with("batch-1")
+        mock_client.batches.create.assert_called_once_with(
+            input_file_id="file-in",
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        mock_sleep.assert_called_once()
+
+    @patch("src.youtubesorter.classifier.client")
+    def test_classification_batch_api_resume(self, mock_client):
+        """Test waiting on a previously submitted batch."""
+        mock_client.batches.retrieve.return_value = MagicMock(status="expired")
+
+        with self.assertRaises(YouTubeError):
+            classifier.classify_videos_batch(
+                self.test_videos, self.filter_prompt, batch_id="batch-1"
+            )
+
+        mock_client.files.create.assert_not_called()
+        mock_client.batches.retrieve.assert_called_once_with("batch-1")
+
+    @patch("src.youtubesorter.classifier.client")
+    def test_blank_filter_prompt_matches_everything(self, mock_client):
+        """Test that a blank filter prompt skips the OpenAI call."""
+        self.assertEqual(classifier.classify_videos(self.test_videos, "  \n"), [True] * 3)
+        mock_client.chat.completions.create.assert_not_called()
+
+    @patch("src.youtubesorter.classifier.client")
+    def test_classification_missing_answers(self, mock_client):
+        """Test that a response without an answer for every video is an error."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="1:yes\n2:no"))]
+        mock_client.chat.completions.create.return_value = mock_response
+
+        with self.assertRaises(YouTubeError):
+            classifier.classify_videos(self.test_videos, self.filter_prompt, use_cache=False)
+
+    @patch("src.youtubesorter.classifier.client")
+    def test_cached_results_expire(self, mock_client):
+        """Test that cached results carry an expiry and failed replies are not cached."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="1:yes"))]
+        mock_client.chat.completions.create.return_value = mock_response
+
+        with self.assertRaises(YouTubeError):
+            classifier.classify_videos(self.test_videos, self.filter_prompt)
+        self.assertEqual(self.result_cache.cache, {})
+
+        mock_response.choices = [MagicMock(message=MagicMock(content="1:yes\n2:no\n3:yes"))]
+        with patch("src.youtubesorter.cache.time.time", return_value=1000.0):
+            classifier.classify_videos(self.test_videos, self.filter_prompt)
+
+        expiries = {entry["expiry_ts"] for entry in self.result_cache.cache.values()}
+        self.assertEqual(expiries, {1000.0 + classifier.RESULT_CACHE_TTL})
+
+    def test_result_cache_removes_legacy_file(self):
+        """Test that the earlier result cache file is removed when the cache opens."""
+        legacy_file = os.path.join(self.temp_dir.name, "legacy.json")
+        with open(legacy_file, "w", encoding="utf-8") as f:
+            f.write("{}")
+
+        with patch.object(classifier, "_result_cache", None), patch.object(
+            classifier, "LEGACY_RESULT_CACHE_FILE", legacy_file
+        ), patch.object(
+            classifier, "RESULT_CACHE_FILE", os.path.join(self.temp_dir.name, "results.json")
+        ):
+            classifier._get_result_cache()
+
+        self.assertFalse(os.path.exists(legacy_file))
+
+    @patch("src.youtubesorter.classifier.client")
+    def test_classify_video_titles_ignores_descriptions(self, mock_client):
+        """Test that titles-only classification leaves descriptions out."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="1:yes\n2:no\n3:yes"))]
+        mock_client.chat.completions.create.return_value = mock_response
+
+        classifier.classify_video_titles(self.test_videos, self.filter_prompt)
+
+        prompt = mock_client.chat.completions.create.call_args[1]["messages"][1]["content"]
+        self.assertNotIn("Learn Python programming basics", prompt)
+        self.assertEqual(prompt.count("Description: (No description)"), 3)
+        self.assertEqual(self.test_videos[0]["description"], "Learn Python programming basics")
+
+
 if __name__ == "__main__":
     main()
@@ -245,3 +245,55 @@ def test_classify_command_run_with_playlist_error(mock_recovery_manager, mock_yo
         target_playlists=["target1"],
     )
     assert not cmd._run()  # Should return False for playlist-level errors
+
+
+@patch("src.youtubesorter.commands.classify.RecoveryManager")
+def test_classify_command_run_batches_state_saves(mock_recovery_manager, mock_youtube):
+    """Test that recovery state is not saved after every video."""
+    mock_recovery = MagicMock()
+    mock_recovery.processed_videos = set()
+    mock_recovery.failed_videos = set()
+    videos = [{"video_id": f"vid{i}", "title": f"Test Video {i}"} for i in range(3)]
+    mock_recovery.get_remaining_videos.return_value = videos
+    mock_recovery_manager.return_value.__enter__.return_value = mock_recovery
+
+    mock_youtube.get_playlist_videos.return_value = videos
+
+    cmd = ClassifyCommand(
+        youtube=mock_youtube,
+        source_playlist_id="source123",
+        target_playlists=["target1"],
+        dry_run=True,
+    )
+    assert cmd._run()
+
+    # One save after loading the playlist; the rest is left to the context manager exit
+    mock_recovery.save_state.assert_called_once()
+
+
+@patch("src.youtubesorter.commands.classify.RecoveryManager")
+def test_classify_command_run_adds_batches(mock_recovery_manager, mock_youtube):
+    """Test that videos are added per batch and finished videos are skipped."""
+    mock_recovery = MagicMock()
+    mock_recovery.processed_videos = {"vid0"}
+    mock_recovery.failed_videos = set()
+    mock_recovery.videos = {}
+    mock_recovery_manager.return_value.__enter__.return_value = mock_recovery
+
+    videos = [{"video_id": f"vid{i}", "title": f"Test Video {i}"} for i in range(4)]
+    mock_youtube.get_playlist_videos.return_value = videos
+    mock_youtube.batch_add_videos_to_playlist.return_value = ["vid1", "vid3"]
+
+    cmd = ClassifyCommand(
+        youtube=mock_youtube,
+        source_playlist_id="source123",
+        target_playlists=["target1"],
+    )
+    assert cmd._run()
+
+    mock_youtube.batch_add_videos_to_playlist.assert_called_once_with(
+        ["vid1", "vid2", "vid3"], "target1"
+    )
+    assert mock_recovery.processed_videos == {"vid0", "vid1", "vid3"}
+    assert mock_recovery.failed_videos == {"vid2"}
+    assert set(mock_recovery.videos) == {"vid0", "vid1", "vid2", "vid3"}
@@ -35,97 +35,100 @@ class TestClearPlaylist(unittest.TestCase):
         with self.assertRaises(SystemExit):
             parser.parse_args([])
 
-    @patch("src.youtubesorter.clear_playlist.api.get_playlist_videos")
     @patch("src.youtubesorter.clear_playlist.api.YouTubeAPI")
     @patch("builtins.input", return_value="yes")
-    def test_clear_playlist_success(self, mock_input, mock_api_class, mock_get_videos):
+    def test_clear_playlist_success(self, mock_input, mock_api_class):
         """Test successful playlist clearing."""
         # Setup mocks
-        mock_get_videos.return_value = self.test_videos
-        mock_api = MagicMock()
+        mock_api = mock_api_class.return_value
+        mock_api.iter_playlist_videos.return_value = iter(self.test_videos)
         mock_api.batch_remove_videos_from_playlist.return_value = [
             "vid1",
             "vid2",
             "vid3",
         ]  # All videos removed successfully
-        mock_api_class.return_value = mock_api
 
         # Execute
         result = clear_playlist(self.youtube, self.playlist_id)
 
         # Verify
         self.assertTrue(result)
-        mock_get_videos.assert_called_once_with(self.youtube, self.playlist_id)
+        mock_api_class.assert_called_once_with(self.youtube)
+        mock_api.iter_playlist_videos.assert_called_once_with(self.playlist_id)
         mock_api.batch_remove_videos_from_playlist.assert_called_once_with(
             self.playlist_id, ["vid1", "vid2", "vid3"]
         )
         mock_input.assert_called_once()
 
-    @patch("src.youtubesorter.clear_playlist.api.get_playlist_videos")
+    @patch("src.youtubesorter.clear_playlist.api.YouTubeAPI")
     @patch("builtins.input", return_value="no")
-    def test_clear_playlist_cancelled(self, mock_input, mock_get_videos):
+    def test_clear_playlist_cancelled(self, mock_input, mock_api_class):
         """Test cancellation of playlist clearing."""
         # Setup
-        mock_get_videos.return_value = self.test_videos
+        mock_api = mock_api_class.return_value
+        mock_api.iter_playlist_videos.return_value = iter(self.test_videos)
 
         # Execute
         result = clear_playlist(self.youtube, self.playlist_id)
 
         # Verify
         self.assertFalse(result)
-        mock_get_videos.assert_called_once()
+        mock_api.iter_playlist_videos.assert_called_once()
+        mock_api.batch_remove_videos_from_playlist.assert_not_called()
         mock_input.assert_called_once()
 
-    @patch("src.youtubesorter.clear_playlist.api.get_playlist_videos")
-    def test_clear_playlist_empty(self, mock_get_videos):
+    @patch("src.youtubesorter.clear_playlist.api.YouTubeAPI")
+    @patch("builtins.input")
+    def test_clear_playlist_empty(self, mock_input, mock_api_class):
         """Test clearing empty playlist."""
         # Setup
-        mock_get_videos.return_value = []
+        mock_api = mock_api_class.return_value
+        mock_api.iter_playlist_videos.return_value = iter([])
 
         # Execute
         result = clear_playlist(self.youtube, self.playlist_id)
 
         # Verify
         self.assertTrue(result)
-        mock_get_videos.assert_called_once()
+        mock_api.iter_playlist_videos.assert_called_once()
+        mock_input.assert_not_called()
 
-    @patch("src.youtubesorter.clear_playlist.api.get_playlist_videos")
     @patch("src.youtubesorter.clear_playlist.api.YouTubeAPI")
     @patch("builtins.input", return_value="yes")
-    def test_clear_playlist_partial_success(self, mock_input, mock_api_class, mock_get_videos):
+    def test_clear_playlist_partial_success(self, mock_input, mock_api_class):
         """Test partial success in clearing playlist."""
         # Setup
-        mock_get_videos.return_value = self.test_videos
-        mock_api = MagicMock()
+        mock_api = mock_api_class.return_value
+        mock_api.iter_playlist_videos.return_value = iter(self.test_videos)
         mock_api.batch_remove_videos_from_playlist.return_value = [
             "vid1",
             "vid2",
         ]  # Only 2 videos removed successfully
-        mock_api_class.return_value = mock_api
 
         # Execute
         result = clear_playlist(self.youtube, self.playlist_id)
 
         # Verify
         self.assertTrue(result)  # Still returns True as operation completed
-        mock_get_videos.assert_called_once()
+        mock_api.iter_playlist_videos.assert_called_once()
         mock_api.batch_remove_videos_from_playlist.assert_called_once_with(
             self.playlist_id, ["vid1", "vid2", "vid3"]
         )
         mock_input.assert_called_once()
 
-    @patch("src.youtubesorter.clear_playlist.api.get_playlist_videos")
-    def test_clear_playlist_api_error(self, mock_get_videos):
+    @patch("src.youtubesorter.clear_playlist.api.YouTubeAPI")
+    def test_clear_playlist_api_error(self, mock_api_class):
         """Test handling of API errors."""
         # Setup
-        mock_get_videos.side_effect = Exception("API Error")
+        mock_api = mock_api_class.return_value
+        mock_api.iter_playlist_videos.side_effect = Exception("API Error")
 
         # Execute
         result = clear_playlist(self.youtube, self.playlist_id)
 
         # Verify
         self.assertFalse(result)
-        mock_get_videos.assert_called_once()
+        mock_api.iter_playlist_videos.assert_called_once()
 
     @patch("src.youtubesorter.clear_playlist.auth.get_youtube_service")
     @patch("src.youtubesorter.clear_playlist.clear_playlist")
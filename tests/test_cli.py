@@ -16,6 +16,9 @@ class TestCLI(TestCase):
         patcher = patch("src.youtubesorter.cli.logger", self.mock_logger)
         patcher.start()
         self.addCleanup(patcher.stop)
+        patcher = patch("src.youtubesorter.classifier.prewarm")
+        self.mock_prewarm = patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_list_destinations_no_state(self):
         """Test listing destinations with no recovery state."""
@@ -44,7 +47,7 @@ class TestCLI(TestCase):
         mock_recovery_manager = MagicMock(return_value=mock_manager)
 
         with patch("src.youtubesorter.utils.find_latest_state", return_value="state.json"):
-            with patch("src.youtubesorter.cli.RecoveryManager", mock_recovery_manager):
+            with patch("src.youtubesorter.recovery.RecoveryManager", mock_recovery_manager):
                 cli.list_recovery_destinations("playlist123", "filter")
 
                 # Verify logger calls
@@ -81,6 +84,17 @@ class TestCLI(TestCase):
                     "Command failed: %s", "Failed to get YouTube service"
                 )
 
+    def test_main_filter_prewarms_openai_connection(self):
+        """Test that the filter command connects to OpenAI in the background."""
+        args = ["filter", "source123", "target456", "test prompt"]
+
+        with patch("sys.argv", ["youtubesorter"] + args):
+            with patch("src.youtubesorter.auth.get_youtube_service", return_value=None):
+                with patch("src.youtubesorter.cli.threading.Thread") as mock_thread:
+                    cli.main()
+                    mock_thread.assert_called_once_with(target=self.mock_prewarm, daemon=True)
+                    mock_thread.return_value.start.assert_called_once()
+
     def test_main_filter_with_resume_destination(self):
         """Test filter command with resume-destination option."""
         args = [
@@ -247,6 +261,8 @@ class TestCLI(TestCase):
         # Test quota command
         args = parser.parse_args(["quota"])
         self.assertEqual(args.command, "quota")
+        self.assertFalse(args.no_cache)
+        self.assertTrue(parser.parse_args(["quota", "--no-cache"]).no_cache)
 
         # Test undo command
         args = parser.parse_args(["undo"])
@@ -269,6 +285,16 @@ class TestCLI(TestCase):
                     result = cli.main()
                     self.assertEqual(result, 0)
 
+    def test_main_quota_command_no_cache(self):
+        """Test that --no-cache makes the quota command fetch a fresh reading."""
+        with patch("sys.argv", ["youtubesorter", "quota", "--no-cache"]):
+            with patch("src.youtubesorter.auth.get_youtube_service", return_value=MagicMock()):
+                with patch("src.youtubesorter.quota.check_quota", return_value=(0, 10000)):
+                    with patch("src.youtubesorter.commands.quota.QuotaCommand") as mock_command:
+                        mock_command.return_value.run.return_value = True
+                        self.assertEqual(cli.main(), 0)
+        self.assertFalse(mock_command.call_args[1]["use_cache"])
+
     def test_main_undo_command_success(self):
         """Test successful undo command execution."""
         args = ["undo", "--verbose"]
@@ -324,7 +350,7 @@ class TestCLI(TestCase):
             mock_manager = MagicMock()
             mock_manager.operation_type = "move"
 
-            with patch("src.youtubesorter.cli.RecoveryManager", return_value=mock_manager):
+            with patch("src.youtubesorter.recovery.RecoveryManager", return_value=mock_manager):
                 with self.assertRaises(ValueError):
                     cli.list_recovery_destinations("playlist123", "filter")
 
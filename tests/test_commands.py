@@ -141,14 +141,11 @@ class TestMoveCommand(unittest.TestCase):
         mock_manager = MagicMock()
         mock_manager.destination_metadata = {"other_dest": {}}
 
-        with patch("glob.glob") as mock_glob:
-            mock_glob.return_value = ["state.json"]
-            with patch("os.path.getmtime") as mock_getmtime:
-                mock_getmtime.return_value = 123456789
-                with patch("src.youtubesorter.recovery.RecoveryManager", return_value=mock_manager):
-                    with self.assertRaises(ValueError) as ctx:
-                        self.command.validate()
-                    self.assertIn("not found in recovery state", str(ctx.exception))
+        with patch("src.youtubesorter.commands.move.find_latest_state", return_value="state.json"):
+            with patch("src.youtubesorter.recovery.RecoveryManager", return_value=mock_manager):
+                with self.assertRaises(ValueError) as ctx:
+                    self.command.validate()
+                self.assertIn("not found in recovery state", str(ctx.exception))
 
     def test_validate_resume_destination_already_completed(self) -> None:
         """Test validation when specified destination is already completed."""
@@ -261,14 +258,13 @@ class TestFilterCommand(unittest.TestCase):
         mock_manager = MagicMock()
         mock_manager.destination_metadata = {"other_dest": {}}
 
-        with patch("glob.glob") as mock_glob:
-            mock_glob.return_value = ["state.json"]
-            with patch("os.path.getmtime") as mock_getmtime:
-                mock_getmtime.return_value = 123456789
-                with patch("src.youtubesorter.recovery.RecoveryManager", return_value=mock_manager):
-                    with self.assertRaises(ValueError) as ctx:
-                        self.command.validate()
-                    self.assertIn("not found in recovery state", str(ctx.exception))
+        with patch(
+            "src.youtubesorter.commands.filter.find_latest_state", return_value="state.json"
+        ):
+            with patch("src.youtubesorter.recovery.RecoveryManager", return_value=mock_manager):
+                with self.assertRaises(ValueError) as ctx:
+                    self.command.validate()
+                self.assertIn("not found in recovery state", str(ctx.exception))
 
     def test_validate_resume_destination_already_completed(self) -> None:
         """Test validation when specified destination is already completed."""
@@ -2,15 +2,24 @@
 
 import argparse
 import json
+import os
 import unittest
 from unittest.mock import MagicMock, patch, mock_open
 
 import pytest
 
-from src.youtubesorter import common
+from src.youtubesorter import common, utils
 from src.youtubesorter.api import YouTubeAPI
 
 
+@pytest.fixture(autouse=True)
+def clear_scan_cache():
+    """Start each test without cached state file scans."""
+    utils.clear_scan_cache()
+    yield
+    utils.clear_scan_cache()
+
+
 @pytest.fixture
 def youtube_client():
     """Create a mock YouTube client."""
@@ -43,21 +52,20 @@ def test_classify_video_titles():
         mock_classify.assert_called_once_with(videos, filter_prompt)
 
 
-def test_find_latest_state():
+def test_find_latest_state(tmp_path):
     """Test finding latest state file."""
-    with patch("src.youtubesorter.common.glob") as mock_glob:
+    with patch("src.youtubesorter.common.STATE_DIR", str(tmp_path)):
         # Test with no state files
-        mock_glob.return_value = []
         assert common.find_latest_state("playlist1") is None
+        utils.clear_scan_cache()
 
         # Test with multiple state files
-        mock_glob.return_value = [
-            "data/state/youtubesorter_playlist1_1.json",
-            "data/state/youtubesorter_playlist1_2.json",
-        ]
-        with patch("os.path.getctime") as mock_getctime:
-            mock_getctime.side_effect = lambda x: 2 if x.endswith("2.json") else 1
-            assert common.find_latest_state("playlist1") == "data/state/youtubesorter_playlist1_2.json"
+        for name in ("youtubesorter_playlist1_1.json", "youtubesorter_playlist1_2.json"):
+            (tmp_path / name).write_text("{}", encoding="utf-8")
+        (tmp_path / "youtubesorter_playlist2_3.json").write_text("{}", encoding="utf-8")
+        assert common.find_latest_state("playlist1") == str(
+            tmp_path / "youtubesorter_playlist1_2.json"
+        )
 
 
 def test_add_common_arguments():
@@ -117,44 +125,44 @@ def test_log_operation_summary(caplog):
 
 def test_process_videos_no_source_videos(youtube_api):
     """Test processing videos when source playlist is empty."""
-    youtube_api.get_playlist_videos.return_value = []
+    youtube_api.iter_playlist_videos.return_value = []
     result = common.process_videos(youtube_api, "source", "target", "filter")
     assert result == ([], [], [])
-    youtube_api.get_playlist_videos.assert_called_once_with("source")
+    youtube_api.iter_playlist_videos.assert_called_once_with("source")
     youtube_api.batch_move_videos_to_playlist.assert_not_called()
 
 
 def test_process_videos_no_matches(youtube_api):
     """Test processing videos when no videos match filter."""
-    youtube_api.get_playlist_videos.return_value = [{"video_id": "vid1", "title": "Video 1"}]
+    youtube_api.iter_playlist_videos.return_value = [{"video_id": "vid1", "title": "Video 1"}]
     with patch("src.youtubesorter.common.classify_video_titles") as mock_classify:
         mock_classify.return_value = [False]
         result = common.process_videos(youtube_api, "source", "target", "filter")
         assert result == ([], [], [])
-        youtube_api.get_playlist_videos.assert_called_once_with("source")
+        youtube_api.iter_playlist_videos.assert_called_once_with("source")
         youtube_api.batch_move_videos_to_playlist.assert_not_called()
 
 
 def test_process_videos_dry_run(youtube_api):
     """Test processing videos in dry run mode."""
-    youtube_api.get_playlist_videos.return_value = [{"video_id": "vid1", "title": "Video 1"}]
+    youtube_api.iter_playlist_videos.return_value = [{"video_id": "vid1", "title": "Video 1"}]
     with patch("src.youtubesorter.common.classify_video_titles") as mock_classify:
         mock_classify.return_value = [True]
         result = common.process_videos(youtube_api, "source", "target", "filter", dry_run=True)
         assert result == (["vid1"], [], [])
-        youtube_api.get_playlist_videos.assert_called_once_with("source")
+        youtube_api.iter_playlist_videos.assert_called_once_with("source")
         youtube_api.batch_move_videos_to_playlist.assert_not_called()
 
 
 def test_process_videos_move_success(youtube_api):
     """Test successful video move."""
-    youtube_api.get_playlist_videos.return_value = [{"video_id": "vid1", "title": "Video 1"}]
+    youtube_api.iter_playlist_videos.return_value = [{"video_id": "vid1", "title": "Video 1"}]
     youtube_api.batch_move_videos_to_playlist.return_value = ["vid1"]
     with patch("src.youtubesorter.common.classify_video_titles") as mock_classify:
         mock_classify.return_value = [True]
         result = common.process_videos(youtube_api, "source", "filter", "target")
         assert result == (["vid1"], [], [])
-        youtube_api.get_playlist_videos.assert_called_once_with("source")
+        youtube_api.iter_playlist_videos.assert_called_once_with("source")
         youtube_api.batch_move_videos_to_playlist.assert_called_once_with(
             "source", "target", ["vid1"]
         )
@@ -162,7 +170,7 @@ def test_process_videos_move_success(youtube_api):
 
 def test_process_videos_move_partial_failure(youtube_api):
     """Test partial failure when moving videos."""
-    youtube_api.get_playlist_videos.return_value = [
+    youtube_api.iter_playlist_videos.return_value = [
         {"video_id": "vid1", "title": "Video 1"},
         {"video_id": "vid2", "title": "Video 2"},
     ]
@@ -171,30 +179,65 @@ def test_process_videos_move_partial_failure(youtube_api):
         mock_classify.return_value = [True, True]
         result = common.process_videos(youtube_api, "source", "filter", "target")
         assert result == (["vid1"], ["vid2"], [])
-        youtube_api.get_playlist_videos.assert_called_once_with("source")
+        youtube_api.iter_playlist_videos.assert_called_once_with("source")
+        youtube_api.batch_move_videos_to_playlist.assert_called_once_with(
+            "source", "target", ["vid1", "vid2"]
+        )
+
+
+def test_process_videos_duplicate_entries(youtube_api):
+    """Test that a video listed twice is sent to the API once."""
+    youtube_api.iter_playlist_videos.return_value = [
+        {"video_id": "vid1", "title": "Video 1"},
+        {"video_id": "vid2", "title": "Video 2"},
+        {"video_id": "vid1", "title": "Video 1"},
+    ]
+    youtube_api.batch_move_videos_to_playlist.return_value = ["vid1", "vid2"]
+    with patch("src.youtubesorter.common.classify_video_titles") as mock_classify:
+        mock_classify.return_value = [True, True, True]
+        result = common.process_videos(youtube_api, "source", "filter", "target")
+        assert result == (["vid1", "vid2"], [], [])
         youtube_api.batch_move_videos_to_playlist.assert_called_once_with(
             "source", "target", ["vid1", "vid2"]
         )
 
 
+def test_process_videos_classifies_in_chunks(youtube_api):
+    """Test that videos are classified a chunk at a time in playlist order."""
+    videos = [{"video_id": f"vid{i}", "title": f"Video {i}"} for i in range(5)]
+    youtube_api.iter_playlist_videos.return_value = iter(videos)
+    youtube_api.batch_move_videos_to_playlist.return_value = ["vid0", "vid3", "vid4"]
+    with patch("src.youtubesorter.common.CLASSIFY_CHUNK_SIZE", 2), patch(
+        "src.youtubesorter.common.classify_video_titles",
+        side_effect=[[True, False], [False, True], [True]],
+    ) as mock_classify:
+        result = common.process_videos(youtube_api, "source", "filter", "target")
+    assert result == (["vid0", "vid3", "vid4"], [], [])
+    assert [c[0][0] for c in mock_classify.call_args_list] == [
+        videos[0:2],
+        videos[2:4],
+        videos[4:],
+    ]
+
+
 def test_process_videos_copy_success(youtube_api):
     """Test successful video copy."""
-    youtube_api.get_playlist_videos.return_value = [{"video_id": "vid1", "title": "Video 1"}]
+    youtube_api.iter_playlist_videos.return_value = [{"video_id": "vid1", "title": "Video 1"}]
     youtube_api.batch_add_videos_to_playlist.return_value = ["vid1"]
     with patch("src.youtubesorter.common.classify_video_titles") as mock_classify:
         mock_classify.return_value = [True]
         result = common.process_videos(youtube_api, "source", "filter", "target", copy=True)
         assert result == (["vid1"], [], [])
-        youtube_api.get_playlist_videos.assert_called_once_with("source")
+        youtube_api.iter_playlist_videos.assert_called_once_with("source")
         youtube_api.batch_add_videos_to_playlist.assert_called_once_with("target", ["vid1"])
 
 
 def test_process_videos_error(youtube_api):
     """Test error handling during video processing."""
-    youtube_api.get_playlist_videos.side_effect = Exception("API Error")
+    youtube_api.iter_playlist_videos.side_effect = Exception("API Error")
     result = common.process_videos(youtube_api, "source", "filter", "target")
     assert result == ([], [], [])
-    youtube_api.get_playlist_videos.assert_called_once_with("source")
+    youtube_api.iter_playlist_videos.assert_called_once_with("source")
     youtube_api.batch_move_videos_to_playlist.assert_not_called()
 
 
@@ -208,7 +251,7 @@ def test_save_undo_operation():
         "operation_type": "undo",
     }
     mock_file = mock_open()
-    with patch("builtins.open", mock_file):
+    with patch("builtins.open", mock_file), patch("os.replace") as mock_replace:
         common.save_undo_operation(
             "target",
             ["vid1", "vid2"],
@@ -216,11 +259,12 @@ def test_save_undo_operation():
             ["vid4"],
             "state.json",
         )
+    mock_file.assert_called_once_with("state.json.tmp", "wb")
+    mock_replace.assert_called_once_with("state.json.tmp", "state.json")
 
-    # Combine all write calls into a single string
+    # Combine all write calls into a single document
     handle = mock_file()
-    written_data = "".join(call[0][0] for call in handle.write.call_args_list)
-    assert isinstance(written_data, str)
+    written_data = b"".join(call[0][0] for call in handle.write.call_args_list)
     assert json.loads(written_data) == expected_data
 
 
@@ -234,7 +278,7 @@ def test_save_operation_state():
         "operation_type": "move",
     }
     mock_file = mock_open()
-    with patch("builtins.open", mock_file):
+    with patch("builtins.open", mock_file), patch("os.replace") as mock_replace:
         common.save_operation_state(
             "target",
             ["vid1", "vid2"],
@@ -242,14 +286,52 @@ def test_save_operation_state():
             ["vid4"],
             "state.json",
         )
+    mock_file.assert_called_once_with("state.json.tmp", "wb")
+    mock_replace.assert_called_once_with("state.json.tmp", "state.json")
 
-    # Combine all write calls into a single string
+    # Combine all write calls into a single document
     handle = mock_file()
-    written_data = "".join(call[0][0] for call in handle.write.call_args_list)
-    assert isinstance(written_data, str)
+    written_data = b"".join(call[0][0] for call in handle.write.call_args_list)
     assert json.loads(written_data) == expected_data
 
 
+def test_save_operation_state_creates_directory_once(tmp_path):
+    """Test that the state directory is created on the first save only."""
+    state_dir = tmp_path / "state"
+    with patch("src.youtubesorter.common.STATE_DIR", str(state_dir)), patch(
+        "os.makedirs", wraps=common.os.makedirs
+    ) as mock_makedirs:
+        common.save_operation_state("target", ["vid1"], [], [], str(state_dir / "1.json"))
+        common.save_undo_operation("target", ["vid1"], [], [], str(state_dir / "2.json"))
+    mock_makedirs.assert_called_once_with(str(state_dir), exist_ok=True)
+    assert common.load_operation_state(str(state_dir / "2.json"))["operation_type"] == "undo"
+
+
+def test_save_operation_state_skips_unchanged(tmp_path):
+    """Test that saving identical state does not rewrite the file."""
+    state_file = str(tmp_path / "state.json")
+    common.save_operation_state("target", ["vid1"], [], [], state_file)
+    with patch("builtins.open", mock_open()) as mock_file:
+        common.save_operation_state("target", ["vid1"], [], [], state_file)
+    mock_file.assert_not_called()
+
+    common.save_operation_state("target", ["vid1", "vid2"], [], [], state_file)
+    assert common.load_operation_state(state_file)["processed_videos"] == ["vid1", "vid2"]
+
+
+def test_save_operation_state_invalidates_scan(tmp_path):
+    """Test that a saved state file is found even if the directory mtime stays put."""
+    with patch("src.youtubesorter.common.STATE_DIR", str(tmp_path)):
+        os.utime(tmp_path, (100, 100))
+        assert common.find_latest_state("playlist1") is None
+
+        state_file = str(tmp_path / "youtubesorter_playlist1_1.json")
+        common.save_operation_state("playlist1", ["vid1"], [], [], state_file)
+        # Simulate a filesystem too coarse to record the change
+        os.utime(tmp_path, (100, 100))
+        assert common.find_latest_state("playlist1") == state_file
+
+
 def test_load_operation_state():
     """Test loading operation state."""
     state_data = {
@@ -419,33 +501,36 @@ def test_undo_operation_api_error(youtube_api, caplog):
                 assert "Failed to undo operation: API Error" in caplog.text
 
 
-def test_find_latest_state_with_empty_playlist_id():
+def test_find_latest_state_with_empty_playlist_id(tmp_path):
     """Test finding latest state file with empty playlist ID."""
-    with patch("src.youtubesorter.common.glob") as mock_glob:
-        mock_glob.return_value = [
-            "data/state/youtubesorter_1.json",
-            "data/state/youtubesorter_2.json",
-        ]
-        with patch("os.path.getctime") as mock_getctime:
-            mock_getctime.side_effect = lambda x: 2 if x.endswith("2.json") else 1
-            assert common.find_latest_state(None) == "data/state/youtubesorter_2.json"
-
-
-def test_find_latest_state_with_getctime_error():
-    """Test finding latest state file when getctime raises an error."""
-    with patch("src.youtubesorter.common.glob") as mock_glob:
-        mock_glob.return_value = [
-            "data/state/youtubesorter_1.json",
-            "data/state/youtubesorter_2.json",
-        ]
-        with patch("os.path.getctime", side_effect=OSError("Access denied")):
-            assert common.find_latest_state("playlist1") is None
+    for name in ("youtubesorter_1.json", "youtubesorter_2.json", "other.json"):
+        (tmp_path / name).write_text("{}", encoding="utf-8")
+    with patch("src.youtubesorter.common.STATE_DIR", str(tmp_path)):
+        assert common.find_latest_state(None) == str(tmp_path / "youtubesorter_2.json")
+
+
+def test_find_latest_state_with_scan_error():
+    """Test finding latest state file when the state directory cannot be read."""
+    with patch("os.scandir", side_effect=OSError("Access denied")), patch.object(
+        common.logger, "error"
+    ) as mock_error:
+        assert common.find_latest_state("playlist1") is None
+    mock_error.assert_called_once()
+
+
+def test_find_latest_state_without_state_dir(tmp_path):
+    """Test that a missing state directory means no state, without an error."""
+    with patch("src.youtubesorter.common.STATE_DIR", str(tmp_path / "missing")), patch.object(
+        common.logger, "error"
+    ) as mock_error:
+        assert common.find_latest_state("playlist1") is None
+    mock_error.assert_not_called()
 
 
 def test_process_videos_with_empty_filter():
     """Test processing videos with empty filter prompt."""
     youtube_api = MagicMock()
-    youtube_api.get_playlist_videos.return_value = [
+    youtube_api.iter_playlist_videos.return_value = [
         {"video_id": "vid1", "title": "Video 1"},
         {"video_id": "vid2", "title": "Video 2"},
     ]
@@ -453,7 +538,7 @@ def test_process_videos_with_empty_filter():
 
     result = common.process_videos(youtube_api, "source", "", "target")
     assert result == (["vid1", "vid2"], [], [])
-    youtube_api.get_playlist_videos.assert_called_once_with("source")
+    youtube_api.iter_playlist_videos.assert_called_once_with("source")
     youtube_api.batch_move_videos_to_playlist.assert_called_once_with(
         "source", "target", ["vid1", "vid2"]
     )
@@ -462,7 +547,7 @@ def test_process_videos_with_empty_filter():
 def test_process_videos_copy_failure():
     """Test handling copy operation failure."""
     youtube_api = MagicMock()
-    youtube_api.get_playlist_videos.return_value = [
+    youtube_api.iter_playlist_videos.return_value = [
         {"video_id": "vid1", "title": "Video 1"},
         {"video_id": "vid2", "title": "Video 2"},
     ]
@@ -470,7 +555,7 @@ def test_process_videos_copy_failure():
 
     result = common.process_videos(youtube_api, "source", "", "target", copy=True)
     assert result == (["vid1"], ["vid2"], [])
-    youtube_api.get_playlist_videos.assert_called_once_with("source")
+    youtube_api.iter_playlist_videos.assert_called_once_with("source")
     youtube_api.batch_add_videos_to_playlist.assert_called_once_with("target", ["vid1", "vid2"])
 
 
@@ -1,7 +1,7 @@
 """Test cases for consolidate command."""
 
 from unittest import TestCase
-from unittest.mock import patch, MagicMock
+from unittest.mock import call, patch, MagicMock
 import json
 import os
 import tempfile
@@ -72,16 +72,28 @@ class TestProcessPlaylist(TestCase):
 
     def test_process_playlist_with_limit(self):
         """Test processing playlist with video limit."""
+        videos = iter(
+            [
+                {"video_id": "video1", "title": "Test Video 1"},
+                {"video_id": "video2", "title": "Test Video 2"},
+                {"video_id": "video3", "title": "Test Video 3"},
+            ]
+        )
+        self.api.iter_playlist_videos.return_value = videos
+
         processed, failed, skipped = consolidate.process_playlist(
-            self.youtube, "source1", "target1", limit=1
+            self.youtube, "source1", "target1", limit=1, processed_videos={"video1"}
         )
 
         self.assertEqual(processed, ["video1", "video2"])
         self.assertEqual(failed, [])
         self.assertEqual(skipped, [])
-        self.api.get_playlist_videos.assert_called_once_with("source1")
+        self.api.iter_playlist_videos.assert_called_once_with("source1")
+        self.api.get_playlist_videos.assert_not_called()
+        # Reading stopped at the first new video
+        self.assertEqual(next(videos)["video_id"], "video3")
         self.api.batch_move_videos_to_playlist.assert_called_once_with(
-            "source1", "target1", ["video1"]
+            "source1", "target1", ["video2"]
         )
 
     def test_process_playlist_with_processed_videos(self):
@@ -273,9 +285,14 @@ class TestConsolidatePlaylists(TestCase):
         self.api.batch_move_videos_to_playlist.return_value = ["video1", "video2"]
         self.api.batch_add_videos_to_playlist.return_value = ["video1", "video2"]
 
-        with patch("src.youtubesorter.consolidate.YouTubeAPI") as mock_api:
-            mock_api.return_value = self.api
-            self.mock_api = mock_api
+        api_patch = patch("src.youtubesorter.consolidate.YouTubeAPI", return_value=self.api)
+        self.mock_api = api_patch.start()
+        self.addCleanup(api_patch.stop)
+
+        # Keep the undo state out of the working directory
+        save_patch = patch("src.youtubesorter.consolidate.common.save_operation_state")
+        self.mock_save_operation_state = save_patch.start()
+        self.addCleanup(save_patch.stop)
 
     def test_consolidate_playlists_success(self):
         """Test successful consolidation of playlists."""
@@ -291,7 +308,10 @@ class TestConsolidatePlaylists(TestCase):
                     self.youtube, ["source1", "source2"], "target1", copy=False, verbose=True
                 )
 
-                # Verify process_playlist was called for each source playlist
+                # Verify the sources were listed together, then processed one by one
+                # through the same API wrapper
+                self.mock_api.assert_called_once_with(self.youtube)
+                self.api.get_playlists_videos.assert_called_once_with(["source1", "source2"])
                 self.assertEqual(mock_process.call_count, 2)
                 for call_args in mock_process.call_args_list:
                     args, kwargs = call_args
@@ -299,12 +319,32 @@ class TestConsolidatePlaylists(TestCase):
                     self.assertIn(args[1], ["source1", "source2"])
                     self.assertEqual(args[2], "target1")
                     self.assertFalse(kwargs.get("copy", False))
+                    self.assertIs(kwargs["api"], self.api)
 
                 # Verify recovery manager was initialized and used
                 mock_recovery.assert_called_once_with(
                     playlist_id="source1", operation_type="consolidate"
                 )
-                self.assertEqual(mock_manager.assign_video.call_count, 4)  # 2 videos * 2 playlists
+                self.assertEqual(
+                    mock_manager.assign_videos.call_args_list,
+                    [call(["video1", "video2"], "target1")] * 2,
+                )
+
+    def test_consolidate_playlists_duplicate_sources(self):
+        """Test that a source playlist given twice is processed once."""
+        with patch("src.youtubesorter.consolidate.process_playlist") as mock_process:
+            mock_process.return_value = (["video1"], [], [])
+
+            with patch("src.youtubesorter.consolidate.RecoveryManager"):
+                consolidate.consolidate_playlists(
+                    self.youtube, ["source1", "source2", "source1"], "target1"
+                )
+
+            self.api.get_playlists_videos.assert_called_once_with(["source1", "source2"])
+            self.assertEqual(
+                [call_args[0][1] for call_args in mock_process.call_args_list],
+                ["source1", "source2"],
+            )
 
     def test_consolidate_playlists_empty_source(self):
         """Test consolidation with empty source playlists."""
@@ -325,7 +365,7 @@ class TestConsolidatePlaylists(TestCase):
                 mock_recovery.assert_called_once_with(
                     playlist_id="source1", operation_type="consolidate"
                 )
-                mock_manager.assign_video.assert_not_called()
+                mock_manager.assign_videos.assert_not_called()
 
     def test_consolidate_playlists_resume(self):
         """Test resuming consolidation from previous state."""
@@ -385,6 +425,9 @@ class TestConsolidatePlaylists(TestCase):
                     self.youtube, ["source1", "source2"], "target1", limit=1
                 )
 
+                # Sources past the limit are not listed up front
+                self.api.get_playlists_videos.assert_not_called()
+
                 # Verify process_playlist was called only once since we reached the limit
                 mock_process.assert_called_once()
                 args, kwargs = mock_process.call_args
@@ -397,7 +440,7 @@ class TestConsolidatePlaylists(TestCase):
                 mock_recovery.assert_called_once_with(
                     playlist_id="source1", operation_type="consolidate"
                 )
-                mock_manager.assign_video.assert_called_once_with("video1", "target1")
+                mock_manager.assign_videos.assert_called_once_with(["video1"], "target1")
 
     def test_consolidate_playlists_copy(self):
         """Test consolidation with copy mode."""
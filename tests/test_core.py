@@ -1,10 +1,12 @@
 """Tests for the core module."""
 
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.youtubesorter.core import YouTubeBase
+from src.youtubesorter.core import PLAYLIST_INFO_FIELDS, PLAYLIST_ITEM_FIELDS, YouTubeBase
 from src.youtubesorter.errors import PlaylistNotFoundError
 
 
@@ -53,6 +55,7 @@ def test_get_playlist_info_success(youtube_base, youtube_client):
         part="snippet",
         id="playlist1",
         maxResults=1,
+        fields=PLAYLIST_INFO_FIELDS,
     )
 
 
@@ -167,12 +170,14 @@ def test_get_playlist_videos_success(youtube_base, youtube_client):
         playlistId="playlist1",
         maxResults=50,
         pageToken=None,
+        fields=PLAYLIST_ITEM_FIELDS,
     )
     youtube_client.playlistItems.return_value.list.assert_any_call(
         part="snippet",
         playlistId="playlist1",
         maxResults=50,
         pageToken="token1",
+        fields=PLAYLIST_ITEM_FIELDS,
     )
 
 
@@ -205,6 +210,64 @@ def test_get_playlist_videos_api_error(youtube_base, youtube_client):
     assert videos == []
 
 
+def test_iter_playlist_videos_streams_pages(youtube_base, youtube_client):
+    """Test that videos from the first page are yielded before the last page arrives."""
+    pages = [
+        {
+            "items": [{"snippet": {"resourceId": {"videoId": "vid1"}, "title": "Video 1"}}],
+            "nextPageToken": "token1",
+        },
+        {"items": [{"snippet": {"resourceId": {"videoId": "vid2"}, "title": "Video 2"}}]},
+    ]
+    mock_request = MagicMock()
+    mock_request.execute.side_effect = pages
+    youtube_client.playlistItems.return_value.list.return_value = mock_request
+
+    videos = youtube_base.iter_playlist_videos("playlist1")
+
+    assert next(videos)["video_id"] == "vid1"
+    assert [video["video_id"] for video in videos] == ["vid2"]
+
+
+def test_iter_playlist_videos_close_waits_for_prefetch(youtube_base, youtube_client):
+    """Test that stopping early waits for the prefetch already in flight."""
+    started = threading.Event()
+    finished = threading.Event()
+    first_page = {
+        "items": [{"snippet": {"resourceId": {"videoId": "vid1"}, "title": "Video 1"}}],
+        "nextPageToken": "token1",
+    }
+
+    def execute(http=None):
+        if youtube_client.playlistItems.return_value.list.call_count == 1:
+            return first_page
+        started.set()
+        time.sleep(0.2)
+        finished.set()
+        return {"items": []}
+
+    mock_request = MagicMock()
+    mock_request.execute.side_effect = execute
+    youtube_client.playlistItems.return_value.list.return_value = mock_request
+
+    videos = youtube_base.iter_playlist_videos("playlist1")
+    assert next(videos)["video_id"] == "vid1"
+    assert started.wait(5)
+
+    videos.close()
+    assert finished.is_set()
+
+
+def test_iter_playlist_videos_api_error(youtube_base, youtube_client):
+    """Test that API errors are raised to the caller."""
+    mock_request = MagicMock()
+    mock_request.execute.side_effect = Exception("API error")
+    youtube_client.playlistItems.return_value.list.return_value = mock_request
+
+    with pytest.raises(Exception, match="API error"):
+        list(youtube_base.iter_playlist_videos("playlist1"))
+
+
 def test_get_playlist_videos_missing_description(youtube_base, youtube_client):
     """Test handling of missing description field."""
     # Mock response without description
@@ -14,7 +14,20 @@ class MockYouTubeBase(YouTubeBase):
     def __init__(self):
         """Initialize mock."""
         self.get_playlist_videos = MagicMock()
-        self.batch_remove_videos_from_playlist = MagicMock()
+        # Stream whatever the test configures on get_playlist_videos
+        self.iter_playlist_videos = MagicMock(
+            side_effect=lambda playlist_id: iter(self.get_playlist_videos(playlist_id))
+        )
+        # Number the playlist items in listing order
+        self.iter_playlist_items = MagicMock(
+            side_effect=lambda playlist_id: (
+                (video["video_id"], f"item{i}")
+                for i, video in enumerate(self.get_playlist_videos(playlist_id))
+            )
+        )
+        self.batch_delete_playlist_items = MagicMock(
+            side_effect=lambda playlist_id, item_ids: list(item_ids)
+        )
 
 
 @pytest.fixture
@@ -83,7 +96,7 @@ def test_deduplicate_command_validate_resume_destination_not_found(
     mock_find_state.return_value = "state.json"
     mock_recovery = MagicMock()
     mock_recovery.destination_metadata = {}
-    mock_recovery_manager.return_value.__enter__.return_value = mock_recovery
+    mock_recovery_manager.return_value = mock_recovery
 
     with pytest.raises(ValueError, match="Destination dest1 not found in recovery state"):
         cmd = DeduplicateCommand(
@@ -105,7 +118,7 @@ def test_deduplicate_command_validate_resume_destination_completed(
     mock_recovery = MagicMock()
     mock_recovery.destination_metadata = {"dest1": {}}
     mock_recovery.get_destination_progress.return_value = {"completed": True}
-    mock_recovery_manager.return_value.__enter__.return_value = mock_recovery
+    mock_recovery_manager.return_value = mock_recovery
 
     with pytest.raises(ValueError, match="Destination dest1 already completed"):
         cmd = DeduplicateCommand(
@@ -155,7 +168,7 @@ def test_deduplicate_command_run_no_duplicates(mock_recovery_manager, mock_youtu
         playlist_id="playlist123",
     )
     assert cmd._run()
-    mock_youtube.batch_remove_videos_from_playlist.assert_not_called()
+    mock_youtube.batch_delete_playlist_items.assert_not_called()
 
 
 @patch("src.youtubesorter.commands.deduplicate.RecoveryManager")
@@ -172,14 +185,40 @@ def test_deduplicate_command_run_with_duplicates(mock_recovery_manager, mock_you
     mock_recovery_manager.return_value.__enter__.return_value = mock_recovery
 
     mock_youtube.get_playlist_videos.return_value = videos
-    mock_youtube.batch_remove_videos_from_playlist.return_value = {"vid1"}
 
     cmd = DeduplicateCommand(
         youtube=mock_youtube,
         playlist_id="playlist123",
     )
     assert cmd._run()
-    mock_youtube.batch_remove_videos_from_playlist.assert_called_once_with(["vid1"], "playlist123")
+    mock_youtube.batch_delete_playlist_items.assert_called_once_with("playlist123", ["item1"])
+    assert mock_recovery.processed_videos == {"vid1"}
+
+
+@patch("src.youtubesorter.commands.deduplicate.RecoveryManager")
+def test_deduplicate_command_run_removes_each_extra_copy(mock_recovery_manager, mock_youtube):
+    """Test that a video listed three times loses two distinct playlist items."""
+    mock_recovery = MagicMock()
+    mock_recovery.processed_videos = set()
+    mock_recovery.failed_videos = set()
+    mock_recovery_manager.return_value.__enter__.return_value = mock_recovery
+
+    mock_youtube.get_playlist_videos.return_value = [
+        {"video_id": "vid1", "title": "Video 1"},
+        {"video_id": "vid2", "title": "Video 2"},
+        {"video_id": "vid1", "title": "Video 1"},
+        {"video_id": "vid1", "title": "Video 1"},
+    ]
+
+    cmd = DeduplicateCommand(
+        youtube=mock_youtube,
+        playlist_id="playlist123",
+    )
+    assert cmd._run()
+    mock_youtube.iter_playlist_items.assert_called_once_with("playlist123")
+    mock_youtube.batch_delete_playlist_items.assert_called_once_with(
+        "playlist123", ["item2", "item3"]
+    )
 
 
 @patch("src.youtubesorter.commands.deduplicate.RecoveryManager")
@@ -202,8 +241,10 @@ def test_deduplicate_command_run_dry_run(mock_recovery_manager, mock_youtube):
         playlist_id="playlist123",
         dry_run=True,
     )
-    assert cmd._run()
-    mock_youtube.batch_remove_videos_from_playlist.assert_not_called()
+    with patch.object(cmd._logger, "info") as mock_info:
+        assert cmd._run()
+    mock_info.assert_called_once_with("Found %d duplicates, would remove them", 1)
+    mock_youtube.batch_delete_playlist_items.assert_not_called()
 
 
 @patch("src.youtubesorter.commands.deduplicate.RecoveryManager")
@@ -220,7 +261,7 @@ def test_deduplicate_command_run_with_error(mock_recovery_manager, mock_youtube)
     mock_recovery_manager.return_value.__enter__.return_value = mock_recovery
 
     mock_youtube.get_playlist_videos.return_value = videos
-    mock_youtube.batch_remove_videos_from_playlist.side_effect = YouTubeError("Test error")
+    mock_youtube.batch_delete_playlist_items.side_effect = YouTubeError("Test error")
 
     cmd = DeduplicateCommand(
         youtube=mock_youtube,
@@ -263,7 +304,9 @@ def test_deduplicate_command_run_with_partial_error(mock_recovery_manager, mock_
     mock_recovery_manager.return_value.__enter__.return_value = mock_recovery
 
     mock_youtube.get_playlist_videos.return_value = videos
-    mock_youtube.batch_remove_videos_from_playlist.return_value = {"vid1"}  # Only vid1 removed
+    # Only the copy of vid1 is removed
+    mock_youtube.batch_delete_playlist_items.side_effect = None
+    mock_youtube.batch_delete_playlist_items.return_value = ["item1"]
 
     cmd = DeduplicateCommand(
         youtube=mock_youtube,
@@ -272,3 +315,80 @@ def test_deduplicate_command_run_with_partial_error(mock_recovery_manager, mock_
     assert not cmd._run()  # Should return False as not all duplicates were removed
     assert "vid1" in mock_recovery.processed_videos
     assert "vid2" in mock_recovery.failed_videos
+
+
+@patch("src.youtubesorter.commands.deduplicate.RecoveryManager")
+def test_deduplicate_command_run_concurrent_batches(mock_recovery_manager, mock_youtube):
+    """Test that duplicates are removed in groups of max_workers batches."""
+    mock_recovery = MagicMock()
+    mock_recovery.processed_videos = set()
+    mock_recovery.failed_videos = set()
+    videos = [{"video_id": f"vid{i}", "title": f"Video {i}"} for i in range(5)] * 2
+    mock_recovery.get_remaining_videos.return_value = videos
+    mock_recovery_manager.return_value.__enter__.return_value = mock_recovery
+
+    mock_youtube.get_playlist_videos.return_value = videos
+
+    cmd = DeduplicateCommand(
+        youtube=mock_youtube,
+        playlist_id="playlist123",
+        max_workers=2,
+    )
+    cmd.batch_size = 2
+    assert cmd._run()
+
+    assert mock_youtube.batch_delete_playlist_items.call_count == 2
+    mock_youtube.batch_delete_playlist_items.assert_called_with("playlist123", ["item9"])
+    assert mock_recovery.processed_videos == {f"vid{i}" for i in range(5)}
+    assert not mock_recovery.failed_videos
+
+
+@patch("src.youtubesorter.commands.deduplicate.find_latest_state")
+@patch("src.youtubesorter.commands.deduplicate.RecoveryManager")
+def test_deduplicate_command_run_reuses_validated_recovery(
+    mock_recovery_manager, mock_find_state, mock_youtube
+):
+    """Test that run uses the recovery state loaded by validate."""
+    mock_find_state.return_value = "state.json"
+    mock_recovery = MagicMock()
+    mock_recovery.processed_videos = set()
+    mock_recovery.failed_videos = set()
+    mock_recovery.__enter__.return_value = mock_recovery
+    mock_recovery_manager.return_value = mock_recovery
+
+    mock_youtube.get_playlist_videos.return_value = [{"video_id": "vid1", "title": "Video 1"}]
+
+    cmd = DeduplicateCommand(
+        youtube=mock_youtube,
+        playlist_id="playlist123",
+        resume=True,
+    )
+    cmd.validate()
+    assert cmd._run()
+
+    mock_recovery_manager.assert_called_once()
+    mock_recovery.load_state.assert_not_called()
+    mock_recovery.__exit__.assert_called_once()
+
+
+@patch("src.youtubesorter.commands.deduplicate.RecoveryManager")
+def test_deduplicate_command_run_with_limit(mock_recovery_manager, mock_youtube):
+    """Test that only up to limit duplicates are removed."""
+    mock_recovery = MagicMock()
+    mock_recovery.processed_videos = set()
+    mock_recovery.failed_videos = set()
+    mock_recovery_manager.return_value.__enter__.return_value = mock_recovery
+
+    mock_youtube.get_playlist_videos.return_value = [
+        {"video_id": f"vid{i}", "title": f"Video {i}"} for i in range(3)
+    ] * 2
+
+    cmd = DeduplicateCommand(
+        youtube=mock_youtube,
+        playlist_id="playlist123",
+        limit=2,
+    )
+    assert cmd._run()
+    mock_youtube.batch_delete_playlist_items.assert_called_once_with(
+        "playlist123", ["item3", "item4"]
+    )
@@ -15,6 +15,10 @@ class MockYouTubeBase(YouTubeBase):
     def __init__(self):
         """Initialize mock."""
         self.get_playlist_videos = MagicMock()
+        # Stream whatever the test configures on get_playlist_videos
+        self.iter_playlist_videos = MagicMock(
+            side_effect=lambda playlist_id: iter(self.get_playlist_videos(playlist_id))
+        )
         self.batch_add_videos_to_playlist = MagicMock()
         self.batch_move_videos_to_playlist = MagicMock()
 
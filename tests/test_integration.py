@@ -40,7 +40,7 @@ class TestIntegration(unittest.TestCase):
     def test_process_videos_success(self):
         """Test successful video processing."""
         api = YouTubeAPI(self.mock_youtube)
-        with patch.object(YouTubeAPI, "get_playlist_videos") as mock_get:
+        with patch.object(YouTubeAPI, "iter_playlist_videos") as mock_get:
             with patch.object(YouTubeAPI, "batch_move_videos_to_playlist") as mock_move:
                 with patch("src.youtubesorter.common.classify_video_titles") as mock_classify:
                     mock_get.return_value = self.test_videos
@@ -15,6 +15,10 @@ class MockYouTubeBase(YouTubeBase):
     def __init__(self):
         """Initialize mock."""
         self.get_playlist_videos = MagicMock()
+        # Stream whatever the test configures on get_playlist_videos
+        self.iter_playlist_videos = MagicMock(
+            side_effect=lambda playlist_id: iter(self.get_playlist_videos(playlist_id))
+        )
         self.batch_add_videos_to_playlist = MagicMock()
         self.batch_move_videos_to_playlist = MagicMock()
 
@@ -171,6 +175,27 @@ def test_move_command_run_with_videos(mock_youtube):
     )
 
 
+def test_move_command_run_with_limit(mock_youtube):
+    """Test that move stops reading the playlist once the limit is reached."""
+    mock_youtube.iter_playlist_videos.side_effect = None
+    mock_youtube.iter_playlist_videos.return_value = iter(
+        [{"video_id": f"vid{i}", "title": f"Video {i}"} for i in range(5)]
+    )
+    mock_youtube.batch_move_videos_to_playlist.return_value = ["vid0", "vid1"]
+
+    cmd = MoveCommand(
+        youtube=mock_youtube,
+        source_playlist="source_id",
+        target_playlist="target_id",
+        limit=2,
+    )
+    assert cmd._run()
+    mock_youtube.batch_move_videos_to_playlist.assert_called_once_with(
+        ["vid0", "vid1"], "source_id", "target_id"
+    )
+    assert next(mock_youtube.iter_playlist_videos.return_value)["video_id"] == "vid2"
+
+
 def test_move_command_run_dry_run(mock_youtube):
     """Test move command in dry run mode."""
     mock_youtube.get_playlist_videos.return_value = [
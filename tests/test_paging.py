@@ -0,0 +1,62 @@
+"""Tests for the paging module."""
+
+import threading
+from unittest.mock import MagicMock
+
+from src.youtubesorter import paging
+
+
+def _fetcher(pages):
+    """Create a fetch function serving pages keyed by page token."""
+    calls = []
+
+    def fetch(page_token):
+        calls.append((page_token, threading.get_ident()))
+        return pages[page_token]
+
+    return fetch, calls
+
+
+def test_iter_pages_follows_tokens():
+    """Test that every page is fetched in order, on and off the calling thread."""
+    pages = {None: {"nextPageToken": "a"}, "a": {"nextPageToken": "b"}, "b": {}}
+    for prefetch in (True, False):
+        fetch, calls = _fetcher(pages)
+        assert list(paging.iter_pages(fetch, prefetch=prefetch)) == [
+            pages[None],
+            pages["a"],
+            pages["b"],
+        ]
+        assert [token for token, _ in calls] == [None, "a", "b"]
+        on_caller = [ident == threading.get_ident() for _, ident in calls]
+        assert on_caller == ([True, False, False] if prefetch else [True, True, True])
+
+
+def test_iter_pages_close_stops_prefetch():
+    """Test that closing the iterator leaves no fetch running."""
+    fetch, calls = _fetcher({None: {"nextPageToken": "a"}, "a": {"nextPageToken": "b"}})
+    pages = paging.iter_pages(fetch)
+    next(pages)
+    pages.close()
+    assert [token for token, _ in calls] in ([None], [None, "a"])
+
+
+def test_service_credentials():
+    """Test reading credentials from a service's HTTP client."""
+    service = MagicMock()
+    assert paging.service_credentials(service) is service._http.credentials
+    assert paging.service_credentials(object()) is None
+
+
+def test_thread_http_per_thread():
+    """Test that each thread gets its own client, reused on later calls."""
+    clients = paging.ThreadHttp()
+    credentials = MagicMock()
+    first = clients.get(credentials)
+    assert clients.get(credentials) is first
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(clients.get(credentials)))
+    thread.start()
+    thread.join()
+    assert other[0] is not first
@@ -4,7 +4,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.youtubesorter.commands.quota import QuotaCommand
+from src.youtubesorter.commands.quota import QUOTA_CACHE_TTL, QuotaCommand
 from src.youtubesorter.errors import YouTubeError
 from src.youtubesorter.core import YouTubeBase
 
@@ -79,3 +79,28 @@ def test_quota_command_run_logs_error(mock_logger, mock_youtube):
     cmd._run()
 
     mock_logger.error.assert_called_once_with("Failed to get quota information: %s", error_msg)
+
+
+def test_quota_command_run_reuses_recent_reading(mock_youtube):
+    """Test that a reading is reused within the TTL unless caching is disabled."""
+    mock_youtube.get_quota_info.return_value = {"quota_used": 100}
+
+    assert QuotaCommand(youtube=mock_youtube)._run()
+    assert QuotaCommand(youtube=mock_youtube)._run()
+    mock_youtube.get_quota_info.assert_called_once()
+
+    assert QuotaCommand(youtube=mock_youtube, use_cache=False)._run()
+    assert mock_youtube.get_quota_info.call_count == 2
+
+
+@patch("src.youtubesorter.commands.quota.time.monotonic")
+def test_quota_command_run_refetches_after_ttl(mock_monotonic, mock_youtube):
+    """Test that a reading older than the TTL is fetched again."""
+    mock_youtube.get_quota_info.return_value = {"quota_used": 100}
+
+    mock_monotonic.return_value = 1000.0
+    QuotaCommand(youtube=mock_youtube)._run()
+    mock_monotonic.return_value = 1000.0 + QUOTA_CACHE_TTL
+    QuotaCommand(youtube=mock_youtube)._run()
+
+    assert mock_youtube.get_quota_info.call_count == 2
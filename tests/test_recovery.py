@@ -5,21 +5,18 @@ import os
 from unittest.mock import MagicMock, patch, mock_open
 import pytest
 
+from src.youtubesorter import recovery as recovery_module
 from src.youtubesorter.recovery import RecoveryManager
 
 
 @pytest.fixture
-def recovery_manager():
+def recovery_manager(tmp_path):
     """Create a recovery manager instance."""
-    manager = RecoveryManager(
+    return RecoveryManager(
         playlist_id="playlist123",
         operation_type="test",
-        state_file="data/recovery/test_recovery.json",
+        state_file=str(tmp_path / "test_recovery.json"),
     )
-    yield manager
-    # Clean up state file after test
-    if os.path.exists("data/recovery/test_recovery.json"):
-        os.remove("data/recovery/test_recovery.json")
 
 
 def test_recovery_manager_init():
@@ -30,7 +27,9 @@ def test_recovery_manager_init():
     )
     assert manager.playlist_id == "playlist123"
     assert manager.operation_type == "test"
-    assert manager.state_file == "data/recovery/recovery_playlist123_test.json"
+    assert manager.state_file == os.path.join(
+        recovery_module.RECOVERY_DIR, "recovery_playlist123_test.json"
+    )
     assert manager.destination_metadata == {}
     assert manager.destination_progress == {}
     assert manager.videos == {}
@@ -41,10 +40,12 @@ def test_recovery_manager_init():
 
 def test_recovery_manager_context_manager(recovery_manager):
     """Test recovery manager context manager."""
-    with patch("builtins.open", mock_open()) as mock_file:
+    with patch("builtins.open", mock_open()) as mock_file, patch("os.replace") as mock_replace:
         with recovery_manager:
             pass
-        mock_file.assert_called_once_with("data/recovery/test_recovery.json", "w", encoding="utf-8")
+        state_file = recovery_manager.state_file
+        mock_file.assert_called_once_with(state_file + ".tmp", "wb")
+        mock_replace.assert_called_once_with(state_file + ".tmp", state_file)
 
 
 def test_recovery_manager_load_state():
@@ -104,11 +105,11 @@ def test_recovery_manager_save_state(recovery_manager):
     recovery_manager.failed_videos = set()
 
     mock_file = mock_open()
-    with patch("builtins.open", mock_file):
+    with patch("builtins.open", mock_file), patch("os.replace"):
         recovery_manager.save_state()
-        mock_file.assert_called_once_with("data/recovery/test_recovery.json", "w", encoding="utf-8")
+        mock_file.assert_called_once_with(recovery_manager.state_file + ".tmp", "wb")
         # Get the actual data written to the file
-        written_data = "".join(call.args[0] for call in mock_file().write.call_args_list)
+        written_data = b"".join(call.args[0] for call in mock_file().write.call_args_list)
         # Parse it back to compare
         actual_state = json.loads(written_data)
         expected_state = {
@@ -205,6 +206,14 @@ def test_recovery_manager_get_remaining_videos(recovery_manager):
     assert set(remaining) == {"vid3"}
 
 
+def test_recovery_manager_get_remaining_videos_order(recovery_manager):
+    """Test that remaining videos keep their recorded order."""
+    recovery_manager.videos = {f"vid{i}": {} for i in range(6)}
+    recovery_manager.processed_videos = {"vid1"}
+    recovery_manager.failed_videos = {"vid4"}
+    assert recovery_manager.get_remaining_videos() == ["vid0", "vid2", "vid3", "vid5"]
+
+
 def test_recovery_manager_get_videos_for_destination(recovery_manager):
     """Test getting videos for a destination."""
     recovery_manager.destination_progress["dest1"] = {
@@ -234,6 +243,17 @@ def test_recovery_manager_assign_video_success(recovery_manager):
     assert "vid1" not in recovery_manager.failed_videos
 
 
+def test_recovery_manager_assign_videos(recovery_manager):
+    """Test assigning several videos with a single save."""
+    with patch.object(recovery_manager, "save_state") as mock_save:
+        recovery_manager.assign_videos(["vid1", "vid2"], "dest1")
+        recovery_manager.assign_videos(["vid3"], "dest1", success=False)
+    assert mock_save.call_count == 2
+    assert recovery_manager.processed_videos == {"vid1", "vid2"}
+    assert recovery_manager.failed_videos == {"vid3"}
+    assert recovery_manager.video_assignments == {"vid1": "dest1", "vid2": "dest1"}
+
+
 def test_recovery_manager_assign_video_failure(recovery_manager):
     """Test assigning a video with failure."""
     video_data = {"video_id": "vid1", "title": "Test Video"}
@@ -284,3 +304,64 @@ def test_recovery_manager_save_state_error(recovery_manager):
     with patch("builtins.open", mock_open()) as mock_file:
         mock_file.side_effect = Exception("Test error")
         recovery_manager.save_state()  # Should not raise exception
+
+
+def test_recovery_manager_save_state_atomic(tmp_path):
+    """Test that saving replaces the state file without leaving a temporary file."""
+    state_file = tmp_path / "recovery.json"
+    state_file.write_text("{}", encoding="utf-8")
+    manager = RecoveryManager("playlist123", "test", str(state_file))
+    manager.processed_videos = {"vid1"}
+
+    manager.save_state()
+
+    assert json.loads(state_file.read_text(encoding="utf-8"))["processed_videos"] == ["vid1"]
+    assert not os.path.exists(str(state_file) + ".tmp")
+
+
+def test_recovery_manager_checkpoint_appends_journal(tmp_path):
+    """Test that checkpoints append changes and loading replays them."""
+    state_file = tmp_path / "recovery.json"
+    manager = RecoveryManager("playlist123", "test", str(state_file))
+    manager.processed_videos.add("vid1")
+    manager.checkpoint()  # Nothing saved yet, so this writes the full state
+    state = state_file.read_text(encoding="utf-8")
+
+    manager.processed_videos.update(["vid2", "vid3"])
+    manager.failed_videos.add("vid4")
+    manager.processed_videos.discard("vid1")
+    manager.checkpoint()
+
+    assert state_file.read_text(encoding="utf-8") == state
+    journal = (tmp_path / "recovery.json.journal").read_text(encoding="utf-8")
+    assert journal.splitlines() == ["P+\tvid2", "P+\tvid3", "P-\tvid1", "F+\tvid4"]
+
+    loaded = RecoveryManager("playlist123", "test", str(state_file))
+    assert loaded.processed_videos == {"vid2", "vid3"}
+    assert loaded.failed_videos == {"vid4"}
+
+
+def test_recovery_manager_save_state_compacts_journal(tmp_path):
+    """Test that a full save folds the journal into the state file."""
+    state_file = tmp_path / "recovery.json"
+    manager = RecoveryManager("playlist123", "test", str(state_file))
+    manager.save_state()
+    manager.processed_videos.add("vid1")
+    manager.checkpoint()
+    assert (tmp_path / "recovery.json.journal").exists()
+
+    manager.save_state()
+
+    assert not (tmp_path / "recovery.json.journal").exists()
+    assert json.loads(state_file.read_text(encoding="utf-8"))["processed_videos"] == ["vid1"]
+
+
+def test_recovery_manager_load_ignores_torn_journal_line(tmp_path):
+    """Test that a partially written journal line is skipped."""
+    state_file = tmp_path / "recovery.json"
+    RecoveryManager("playlist123", "test", str(state_file)).save_state()
+    (tmp_path / "recovery.json.journal").write_text("P+\tvid1\nP", encoding="utf-8")
+
+    manager = RecoveryManager("playlist123", "test", str(state_file))
+
+    assert manager.processed_videos == {"vid1"}
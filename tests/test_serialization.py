@@ -0,0 +1,45 @@
+"""Tests for the serialization module."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.youtubesorter import serialization
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request):
+    """Run each test with orjson and with the stdlib fallback."""
+    if request.param == "json":
+        with patch.object(serialization, "orjson", None):
+            yield request.param
+    else:
+        if serialization.orjson is None:
+            pytest.skip("orjson not installed")
+        yield request.param
+
+
+def test_round_trip(backend):
+    """Test that dumps output loads back to the same object."""
+    data = {"playlist_id": "PL1", "processed_videos": ["vid1", "vid2"], "count": 2}
+    assert serialization.loads(serialization.dumps(data)) == data
+    assert serialization.loads(serialization.dumps(data).encode("utf-8")) == data
+
+
+def test_dumps_indent(backend):
+    """Test pretty-printed output."""
+    assert serialization.dumps({"key": "value"}, indent=True) == '{\n  "key": "value"\n}'
+
+
+def test_dumpb(backend):
+    """Test that dumpb returns UTF-8 bytes matching dumps."""
+    data = {"title": "caf\u00e9", "count": 2}
+    assert serialization.dumpb(data) == serialization.dumps(data).encode("utf-8")
+    assert serialization.loads(serialization.dumpb(data, indent=True)) == data
+
+
+def test_loads_invalid(backend):
+    """Test that invalid documents raise json.JSONDecodeError."""
+    with pytest.raises(json.JSONDecodeError):
+        serialization.loads("{")
@@ -1,6 +1,9 @@
 """Tests for utility functions."""
 
+import os
+import tempfile
 import unittest
+from unittest.mock import patch
 
 from src import utils
 
@@ -56,3 +59,69 @@ class TestPlaylistUrlParsing(unittest.TestCase):
             with self.subTest(invalid_input=invalid_input):
                 with self.assertRaises(ValueError):
                     utils.parse_playlist_url(invalid_input)
+
+
+class TestFindLatestState(unittest.TestCase):
+    """Test cases for finding recovery state files."""
+
+    def setUp(self):
+        """Run each test in an empty temporary directory."""
+        utils.clear_scan_cache()
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        cwd = os.getcwd()
+        os.chdir(tmpdir.name)
+        self.addCleanup(os.chdir, cwd)
+
+    def _touch(self, name, mtime):
+        """Create a state file with the given modification time."""
+        with open(name, "w", encoding="utf-8") as f:
+            f.write("{}")
+        os.utime(name, (mtime, mtime))
+
+    def test_no_state(self):
+        """Test that None is returned when no state file exists."""
+        self.assertIsNone(utils.find_latest_state())
+        self.assertIsNone(utils.find_latest_state("PL123"))
+
+    def test_latest_state(self):
+        """Test that the most recently modified matching file is returned."""
+        self._touch(".youtubesorter_PL1_recovery.json", 100)
+        self._touch(".youtubesorter_PL2_recovery.json", 200)
+        self._touch("other.json", 300)
+
+        self.assertEqual(utils.find_latest_state(), ".youtubesorter_PL2_recovery.json")
+        self.assertEqual(utils.find_latest_state("PL1"), ".youtubesorter_PL1_recovery.json")
+
+    def test_latest_state_cached_until_directory_changes(self):
+        """Test that scans are reused until a state file is added."""
+        self._touch(".youtubesorter_PL1_recovery.json", 100)
+        os.utime(".", (100, 100))
+        with patch("os.scandir", wraps=os.scandir) as mock_scandir:
+            self.assertEqual(utils.find_latest_state(), ".youtubesorter_PL1_recovery.json")
+            self.assertEqual(utils.find_latest_state(), ".youtubesorter_PL1_recovery.json")
+            self.assertEqual(mock_scandir.call_count, 1)
+
+            # Make sure the directory modification time moves on
+            self._touch(".youtubesorter_PL2_recovery.json", 200)
+            os.utime(".", (300, 300))
+            self.assertEqual(utils.find_latest_state(), ".youtubesorter_PL2_recovery.json")
+            self.assertEqual(mock_scandir.call_count, 2)
+
+    def test_latest_state_not_cached_while_directory_is_recent(self):
+        """Test that a scan is repeated while the directory mtime may still be racy."""
+        self._touch(".youtubesorter_PL1_recovery.json", 100)
+        with patch("os.scandir", wraps=os.scandir) as mock_scandir:
+            utils.find_latest_state()
+            utils.find_latest_state()
+            self.assertEqual(mock_scandir.call_count, 2)
+
+    def test_invalidate_scan(self):
+        """Test that writers can drop cached scans of a directory."""
+        self._touch(".youtubesorter_PL1_recovery.json", 100)
+        os.utime(".", (100, 100))
+        with patch("os.scandir", wraps=os.scandir) as mock_scandir:
+            utils.find_latest_state()
+            utils.invalidate_scan(".")
+            utils.find_latest_state()
+            self.assertEqual(mock_scandir.call_count, 2)